@@ -0,0 +1 @@
+"""Пакет для замеров производительности."""
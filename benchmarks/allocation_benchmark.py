@@ -0,0 +1,112 @@
+"""Замер выделений памяти для разделяемых Cell и Tile через tracemalloc.
+
+Запуск:
+    python -m benchmarks.allocation_benchmark --rounds 200
+"""
+
+import argparse
+import tracemalloc
+from typing import Callable, Dict, List
+
+from board.cell import Cell
+from board.tile import Tile
+from board.tile_kind import TileKind
+from board.board_factory import BoardFactory
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
+
+
+def measure_allocations(workload: Callable[[], object]) -> Dict[str, int]:
+    """Измерить память, выделенную нагрузкой.
+    
+    Args:
+        workload: Функция нагрузки; возвращённый объект удерживается до замера
+        
+    Returns:
+        Dict[str, int]: Число живых блоков, их размер и пиковая память в байтах
+    """
+    tracemalloc.start()
+    try:
+        before = tracemalloc.take_snapshot()
+        tracemalloc.reset_peak()
+        retained = workload()
+        after = tracemalloc.take_snapshot()
+        _, peak = tracemalloc.get_traced_memory()
+    finally:
+        tracemalloc.stop()
+    
+    stats = after.compare_to(before, 'filename')
+    blocks = sum(stat.count_diff for stat in stats if stat.count_diff > 0)
+    size = sum(stat.size_diff for stat in stats if stat.size_diff > 0)
+    del retained
+    return {'blocks': blocks, 'bytes': size, 'peak_bytes': peak}
+
+
+def _fresh_cells(rounds: int) -> List[Cell]:
+    """Создать ячейки конструктором, как до введения Cell.of()."""
+    return [Cell(row, col) for _ in range(rounds) for row in range(8) for col in range(8)]
+
+
+def _interned_cells(rounds: int) -> List[Cell]:
+    """Получить те же ячейки из разделяемой таблицы."""
+    return [Cell.of(row, col) for _ in range(rounds) for row in range(8) for col in range(8)]
+
+
+def _fresh_tiles(rounds: int) -> List[Tile]:
+    """Создать фишки конструктором, как до введения Tile.of()."""
+    return [Tile(kind) for _ in range(rounds * 13) for kind in TileKind.all()]
+
+
+def _interned_tiles(rounds: int) -> List[Tile]:
+    """Получить те же фишки из общих экземпляров."""
+    return [Tile.of(kind) for _ in range(rounds * 13) for kind in TileKind.all()]
+
+
+def _board_clones(rounds: int) -> list:
+    """Клонировать заполненную доску."""
+    board = BoardFactory.create_initial_board(RandomProviderDefault(1))
+    return [board.clone() for _ in range(rounds)]
+
+
+def _move_generation(rounds: int) -> list:
+    """Сгенерировать все ходы на доске без совпадений."""
+    board = BoardFactory.create_board_without_matches(RandomProviderDefault(1), MatchFinder())
+    generator = MoveGenerator()
+    return [generator.generate_all_moves(board) for _ in range(max(1, rounds // 20))]
+
+
+def run(rounds: int) -> Dict[str, Dict[str, int]]:
+    """Выполнить все сценарии замера.
+    
+    Args:
+        rounds: Число повторений каждого сценария
+        
+    Returns:
+        Dict[str, Dict[str, int]]: Результаты по сценариям
+    """
+    scenarios = {
+        'cells_fresh': lambda: _fresh_cells(rounds),
+        'cells_interned': lambda: _interned_cells(rounds),
+        'tiles_fresh': lambda: _fresh_tiles(rounds),
+        'tiles_interned': lambda: _interned_tiles(rounds),
+        'board_clone': lambda: _board_clones(rounds),
+        'move_generation': lambda: _move_generation(rounds),
+    }
+    return {name: measure_allocations(workload) for name, workload in scenarios.items()}
+
+
+def main() -> None:
+    """Точка входа замера."""
+    parser = argparse.ArgumentParser(description="Замер выделений памяти Cell/Tile")
+    parser.add_argument('--rounds', type=int, default=200, help="Число повторений")
+    args = parser.parse_args()
+    
+    results = run(args.rounds)
+    print(f"{'сценарий':<18}{'блоков':>10}{'байт':>12}{'пик, байт':>12}")
+    for name, result in results.items():
+        print(f"{name:<18}{result['blocks']:>10}{result['bytes']:>12}{result['peak_bytes']:>12}")
+
+
+if __name__ == "__main__":
+    main()
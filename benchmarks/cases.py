@@ -0,0 +1,169 @@
+"""Замеры горячих путей игры на фиксированных досках."""
+
+import time
+from typing import Callable, Dict, List
+
+from board.cell import Cell
+from board.bit_board import BitBoard
+from board.board_factory import BoardFactory
+from board.mutable_board import MutableBoard
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.run_length_match_finder import RunLengthMatchFinder
+from rules.swap_validator import SwapValidator
+from rules.move_generator import MoveGenerator
+from rules.pattern_move_generator import PatternMoveGenerator
+from rules.bitboard_match_finder import BitboardMatchFinder
+from rules.bitboard_move_generator import BitboardMoveGenerator
+from mechanics.gravity_engine import GravityEngine
+from control.game_controller import GameController
+from control.game_state_builder import GameStateBuilder
+
+
+# Seed досок, на которых выполняются все замеры
+BOARD_SEEDS = (1, 2, 3, 4, 5, 6, 7, 8)
+
+
+def stable_boards() -> List[MutableBoard]:
+    """Создать фиксированные доски без совпадений.
+    
+    Returns:
+        List[MutableBoard]: Доски для замеров
+    """
+    return [BoardFactory.create_board_without_matches(RandomProviderDefault(seed), MatchFinder())
+            for seed in BOARD_SEEDS]
+
+
+def boards_with_holes() -> List[MutableBoard]:
+    """Создать фиксированные доски с пустыми ячейками после удаления совпадения.
+    
+    Returns:
+        List[MutableBoard]: Доски для замеров гравитации
+    """
+    boards = []
+    for board in stable_boards():
+        for row in range(2, 5):
+            board.set_tile(Cell.of(row, 3), None)
+        for col in range(4, 7):
+            board.set_tile(Cell.of(6, col), None)
+        boards.append(board)
+    return boards
+
+
+def _timed(iterations: int, boards: list, call: Callable) -> float:
+    """Выполнить вызов на досках по кругу и вернуть затраченное время.
+    
+    Args:
+        iterations: Количество вызовов
+        boards: Подготовленные аргументы
+        call: Замеряемый вызов
+        
+    Returns:
+        float: Время в секундах
+    """
+    count = len(boards)
+    started = time.perf_counter()
+    for index in range(iterations):
+        call(boards[index % count])
+    return time.perf_counter() - started
+
+
+def bench_match_finder(iterations: int) -> float:
+    """Замер MatchFinder.find_matches."""
+    finder = MatchFinder()
+    return _timed(iterations, stable_boards(), finder.find_matches)
+
+
+def bench_run_length_match_finder(iterations: int) -> float:
+    """Замер RunLengthMatchFinder.find_matches."""
+    finder = RunLengthMatchFinder()
+    return _timed(iterations, stable_boards(), finder.find_matches)
+
+
+def bench_bitboard_match_finder(iterations: int) -> float:
+    """Замер BitboardMatchFinder.find_matches на битовых досках."""
+    finder = BitboardMatchFinder()
+    boards = [BitBoard.from_board(board) for board in stable_boards()]
+    return _timed(iterations, boards, finder.find_matches)
+
+
+def bench_swap_validator(iterations: int) -> float:
+    """Замер SwapValidator.is_valid_swap для первого хода каждой доски."""
+    validator = SwapValidator()
+    boards = [(board, MoveGenerator().generate_all_moves(board)[0]) for board in stable_boards()]
+    return _timed(iterations, boards, lambda item: validator.is_valid_swap(item[0], *item[1]))
+
+
+def bench_move_generator(iterations: int) -> float:
+    """Замер MoveGenerator.generate_all_moves."""
+    generator = MoveGenerator()
+    return _timed(iterations, stable_boards(), generator.generate_all_moves)
+
+
+def bench_pattern_move_generator(iterations: int) -> float:
+    """Замер PatternMoveGenerator.generate_all_moves."""
+    generator = PatternMoveGenerator()
+    return _timed(iterations, stable_boards(), generator.generate_all_moves)
+
+
+def bench_bitboard_move_generator(iterations: int) -> float:
+    """Замер BitboardMoveGenerator.generate_all_moves на битовых досках."""
+    generator = BitboardMoveGenerator()
+    boards = [BitBoard.from_board(board) for board in stable_boards()]
+    return _timed(iterations, boards, generator.generate_all_moves)
+
+
+def bench_gravity(iterations: int) -> float:
+    """Замер GravityEngine.apply_gravity и refill на копиях досок с пустотами."""
+    engine = GravityEngine()
+    random = RandomProviderDefault(0)
+    templates = boards_with_holes()
+    boards = [templates[index % len(templates)].clone() for index in range(iterations)]
+    
+    def step(board):
+        engine.apply_gravity(board)
+        engine.refill(board, random)
+    
+    return _timed(iterations, boards, step)
+
+
+def bench_board_clone(iterations: int) -> float:
+    """Замер MutableBoard.clone."""
+    return _timed(iterations, stable_boards(), lambda board: board.clone())
+
+
+def bench_board_factory(iterations: int) -> float:
+    """Замер BoardFactory.create_board_without_matches."""
+    finder = MatchFinder()
+    randoms = [RandomProviderDefault(seed) for seed in BOARD_SEEDS]
+    return _timed(iterations, randoms,
+                  lambda random: BoardFactory.create_board_without_matches(random, finder))
+
+
+def bench_perform_move(iterations: int) -> float:
+    """Замер GameController.perform_move с полным каскадом."""
+    from main import create_game_services
+    
+    services = create_game_services(0)
+    controller = GameController(services)
+    generator = MoveGenerator()
+    templates = [(board, generator.generate_all_moves(board)[0]) for board in stable_boards()]
+    states = [(GameStateBuilder().with_board(board.clone()).build(), move)
+              for board, move in (templates[index % len(templates)] for index in range(iterations))]
+    return _timed(iterations, states, lambda item: controller.perform_move(item[0], *item[1]))
+
+
+# Замеры: имя -> (функция, число вызовов за повтор)
+CASES: Dict[str, tuple] = {
+    'match_finder.find_matches': (bench_match_finder, 200),
+    'run_length_match_finder.find_matches': (bench_run_length_match_finder, 2000),
+    'bitboard_match_finder.find_matches': (bench_bitboard_match_finder, 2000),
+    'swap_validator.is_valid_swap': (bench_swap_validator, 200),
+    'move_generator.generate_all_moves': (bench_move_generator, 5),
+    'pattern_move_generator.generate_all_moves': (bench_pattern_move_generator, 200),
+    'bitboard_move_generator.generate_all_moves': (bench_bitboard_move_generator, 1000),
+    'gravity_engine.apply_gravity_refill': (bench_gravity, 500),
+    'mutable_board.clone': (bench_board_clone, 5000),
+    'board_factory.create_board_without_matches': (bench_board_factory, 50),
+    'game_controller.perform_move': (bench_perform_move, 50),
+}
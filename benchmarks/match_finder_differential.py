@@ -0,0 +1,89 @@
+"""Дифференциальная проверка RunLengthMatchFinder против MatchFinder.
+
+Запуск:
+    python -m benchmarks.match_finder_differential --boards 1000000
+"""
+
+import argparse
+import random
+import sys
+import time
+
+from board.cell import Cell
+from board.tile import Tile
+from board.tile_kind import TileKind
+from board.mutable_board import MutableBoard
+from board.compact_board import CompactBoard
+from rules.match_finder import MatchFinder
+from rules.run_length_match_finder import RunLengthMatchFinder
+
+
+def random_board(rng: random.Random) -> MutableBoard:
+    """Создать случайную доску с разным числом типов и пустыми ячейками.
+    
+    Args:
+        rng: Генератор случайных чисел
+        
+    Returns:
+        MutableBoard: Случайная доска
+    """
+    kinds = TileKind.all()[:rng.choice((2, 3, 4, 5))]
+    empty_share = rng.choice((0.0, 0.0, 0.0, 0.1))
+    board = MutableBoard()
+    for row in range(8):
+        for col in range(8):
+            if rng.random() >= empty_share:
+                board.set_tile(Cell.of(row, col), Tile.of(rng.choice(kinds)))
+    return board
+
+
+def check(boards: int, seed: int) -> int:
+    """Сравнить результаты поисковиков на случайных досках.
+    
+    Args:
+        boards: Количество досок
+        seed: Начальное значение генератора
+        
+    Returns:
+        int: Количество расхождений
+    """
+    rng = random.Random(seed)
+    reference = MatchFinder()
+    candidate = RunLengthMatchFinder()
+    mismatches = 0
+    reference_time = 0.0
+    candidate_time = 0.0
+    
+    for index in range(boards):
+        board = random_board(rng)
+        compact = CompactBoard.from_board(board)
+        
+        started = time.perf_counter()
+        expected = reference.find_matches(board)
+        reference_time += time.perf_counter() - started
+        
+        started = time.perf_counter()
+        actual = candidate.find_matches(compact)
+        candidate_time += time.perf_counter() - started
+        
+        if actual != expected:
+            mismatches += 1
+            print(f"Расхождение на доске #{index}: {expected} != {actual}")
+    
+    print(f"Досок: {boards}, расхождений: {mismatches}")
+    print(f"MatchFinder: {reference_time:.2f} с, RunLengthMatchFinder: {candidate_time:.2f} с")
+    return mismatches
+
+
+def main() -> None:
+    """Точка входа проверки."""
+    parser = argparse.ArgumentParser(description="Дифференциальная проверка поисковиков совпадений")
+    parser.add_argument('--boards', type=int, default=100000, help="Количество досок")
+    parser.add_argument('--seed', type=int, default=0, help="Начальное значение генератора")
+    args = parser.parse_args()
+    
+    sys.exit(1 if check(args.boards, args.seed) else 0)
+
+
+if __name__ == "__main__":
+    main()
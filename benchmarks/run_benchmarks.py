@@ -0,0 +1,114 @@
+"""Запуск замеров горячих путей со сравнением с сохранённой базой.
+
+Запуск:
+    python -m benchmarks.run_benchmarks --output results.json
+    python -m benchmarks.run_benchmarks --baseline baseline.json --threshold 0.25
+    python -m benchmarks.run_benchmarks --save-baseline baseline.json
+
+База не хранится в репозитории: её сохраняют на той же машине с исходного
+коммита, а затем сравнивают с ней замеры изменённого кода.
+"""
+
+import argparse
+import json
+import platform
+import statistics
+import sys
+from typing import Dict, List, Optional
+
+from .cases import CASES
+
+
+def run_cases(names: List[str], repeat: int, scale: float) -> Dict[str, Dict[str, float]]:
+    """Выполнить замеры.
+    
+    Args:
+        names: Имена замеров из CASES
+        repeat: Число повторов каждого замера
+        scale: Множитель числа вызовов за повтор
+        
+    Returns:
+        Dict[str, Dict[str, float]]: Медиана и минимум времени вызова в микросекундах
+    """
+    results = {}
+    for name in names:
+        bench, iterations = CASES[name]
+        iterations = max(1, int(iterations * scale))
+        timings = [bench(iterations) / iterations * 1e6 for _ in range(repeat)]
+        results[name] = {
+            'median_us': statistics.median(timings),
+            'min_us': min(timings),
+            'iterations': iterations,
+        }
+    return results
+
+
+def compare(results: Dict[str, Dict[str, float]], baseline: Dict[str, Dict[str, float]],
+            threshold: float) -> List[str]:
+    """Найти регрессии относительно базы.
+    
+    Args:
+        results: Текущие результаты
+        baseline: Сохранённые результаты
+        threshold: Допустимое относительное замедление (0.2 = 20%)
+        
+    Returns:
+        List[str]: Описания регрессий
+    """
+    regressions = []
+    for name, result in results.items():
+        if name not in baseline:
+            continue
+        before = baseline[name]['median_us']
+        after = result['median_us']
+        if after > before * (1 + threshold):
+            regressions.append(f"{name}: {before:.1f} мкс -> {after:.1f} мкс (+{(after / before - 1) * 100:.0f}%)")
+    return regressions
+
+
+def main(argv: Optional[List[str]] = None) -> int:
+    """Точка входа запуска замеров.
+    
+    Args:
+        argv: Аргументы командной строки
+        
+    Returns:
+        int: Код выхода (1 при регрессиях)
+    """
+    parser = argparse.ArgumentParser(description="Замеры горячих путей игры")
+    parser.add_argument('--only', nargs='*', choices=sorted(CASES), help="Выполнить только указанные замеры")
+    parser.add_argument('--repeat', type=int, default=5, help="Число повторов каждого замера")
+    parser.add_argument('--scale', type=float, default=1.0, help="Множитель числа вызовов")
+    parser.add_argument('--output', help="Файл для результатов в JSON")
+    parser.add_argument('--baseline', help="Файл базы для сравнения")
+    parser.add_argument('--threshold', type=float, default=0.2, help="Допустимое замедление относительно базы")
+    parser.add_argument('--save-baseline', help="Сохранить результаты как новую базу")
+    args = parser.parse_args(argv)
+    
+    results = run_cases(args.only or list(CASES), args.repeat, args.scale)
+    report = {'python': platform.python_version(), 'machine': platform.machine(), 'results': results}
+    
+    for name, result in results.items():
+        print(f"{name:<45}{result['median_us']:>12.1f} мкс{result['min_us']:>12.1f} мкс (мин)")
+    
+    for path in (args.output, args.save_baseline):
+        if path:
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump(report, file, ensure_ascii=False, indent=2)
+    
+    if args.baseline:
+        with open(args.baseline, encoding='utf-8') as file:
+            baseline = json.load(file)['results']
+        regressions = compare(results, baseline, args.threshold)
+        if regressions:
+            print("\nРегрессии производительности:")
+            for line in regressions:
+                print(f"  {line}")
+            return 1
+        print(f"\nРегрессий свыше {args.threshold * 100:.0f}% нет")
+    
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
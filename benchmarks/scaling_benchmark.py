@@ -0,0 +1,139 @@
+"""Замер роста стоимости движков правил с размером доски.
+
+Для каждого размера от 8x8 до max x max измеряется время одного вызова
+и время на ячейку. У линейного движка время на ячейку почти не растёт;
+рост в разы указывает на алгоритмическую ошибку. Рост считается от
+64x64: меньшие доски целиком попадают в таблицы разделяемых Cell и
+ключей Zobrist и поэтому дешевле на ячейку.
+
+Запуск:
+    python -m benchmarks.scaling_benchmark --max-size 1024
+    python -m benchmarks.scaling_benchmark --max-size 256 --engines match_finder gravity --threshold 3
+"""
+
+import argparse
+import sys
+import time
+from typing import Callable, Dict, List
+
+from board.board_factory import BoardFactory
+from board.cell import Cell
+from board.mutable_board import MutableBoard
+from mechanics.gravity_engine import GravityEngine
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
+from rules.pattern_move_generator import PatternMoveGenerator
+from rules.run_length_match_finder import RunLengthMatchFinder
+from rules.tiled_match_finder import TiledMatchFinder
+from rules.tiled_move_generator import TiledMoveGenerator
+
+
+def _holed(board: MutableBoard) -> MutableBoard:
+    """Очистить каждую седьмую ячейку, чтобы гравитации было что делать.
+    
+    Args:
+        board: Заполненная доска (изменяется на месте)
+    
+    Returns:
+        MutableBoard: Та же доска
+    """
+    width = board.width()
+    for index in range(0, width * board.height(), 7):
+        board.set_tile(Cell.of(index // width, index % width), None)
+    return board
+
+
+def _gravity(board: MutableBoard) -> None:
+    """Уронить и дозаполнить фишки на копии доски с пустыми ячейками."""
+    engine = GravityEngine()
+    target = board.clone()
+    engine.apply_gravity(target)
+    engine.refill(target, RandomProviderDefault(1))
+
+
+ENGINES: Dict[str, Callable[[MutableBoard], object]] = {
+    'match_finder': MatchFinder().find_matches,
+    'run_length_match_finder': RunLengthMatchFinder().find_matches,
+    'move_generator': MoveGenerator().generate_all_moves,
+    'pattern_move_generator': PatternMoveGenerator().generate_all_moves,
+    'tiled_match_finder': TiledMatchFinder().find_matches,
+    'tiled_move_generator': TiledMoveGenerator().generate_all_moves,
+    'gravity': _gravity,
+}
+
+
+def measure(engine: Callable[[MutableBoard], object], board: MutableBoard, min_seconds: float) -> float:
+    """Измерить время одного вызова движка.
+    
+    Args:
+        engine: Замеряемый вызов
+        board: Доска
+        min_seconds: Минимальное суммарное время замера
+    
+    Returns:
+        float: Лучшее время вызова в секундах
+    """
+    best = float('inf')
+    total = 0.0
+    while total < min_seconds or best == float('inf'):
+        started = time.perf_counter()
+        engine(board)
+        elapsed = time.perf_counter() - started
+        best = min(best, elapsed)
+        total += elapsed
+    return best
+
+
+def run(sizes: List[int], engines: List[str], min_seconds: float) -> Dict[str, Dict[int, float]]:
+    """Выполнить замеры для всех размеров.
+    
+    Args:
+        sizes: Стороны квадратных досок
+        engines: Имена движков из ENGINES
+        min_seconds: Минимальное время замера одного размера
+    
+    Returns:
+        Dict[str, Dict[int, float]]: Время на ячейку в наносекундах по движку и размеру
+    """
+    results: Dict[str, Dict[int, float]] = {name: {} for name in engines}
+    for size in sizes:
+        board = _holed(BoardFactory.create_initial_board(RandomProviderDefault(size), size, size))
+        for name in engines:
+            seconds = measure(ENGINES[name], board, min_seconds)
+            results[name][size] = seconds / (size * size) * 1e9
+    return results
+
+
+def main() -> None:
+    """Точка входа замера."""
+    parser = argparse.ArgumentParser(description="Масштабирование движков правил с размером доски")
+    parser.add_argument('--max-size', type=int, default=1024, help="Наибольшая сторона доски")
+    parser.add_argument('--engines', nargs='+', choices=sorted(ENGINES), default=sorted(ENGINES),
+                        help="Замеряемые движки")
+    parser.add_argument('--min-seconds', type=float, default=0.2, help="Минимальное время замера размера")
+    parser.add_argument('--threshold', type=float, default=None,
+                        help="Ошибка, если время на ячейку выросло больше чем во столько раз")
+    args = parser.parse_args()
+    
+    sizes = []
+    size = 8
+    while size <= args.max_size:
+        sizes.append(size)
+        size *= 2
+    
+    results = run(sizes, args.engines, args.min_seconds)
+    print(f"{'движок':<26}" + ''.join(f"{f'{size}x{size}':>12}" for size in sizes) + f"{'рост':>8}")
+    failed = False
+    base = 64 if 64 in sizes else sizes[0]
+    for name, per_cell in results.items():
+        growth = per_cell[sizes[-1]] / per_cell[base]
+        failed |= args.threshold is not None and growth > args.threshold
+        print(f"{name:<26}" + ''.join(f"{per_cell[size]:>10.0f}ns" for size in sizes) + f"{growth:>7.2f}x")
+    
+    if failed:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
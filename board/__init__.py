@@ -5,6 +5,8 @@ from .tile import Tile
 from .cell import Cell
 from .board import Board
 from .mutable_board import MutableBoard
+from .compact_board import CompactBoard
+from .bit_board import BitBoard
 from .board_factory import BoardFactory
 
 __all__ = [
@@ -13,5 +15,7 @@ __all__ = [
     'Cell',
     'Board',
     'MutableBoard',
+    'CompactBoard',
+    'BitBoard',
     'BoardFactory'
 ]
@@ -0,0 +1,318 @@
+"""Реализация игровой доски на битовых масках по типам фишек."""
+
+from typing import Iterable, List, Optional
+
+from .board import Board
+from .tile import Tile
+from .cell import Cell
+from .tile_kind import TileKind, EMPTY_CODE
+
+
+# Количество типов фишек; маска типа с кодом k хранится по индексу k
+_KIND_COUNT = len(TileKind.all())
+
+
+class BitBoard(Board):
+    """Игровая доска, хранящая по одной битовой маске на тип фишки.
+    
+    Ячейка (row, col) соответствует биту row * width + col, поэтому доска
+    8x8 укладывается в пять 64-битных чисел. Поиск серий и ходов сводится
+    к сдвигам и побитовым операциям над масками.
+    """
+    
+    def __init__(self, width: int = 8, height: int = 8):
+        """Создать пустую доску.
+        
+        Args:
+            width: Ширина доски
+            height: Высота доски
+        """
+        self._width = width
+        self._height = height
+        self._masks = [0] * (_KIND_COUNT + 1)
+        self._version = 0
+        
+        self._full_mask = (1 << (width * height)) - 1
+        row_bits = (1 << width) - 1
+        # Маски столбцов [0, stop) и [start, width) для сдвигов без переноса строк
+        self._columns_below = [self._repeat_rows((1 << stop) - 1) for stop in range(width + 1)]
+        self._columns_from = [self._repeat_rows(row_bits & ~((1 << start) - 1))
+                              for start in range(width + 1)]
+    
+    @classmethod
+    def from_board(cls, board: Board) -> 'BitBoard':
+        """Создать битовую копию произвольной доски.
+        
+        Args:
+            board: Исходная доска
+        
+        Returns:
+            BitBoard: Доска с теми же фишками
+        """
+        bit_board = cls(board.width(), board.height())
+        bit_board._masks = BitBoard.masks_of(board)
+        return bit_board
+    
+    @staticmethod
+    def masks_of(board: Board) -> List[int]:
+        """Получить маски типов фишек доски.
+        
+        Args:
+            board: Доска для чтения
+        
+        Returns:
+            List[int]: Маски по кодам фишек (индекс 0 не используется);
+                для BitBoard возвращается копия собственных масок
+        """
+        if isinstance(board, BitBoard):
+            return board._masks[:]
+        
+        masks = [0] * (_KIND_COUNT + 1)
+        width = board.width()
+        for row in range(board.height()):
+            for col in range(width):
+                tile = board.tile_at(Cell.of(row, col))
+                if tile is not None:
+                    masks[tile.kind().code()] |= 1 << (row * width + col)
+        return masks
+    
+    def width(self) -> int:
+        """Получить ширину доски.
+        
+        Returns:
+            int: Ширина доски
+        """
+        return self._width
+    
+    def height(self) -> int:
+        """Получить высоту доски.
+        
+        Returns:
+            int: Высота доски
+        """
+        return self._height
+    
+    def tile_at(self, cell: Cell) -> Optional[Tile]:
+        """Получить фишку в указанной ячейке.
+        
+        Args:
+            cell: Ячейка для проверки
+        
+        Returns:
+            Optional[Tile]: Фишка в ячейке или None
+        """
+        if not self.is_inside(cell):
+            return None
+        code = self.code_at(cell.row() * self._width + cell.col())
+        if code == EMPTY_CODE:
+            return None
+        return Tile.of(TileKind.from_code(code))
+    
+    def enumerate_cells(self) -> Iterable[Cell]:
+        """Перечислить все ячейки доски.
+        
+        Returns:
+            Iterable[Cell]: Все ячейки доски
+        """
+        for row in range(self._height):
+            for col in range(self._width):
+                yield Cell.of(row, col)
+    
+    def version(self) -> int:
+        """Получить номер версии содержимого доски.
+        
+        Returns:
+            int: Номер, увеличивающийся при каждом изменении доски
+        """
+        return self._version
+    
+    def clone(self) -> 'BitBoard':
+        """Создать копию доски копированием масок.
+        
+        Returns:
+            BitBoard: Независимая копия доски
+        """
+        clone = BitBoard.__new__(BitBoard)
+        clone.__dict__.update(self.__dict__)
+        clone._masks = self._masks[:]
+        clone._version = 0
+        return clone
+    
+    def set_tile(self, cell: Cell, tile: Optional[Tile]) -> None:
+        """Установить фишку в ячейку.
+        
+        Args:
+            cell: Ячейка для установки
+            tile: Фишка для установки (None для очистки)
+        
+        Raises:
+            ValueError: Если ячейка вне доски
+        """
+        if not self.is_inside(cell):
+            raise ValueError(f"Ячейка {cell} вне доски")
+        
+        code = EMPTY_CODE if tile is None else tile.kind().code()
+        self.set_code(cell.row() * self._width + cell.col(), code)
+    
+    def swap(self, a: Cell, b: Cell) -> None:
+        """Обменять содержимое двух ячеек.
+        
+        Args:
+            a: Первая ячейка
+            b: Вторая ячейка
+        
+        Raises:
+            ValueError: Если ячейки не соседние или вне доски
+        """
+        if not self.is_inside(a) or not self.is_inside(b):
+            raise ValueError("Ячейки должны быть внутри доски")
+        
+        if not a.is_adjacent(b):
+            raise ValueError("Ячейки должны быть соседними")
+        
+        index_a = a.row() * self._width + a.col()
+        index_b = b.row() * self._width + b.col()
+        code_a = self.code_at(index_a)
+        code_b = self.code_at(index_b)
+        
+        self.set_code(index_a, code_b)
+        self.set_code(index_b, code_a)
+    
+    def fill_empty(self, random) -> None:
+        """Заполнить пустые ячейки новыми фишками.
+        
+        Args:
+            random: Поставщик случайных фишек
+        """
+        empty = self.empty_mask()
+        drawn = bytearray(empty.bit_count())
+        random.fill_codes(drawn)
+        for code in drawn:
+            low = empty & -empty
+            self._masks[code] |= low
+            empty ^= low
+        self._version += 1
+    
+    def code_at(self, index: int) -> int:
+        """Получить код фишки по индексу бита.
+        
+        Args:
+            index: Индекс ячейки row * width + col
+        
+        Returns:
+            int: Код фишки (0 для пустой ячейки)
+        """
+        bit = 1 << index
+        for code in range(1, _KIND_COUNT + 1):
+            if self._masks[code] & bit:
+                return code
+        return EMPTY_CODE
+    
+    def set_code(self, index: int, code: int) -> None:
+        """Установить код фишки по индексу бита.
+        
+        Args:
+            index: Индекс ячейки row * width + col
+            code: Код фишки (0 для очистки)
+        """
+        bit = 1 << index
+        masks = self._masks
+        for kind_code in range(1, _KIND_COUNT + 1):
+            masks[kind_code] &= ~bit
+        if code != EMPTY_CODE:
+            masks[code] |= bit
+        self._version += 1
+    
+    def mask_of(self, code: int) -> int:
+        """Получить маску ячеек с фишками заданного типа.
+        
+        Args:
+            code: Код фишки (1-5)
+        
+        Returns:
+            int: Битовая маска
+        """
+        return self._masks[code]
+    
+    def occupied_mask(self) -> int:
+        """Получить маску занятых ячеек.
+        
+        Returns:
+            int: Битовая маска непустых ячеек
+        """
+        occupied = 0
+        for code in range(1, _KIND_COUNT + 1):
+            occupied |= self._masks[code]
+        return occupied
+    
+    def empty_mask(self) -> int:
+        """Получить маску пустых ячеек.
+        
+        Returns:
+            int: Битовая маска пустых ячеек
+        """
+        return self._full_mask & ~self.occupied_mask()
+    
+    def full_mask(self) -> int:
+        """Получить маску всех ячеек доски.
+        
+        Returns:
+            int: Битовая маска из width * height единиц
+        """
+        return self._full_mask
+    
+    def clear_cells(self, mask: int) -> int:
+        """Удалить фишки из ячеек маски.
+        
+        Args:
+            mask: Битовая маска ячеек для очистки
+        
+        Returns:
+            int: Количество удалённых фишек
+        """
+        removed = (mask & self.occupied_mask()).bit_count()
+        keep = ~mask
+        for code in range(1, _KIND_COUNT + 1):
+            self._masks[code] &= keep
+        self._version += 1
+        return removed
+    
+    def shifted(self, mask: int, dr: int, dc: int) -> int:
+        """Сдвинуть маску так, чтобы бит ячейки p отражал ячейку p + (dr, dc).
+        
+        Args:
+            mask: Исходная маска
+            dr: Смещение по строке
+            dc: Смещение по столбцу
+        
+        Returns:
+            int: Маска, в которой бит (row, col) равен биту (row + dr, col + dc)
+                исходной маски, или 0 за пределами доски
+        """
+        # Сдвиг на ширину доски и больше выводит все ячейки за её пределы
+        if abs(dc) >= self._width:
+            return 0
+        if dc > 0:
+            mask = (mask >> dc) & self._columns_below[self._width - dc]
+        elif dc < 0:
+            mask = (mask << -dc) & self._columns_from[-dc]
+        
+        if dr > 0:
+            mask >>= dr * self._width
+        elif dr < 0:
+            mask = (mask << (-dr * self._width)) & self._full_mask
+        return mask
+    
+    def _repeat_rows(self, row_bits: int) -> int:
+        """Повторить маску одной строки во всех строках доски.
+        
+        Args:
+            row_bits: Маска строки из width бит
+        
+        Returns:
+            int: Маска доски
+        """
+        mask = 0
+        for row in range(self._height):
+            mask |= row_bits << (row * self._width)
+        return mask
@@ -5,6 +5,7 @@ from typing import Optional, Iterable
 
 from .tile import Tile
 from .cell import Cell
+from .zobrist import compute_zobrist_hash
 
 
 class Board(ABC):
@@ -52,6 +53,27 @@ class Board(ABC):
         return (0 <= cell.row() < self.height() and 
                 0 <= cell.col() < self.width())
     
+    def version(self) -> Optional[int]:
+        """Получить номер версии содержимого доски.
+        
+        Returns:
+            Optional[int]: Номер, меняющийся при каждом изменении доски,
+            или None если доска не отслеживает изменения
+        """
+        return None
+    
+    def zobrist_hash(self) -> int:
+        """Получить хеш Zobrist содержимого доски.
+        
+        Returns:
+            int: 64-битный хеш, одинаковый для досок с одинаковыми фишками
+            
+        Note:
+            Реализация по умолчанию вычисляет хеш с нуля; изменяемые доски
+            могут поддерживать его инкрементально
+        """
+        return compute_zobrist_hash(self)
+    
     @abstractmethod
     def enumerate_cells(self) -> Iterable[Cell]:
         """Перечислить все ячейки доски.
@@ -2,41 +2,52 @@
 
 from .board import Board
 from .mutable_board import MutableBoard
+from .cell import Cell
+from .tile import Tile
+from .tile_kind import TileKind
 
 
 class BoardFactory:
     """Фабрика для создания различных типов досок."""
     
     @staticmethod
-    def create_empty_board() -> MutableBoard:
-        """Создать пустую доску 8x8.
+    def create_empty_board(width: int = 8, height: int = 8) -> MutableBoard:
+        """Создать пустую доску.
         
+        Args:
+            width: Ширина доски
+            height: Высота доски
+            
         Returns:
             MutableBoard: Пустая доска с None во всех ячейках
         """
-        return MutableBoard()
+        return MutableBoard(width, height)
     
     @staticmethod
-    def create_initial_board(random) -> MutableBoard:
+    def create_initial_board(random, width: int = 8, height: int = 8) -> MutableBoard:
         """Создать доску с случайными фишками.
         
         Args:
             random: Источник случайных значений
+            width: Ширина доски
+            height: Высота доски
             
         Returns:
             MutableBoard: Доска, заполненная случайными фишками A-E
         """
-        board = MutableBoard()
+        board = MutableBoard(width, height)
         board.fill_empty(random)
         return board
     
     @staticmethod
-    def create_board_without_matches(random, match_finder) -> MutableBoard:
+    def create_board_without_matches(random, match_finder, width: int = 8, height: int = 8) -> MutableBoard:
         """Создать доску без начальных совпадений.
         
         Args:
             random: Источник случайных значений
             match_finder: Поисковик совпадений
+            width: Ширина доски
+            height: Высота доски
             
         Returns:
             MutableBoard: Доска без совпадений ≥3 в ряд
@@ -47,11 +58,75 @@ class BoardFactory:
         max_attempts = 100
         
         for attempt in range(max_attempts):
-            board = BoardFactory.create_initial_board(random)
+            board = BoardFactory.create_initial_board(random, width, height)
             matches = match_finder.find_matches(board)
             
             if len(matches) == 0:
                 return board
         
-        # Если не удалось создать доску без совпадений, возвращаем последнюю попытку
+        # Если выборка не удалась, строим доску без совпадений напрямую
+        return BoardFactory.create_board_constructive(random, width=width, height=height)
+    
+    @staticmethod
+    def create_board_constructive(random, move_generator=None, width: int = 8, height: int = 8) -> MutableBoard:
+        """Создать доску без совпадений за один проход.
+        
+        Args:
+            random: Источник случайных значений
+            move_generator: Генератор ходов; если задан, доска гарантированно
+                имеет хотя бы один ход
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            MutableBoard: Доска без совпадений ≥3 в ряд
+            
+        Raises:
+            ValueError: Если за max_attempts попыток не получилась доска
+                с ходом (например, ход на доске такого размера невозможен)
+            
+        Note:
+            Ячейки заполняются в порядке обхода строк; для каждой исключаются
+            типы, которые составили бы тройку с двумя ячейками слева или сверху
+        """
+        max_attempts = 1000
+        
+        for attempt in range(max_attempts):
+            board = BoardFactory._fill_without_triples(random, width, height)
+            
+            # Доска без ходов редка, поэтому её просто строим заново
+            if move_generator is None or move_generator.has_available_moves(board):
+                return board
+        
+        raise ValueError(f"Не удалось построить доску {width}x{height} с доступным ходом "
+                         f"за {max_attempts} попыток")
+    
+    @staticmethod
+    def _fill_without_triples(random, width: int = 8, height: int = 8) -> MutableBoard:
+        """Заполнить доску, не допуская троек по горизонтали и вертикали.
+        
+        Args:
+            random: Источник случайных значений
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            MutableBoard: Заполненная доска
+        """
+        board = MutableBoard(width, height)
+        kinds = TileKind.all()
+        grid = [[None] * board.width() for _ in range(board.height())]
+        
+        for row in range(board.height()):
+            for col in range(board.width()):
+                excluded = set()
+                if col >= 2 and grid[row][col - 1] == grid[row][col - 2]:
+                    excluded.add(grid[row][col - 1])
+                if row >= 2 and grid[row - 1][col] == grid[row - 2][col]:
+                    excluded.add(grid[row - 1][col])
+                
+                kind = random.next_tile_kind_from([kind for kind in kinds if kind not in excluded])
+                grid[row][col] = kind
+                board.set_tile(Cell.of(row, col), Tile.of(kind))
+        
         return board
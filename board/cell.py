@@ -3,18 +3,68 @@
 from typing import Tuple
 
 
+# Размер заранее построенной таблицы разделяемых ячеек
+_GRID_SIZE = 8
+
+
 class Cell:
-    """Ячейка на игровой доске."""
+    """Ячейка на игровой доске.
+    
+    Ячейки неизменяемы, поэтому экземпляры из Cell.of() разделяются
+    между всеми пользователями.
+    """
+    
+    __slots__ = ('_row', '_col', '_hash')
     
     def __init__(self, row: int, col: int):
         """Создать ячейку.
         
         Args:
-            row: Номер строки (0-7)
-            col: Номер столбца (0-7)
+            row: Номер строки
+            col: Номер столбца
+        """
+        object.__setattr__(self, '_row', row)
+        object.__setattr__(self, '_col', col)
+        object.__setattr__(self, '_hash', hash((row, col)))
+    
+    @classmethod
+    def of(cls, row: int, col: int) -> 'Cell':
+        """Получить разделяемую ячейку без создания нового объекта.
+        
+        Args:
+            row: Номер строки
+            col: Номер столбца
+            
+        Returns:
+            Cell: Экземпляр из таблицы для координат 0-7, иначе новая ячейка
+        """
+        if 0 <= row < _GRID_SIZE and 0 <= col < _GRID_SIZE:
+            return _GRID[row * _GRID_SIZE + col]
+        return cls(row, col)
+    
+    def __setattr__(self, name, value) -> None:
+        """Запретить изменение ячейки.
+        
+        Raises:
+            AttributeError: Всегда, ячейка неизменяема
+        """
+        raise AttributeError("Ячейка неизменяема")
+    
+    def __delattr__(self, name) -> None:
+        """Запретить удаление атрибутов ячейки.
+        
+        Raises:
+            AttributeError: Всегда, ячейка неизменяема
+        """
+        raise AttributeError("Ячейка неизменяема")
+    
+    def __reduce__(self):
+        """Сериализовать ячейку через разделяемую таблицу.
+        
+        Returns:
+            tuple: Фабрика и аргументы для восстановления
         """
-        self._row = row
-        self._col = col
+        return (Cell.of, (self._row, self._col))
     
     def row(self) -> int:
         """Получить номер строки.
@@ -32,13 +82,17 @@ class Cell:
         """
         return self._col
     
-    def is_valid(self) -> bool:
+    def is_valid(self, width: int = 8, height: int = 8) -> bool:
         """Проверить, находятся ли координаты в допустимом диапазоне.
         
+        Args:
+            width: Ширина доски
+            height: Высота доски
+            
         Returns:
-            bool: True если координаты валидны (0-7)
+            bool: True если 0 <= row < height и 0 <= col < width
         """
-        return 0 <= self._row < 8 and 0 <= self._col < 8
+        return 0 <= self._row < height and 0 <= self._col < width
     
     def is_adjacent(self, other: 'Cell') -> bool:
         """Проверить, является ли ячейка соседней.
@@ -77,7 +131,7 @@ class Cell:
         Returns:
             int: Хеш ячейки
         """
-        return hash((self._row, self._col))
+        return self._hash
     
     def __str__(self) -> str:
         """Строковое представление ячейки.
@@ -94,3 +148,6 @@ class Cell:
             str: Отладочное представление
         """
         return f"Cell({self._row}, {self._col})"
+
+
+_GRID = tuple(Cell(row, col) for row in range(_GRID_SIZE) for col in range(_GRID_SIZE))
@@ -0,0 +1,229 @@
+"""Компактная реализация игровой доски на плоском буфере кодов."""
+
+from typing import Optional, Iterable
+
+from .board import Board
+from .tile import Tile
+from .cell import Cell
+from .tile_kind import TileKind, EMPTY_CODE
+
+
+class CompactBoard(Board):
+    """Игровая доска, хранящая коды фишек в плоском bytearray.
+    
+    Ячейка (row, col) хранится по индексу row * width + col.
+    Код 0 означает пустую ячейку, коды 1-5 соответствуют TileKind.
+    """
+    
+    def __init__(self, width: int = 8, height: int = 8):
+        """Создать пустую доску.
+        
+        Args:
+            width: Ширина доски
+            height: Высота доски
+        """
+        self._width = width
+        self._height = height
+        self._codes = bytearray(width * height)
+        self._version = 0
+    
+    @classmethod
+    def from_board(cls, board: Board) -> 'CompactBoard':
+        """Создать компактную копию произвольной доски.
+        
+        Args:
+            board: Исходная доска
+            
+        Returns:
+            CompactBoard: Доска с теми же фишками
+        """
+        compact = cls(board.width(), board.height())
+        compact._codes[:] = CompactBoard.codes_of(board)
+        return compact
+    
+    @staticmethod
+    def codes_of(board: Board) -> bytearray:
+        """Получить коды фишек доски в порядке строк.
+        
+        Args:
+            board: Доска для чтения
+            
+        Returns:
+            bytearray: Буфер самой доски для CompactBoard, иначе новая копия
+        """
+        if isinstance(board, CompactBoard):
+            return board._codes
+        
+        codes = bytearray(board.width() * board.height())
+        index = 0
+        for row in range(board.height()):
+            for col in range(board.width()):
+                tile = board.tile_at(Cell.of(row, col))
+                if tile is not None:
+                    codes[index] = tile.kind().code()
+                index += 1
+        return codes
+    
+    def width(self) -> int:
+        """Получить ширину доски.
+        
+        Returns:
+            int: Ширина доски
+        """
+        return self._width
+    
+    def height(self) -> int:
+        """Получить высоту доски.
+        
+        Returns:
+            int: Высота доски
+        """
+        return self._height
+    
+    def tile_at(self, cell: Cell) -> Optional[Tile]:
+        """Получить фишку в указанной ячейке.
+        
+        Args:
+            cell: Ячейка для проверки
+            
+        Returns:
+            Optional[Tile]: Фишка в ячейке или None
+        """
+        if not self.is_inside(cell):
+            return None
+        code = self._codes[cell.row() * self._width + cell.col()]
+        if code == EMPTY_CODE:
+            return None
+        return Tile.of(TileKind.from_code(code))
+    
+    def enumerate_cells(self) -> Iterable[Cell]:
+        """Перечислить все ячейки доски.
+        
+        Returns:
+            Iterable[Cell]: Все ячейки доски
+        """
+        for row in range(self._height):
+            for col in range(self._width):
+                yield Cell.of(row, col)
+    
+    def clone(self) -> 'CompactBoard':
+        """Создать копию доски одним копированием буфера.
+        
+        Returns:
+            CompactBoard: Независимая копия доски
+        """
+        clone = CompactBoard.__new__(CompactBoard)
+        clone._width = self._width
+        clone._height = self._height
+        clone._codes = self._codes[:]
+        clone._version = 0
+        return clone
+    
+    def set_tile(self, cell: Cell, tile: Optional[Tile]) -> None:
+        """Установить фишку в ячейку.
+        
+        Args:
+            cell: Ячейка для установки
+            tile: Фишка для установки (None для очистки)
+            
+        Raises:
+            ValueError: Если ячейка вне доски
+        """
+        if not self.is_inside(cell):
+            raise ValueError(f"Ячейка {cell} вне доски")
+        
+        code = EMPTY_CODE if tile is None else tile.kind().code()
+        self._codes[cell.row() * self._width + cell.col()] = code
+        self._version += 1
+    
+    def swap(self, a: Cell, b: Cell) -> None:
+        """Обменять содержимое двух ячеек.
+        
+        Args:
+            a: Первая ячейка
+            b: Вторая ячейка
+            
+        Raises:
+            ValueError: Если ячейки не соседние или вне доски
+        """
+        if not self.is_inside(a) or not self.is_inside(b):
+            raise ValueError("Ячейки должны быть внутри доски")
+        
+        if not a.is_adjacent(b):
+            raise ValueError("Ячейки должны быть соседними")
+        
+        index_a = a.row() * self._width + a.col()
+        index_b = b.row() * self._width + b.col()
+        codes = self._codes
+        codes[index_a], codes[index_b] = codes[index_b], codes[index_a]
+        self._version += 1
+    
+    def fill_empty(self, random) -> None:
+        """Заполнить пустые ячейки новыми фишками.
+        
+        Args:
+            random: Поставщик случайных фишек
+        """
+        codes = self._codes
+        empty = [index for index, code in enumerate(codes) if code == EMPTY_CODE]
+        drawn = bytearray(len(empty))
+        random.fill_codes(drawn)
+        for index, code in zip(empty, drawn):
+            codes[index] = code
+        self._version += 1
+    
+    def index_of(self, row: int, col: int) -> int:
+        """Получить индекс ячейки в плоском буфере.
+        
+        Args:
+            row: Номер строки
+            col: Номер столбца
+            
+        Returns:
+            int: Индекс row * width + col
+        """
+        return row * self._width + col
+    
+    def code_at(self, index: int) -> int:
+        """Получить код фишки по индексу без создания объектов.
+        
+        Args:
+            index: Индекс ячейки в буфере
+            
+        Returns:
+            int: Код фишки (0 для пустой ячейки)
+        """
+        return self._codes[index]
+    
+    def set_code(self, index: int, code: int) -> None:
+        """Установить код фишки по индексу без создания объектов.
+        
+        Args:
+            index: Индекс ячейки в буфере
+            code: Код фишки (0 для очистки)
+        """
+        self._codes[index] = code
+        self._version += 1
+    
+    def codes(self) -> bytearray:
+        """Получить буфер кодов доски.
+        
+        Returns:
+            bytearray: Собственный буфер доски (изменения видны доске)
+            
+        Note:
+            После прямой записи в буфер нужно вызвать mark_modified()
+        """
+        return self._codes
+    
+    def version(self) -> int:
+        """Получить номер версии содержимого доски.
+        
+        Returns:
+            int: Номер, увеличивающийся при каждом изменении доски
+        """
+        return self._version
+    
+    def mark_modified(self) -> None:
+        """Отметить изменение доски после прямой записи в буфер кодов."""
+        self._version += 1
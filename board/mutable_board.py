@@ -5,32 +5,57 @@ from typing import List, Optional, Iterable
 from .board import Board
 from .tile import Tile
 from .cell import Cell
+from .zobrist import TABLE_CELL_LIMIT, zobrist_key, zobrist_keys
 
 
 class MutableBoard(Board):
-    """Изменяемая игровая доска 8x8."""
+    """Изменяемая игровая доска (по умолчанию 8x8).
     
-    def __init__(self):
-        """Создать пустую доску 8x8."""
+    Копии разделяют строки с исходной доской до первой записи:
+    строка копируется, только когда одна из досок меняет её ячейку.
+    """
+    
+    def __init__(self, width: int = 8, height: int = 8):
+        """Создать пустую доску.
+        
+        Args:
+            width: Ширина доски
+            height: Высота доски
+            
+        Raises:
+            ValueError: Если размер не положителен
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("Размер доски должен быть положительным")
+        self._width = width
+        self._height = height
         self._tiles: List[List[Optional[Tile]]] = [
-            [None for _ in range(8)] for _ in range(8)
+            [None for _ in range(width)] for _ in range(height)
         ]
+        # Отметки строк, которыми доска владеет единолично
+        self._owned_rows = [True] * height
+        # Ключи Zobrist по индексу row * width + col; у больших досок
+        # ключи вычисляются при записи, а не хранятся таблицей
+        cell_count = width * height
+        self._keys = zobrist_keys(cell_count) if cell_count <= TABLE_CELL_LIMIT else None
+        self._version = 0
+        self._hash = 0
     
     def width(self) -> int:
         """Получить ширину доски.
         
         Returns:
-            int: Ширина доски (всегда 8)
+            int: Ширина доски
         """
-        return 8
+        return self._width
     
     def height(self) -> int:
         """Получить высоту доски.
         
         Returns:
-            int: Высота доски (всегда 8)
+            int: Высота доски
         """
-        return 8
+        return self._height
     
     def tile_at(self, cell: Cell) -> Optional[Tile]:
         """Получить фишку в указанной ячейке.
@@ -41,9 +66,10 @@ class MutableBoard(Board):
         Returns:
             Optional[Tile]: Фишка в ячейке или None
         """
-        if not self.is_inside(cell):
+        row, col = cell.row(), cell.col()
+        if not (0 <= row < self._height and 0 <= col < self._width):
             return None
-        return self._tiles[cell.row()][cell.col()]
+        return self._tiles[row][col]
     
     def enumerate_cells(self) -> Iterable[Cell]:
         """Перечислить все ячейки доски.
@@ -51,23 +77,58 @@ class MutableBoard(Board):
         Returns:
             Iterable[Cell]: Все ячейки доски
         """
-        for row in range(8):
-            for col in range(8):
-                yield Cell(row, col)
+        for row in range(self._height):
+            for col in range(self._width):
+                yield Cell.of(row, col)
+    
+    def version(self) -> int:
+        """Получить номер версии содержимого доски.
+        
+        Returns:
+            int: Номер, увеличивающийся при каждом изменении ячейки
+        """
+        return self._version
+    
+    def zobrist_hash(self) -> int:
+        """Получить хеш Zobrist содержимого доски.
+        
+        Returns:
+            int: 64-битный хеш, поддерживаемый за O(1) при каждом изменении
+        """
+        return self._hash
     
     def clone(self) -> 'MutableBoard':
-        """Создать копию доски.
+        """Создать копию доски с копированием строк при записи.
         
         Returns:
             MutableBoard: Независимая копия доски
+            
+        Note:
+            Обе доски теряют владение строками, поэтому первая запись
+            в строку любой из них копирует только эту строку
         """
-        clone = MutableBoard()
-        for cell in self.enumerate_cells():
-            tile = self.tile_at(cell)
-            if tile is not None:
-                clone.set_tile(cell, Tile(tile.kind()))
+        clone = MutableBoard.__new__(MutableBoard)
+        clone._width = self._width
+        clone._height = self._height
+        clone._tiles = self._tiles[:]
+        clone._owned_rows = [False] * self._height
+        clone._keys = self._keys
+        clone._version = 0
+        clone._hash = self._hash
+        self._owned_rows = [False] * self._height
         return clone
     
+    def shared_rows(self, other: 'MutableBoard') -> int:
+        """Посчитать строки, хранящиеся общими с другой доской.
+        
+        Args:
+            other: Другая доска
+            
+        Returns:
+            int: Количество строк, разделяемых без копирования
+        """
+        return sum(1 for mine, theirs in zip(self._tiles, other._tiles) if mine is theirs)
+    
     def set_tile(self, cell: Cell, tile: Optional[Tile]) -> None:
         """Установить фишку в ячейку.
         
@@ -78,10 +139,30 @@ class MutableBoard(Board):
         Raises:
             ValueError: Если ячейка вне доски
         """
-        if not self.is_inside(cell):
+        row, col = cell.row(), cell.col()
+        if not (0 <= row < self._height and 0 <= col < self._width):
             raise ValueError(f"Ячейка {cell} вне доски")
         
-        self._tiles[cell.row()][cell.col()] = tile
+        if not self._owned_rows[row]:
+            self._tiles[row] = self._tiles[row][:]
+            self._owned_rows[row] = True
+        
+        old_tile = self._tiles[row][col]
+        if self._keys is not None:
+            keys = self._keys[row * self._width + col]
+            if old_tile is not None:
+                self._hash ^= keys[old_tile.code()]
+            if tile is not None:
+                self._hash ^= keys[tile.code()]
+        else:
+            index = row * self._width + col
+            if old_tile is not None:
+                self._hash ^= zobrist_key(index, old_tile.code())
+            if tile is not None:
+                self._hash ^= zobrist_key(index, tile.code())
+        
+        self._tiles[row][col] = tile
+        self._version += 1
     
     def swap(self, a: Cell, b: Cell) -> None:
         """Обменять содержимое двух ячеек.
@@ -111,7 +192,6 @@ class MutableBoard(Board):
         Args:
             random: Поставщик случайных фишек
         """
-        for cell in self.enumerate_cells():
-            if self.tile_at(cell) is None:
-                tile_kind = random.next_tile_kind()
-                self.set_tile(cell, Tile(tile_kind))
+        empty = [cell for cell in self.enumerate_cells() if self.tile_at(cell) is None]
+        for cell, tile_kind in zip(empty, random.next_tile_kinds(len(empty))):
+            self.set_tile(cell, Tile.of(tile_kind))
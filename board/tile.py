@@ -4,7 +4,13 @@ from .tile_kind import TileKind
 
 
 class Tile:
-    """Фишка на игровой доске."""
+    """Фишка на игровой доске.
+    
+    Фишки неизменяемы, поэтому Tile.of() возвращает один общий
+    экземпляр на каждый TileKind.
+    """
+    
+    __slots__ = ('_kind', '_code')
     
     def __init__(self, kind: TileKind):
         """Создать фишку.
@@ -12,7 +18,44 @@ class Tile:
         Args:
             kind: Тип фишки
         """
-        self._kind = kind
+        object.__setattr__(self, '_kind', kind)
+        object.__setattr__(self, '_code', kind.code())
+    
+    @staticmethod
+    def of(kind: TileKind) -> 'Tile':
+        """Получить общий экземпляр фишки для типа.
+        
+        Args:
+            kind: Тип фишки
+            
+        Returns:
+            Tile: Разделяемая фишка указанного типа
+        """
+        return _SHARED_TILES[kind]
+    
+    def __setattr__(self, name, value) -> None:
+        """Запретить изменение фишки.
+        
+        Raises:
+            AttributeError: Всегда, фишка неизменяема
+        """
+        raise AttributeError("Фишка неизменяема")
+    
+    def __delattr__(self, name) -> None:
+        """Запретить удаление атрибутов фишки.
+        
+        Raises:
+            AttributeError: Всегда, фишка неизменяема
+        """
+        raise AttributeError("Фишка неизменяема")
+    
+    def __reduce__(self):
+        """Сериализовать фишку через общий экземпляр.
+        
+        Returns:
+            tuple: Фабрика и аргументы для восстановления
+        """
+        return (Tile.of, (self._kind,))
     
     def kind(self) -> TileKind:
         """Получить тип фишки.
@@ -22,6 +65,14 @@ class Tile:
         """
         return self._kind
     
+    def code(self) -> int:
+        """Получить числовой код типа фишки.
+        
+        Returns:
+            int: Код фишки (1-5)
+        """
+        return self._code
+    
     def __eq__(self, other) -> bool:
         """Проверить равенство фишек.
         
@@ -58,3 +109,6 @@ class Tile:
             str: Отладочное представление
         """
         return f"Tile({self._kind.value})"
+
+
+_SHARED_TILES = {kind: Tile(kind) for kind in TileKind.all()}
@@ -3,6 +3,10 @@
 from enum import Enum
 
 
+# Код пустой ячейки в компактных представлениях доски
+EMPTY_CODE = 0
+
+
 class TileKind(Enum):
     """Типы фишек в игре."""
     
@@ -20,3 +24,32 @@ class TileKind(Enum):
             list[TileKind]: Список всех типов фишек
         """
         return [cls.A, cls.B, cls.C, cls.D, cls.E]
+    
+    def code(self) -> int:
+        """Получить числовой код типа фишки.
+        
+        Returns:
+            int: Код фишки (1-5), 0 зарезервирован для пустой ячейки
+        """
+        return _CODE_BY_KIND[self]
+    
+    @classmethod
+    def from_code(cls, code: int) -> 'TileKind':
+        """Получить тип фишки по числовому коду.
+        
+        Args:
+            code: Код фишки (1-5)
+            
+        Returns:
+            TileKind: Тип фишки
+            
+        Raises:
+            ValueError: Если код не соответствует ни одному типу
+        """
+        if not 0 < code < len(_KIND_BY_CODE):
+            raise ValueError(f"Неизвестный код фишки: {code}")
+        return _KIND_BY_CODE[code]
+
+
+_KIND_BY_CODE = (None,) + tuple(TileKind.all())
+_CODE_BY_KIND = {kind: code for code, kind in enumerate(_KIND_BY_CODE) if kind is not None}
@@ -0,0 +1,140 @@
+"""Ключи Zobrist для хеширования содержимого доски."""
+
+import random as random_module
+import threading
+from typing import List
+
+from .cell import Cell
+from .tile_kind import TileKind, EMPTY_CODE
+
+
+# Фиксированный seed: хеш одной и той же доски одинаков во всех процессах
+_ZOBRIST_SEED = 0x5EED_2A0B
+_CODE_COUNT = len(TileKind.all()) + 1
+_PREGENERATED_CELLS = 64
+_MASK_64 = (1 << 64) - 1
+
+# Ключи хранятся таблицей только для первых ячеек; для ячеек дальше
+# (большие доски) ключ вычисляется перемешиванием индекса и кода
+TABLE_CELL_LIMIT = 4096
+
+_random = random_module.Random(_ZOBRIST_SEED)
+_keys: List[List[int]] = []
+_keys_lock = threading.Lock()
+
+
+def _extend_keys(cell_count: int) -> None:
+    """Сгенерировать ключи для первых cell_count ячеек.
+    
+    Args:
+        cell_count: Необходимое количество ячеек
+    """
+    with _keys_lock:
+        while len(_keys) < cell_count:
+            # Пустой ячейке соответствует нулевой ключ, поэтому хеш пустой доски равен 0
+            _keys.append([0] + [_random.getrandbits(64) for _ in range(_CODE_COUNT - 1)])
+
+
+def _splitmix64(number: int) -> int:
+    """Перемешать число функцией splitmix64.
+    
+    Args:
+        number: Перемешиваемое число
+    
+    Returns:
+        int: 64-битное значение
+    """
+    value = (_ZOBRIST_SEED + number * 0x9E3779B97F4A7C15) & _MASK_64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK_64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK_64
+    return value ^ (value >> 31)
+
+
+def _mixed_key(index: int, code: int) -> int:
+    """Вычислить ключ ячейки вне таблицы.
+    
+    Args:
+        index: Индекс ячейки
+        code: Код фишки
+    
+    Returns:
+        int: 64-битный ключ
+    """
+    return _splitmix64(index * _CODE_COUNT + code)
+
+
+def zobrist_key(index: int, code: int) -> int:
+    """Получить ключ Zobrist для фишки в ячейке.
+    
+    Args:
+        index: Индекс ячейки row * width + col
+        code: Код фишки (0 для пустой ячейки)
+    
+    Returns:
+        int: 64-битный ключ
+    """
+    if code == EMPTY_CODE:
+        return 0
+    if index >= TABLE_CELL_LIMIT:
+        return _mixed_key(index, code)
+    if index >= len(_keys):
+        _extend_keys(index + 1)
+    return _keys[index][code]
+
+
+def zobrist_keys(cell_count: int) -> List[List[int]]:
+    """Получить таблицу ключей для первых cell_count ячеек.
+    
+    Args:
+        cell_count: Количество ячеек доски (не больше TABLE_CELL_LIMIT)
+        
+    Returns:
+        List[List[int]]: Ключи по индексу ячейки и коду фишки
+        
+    Raises:
+        ValueError: Если ячеек больше, чем хранится в таблице
+    """
+    if cell_count > TABLE_CELL_LIMIT:
+        raise ValueError(f"Таблица ключей хранится только для {TABLE_CELL_LIMIT} ячеек")
+    if cell_count > len(_keys):
+        _extend_keys(cell_count)
+    return _keys[:cell_count]
+
+
+def compute_zobrist_hash(board) -> int:
+    """Вычислить хеш Zobrist доски с нуля.
+    
+    Args:
+        board: Доска для хеширования
+    
+    Returns:
+        int: XOR ключей всех непустых ячеек
+    """
+    width = board.width()
+    value = 0
+    for row in range(board.height()):
+        for col in range(width):
+            tile = board.tile_at(Cell.of(row, col))
+            if tile is not None:
+                value ^= zobrist_key(row * width + col, tile.kind().code())
+    return value
+
+
+def zobrist_board_key(board) -> int:
+    """Получить ключ доски для кешей, общих для досок разных размеров.
+    
+    Args:
+        board: Доска
+    
+    Returns:
+        int: Хеш содержимого, перемешанный с шириной и высотой доски
+        
+    Note:
+        Сам хеш Zobrist зависит только от фишек: одинаково заполненные
+        ячейки досок 8x4 и 4x8 дают одинаковый хеш
+    """
+    # Отрицательное число не совпадает ни с одним ключом ячейки вне таблицы
+    return board.zobrist_hash() ^ _splitmix64(-1 - (board.width() << 32 | board.height()))
+
+
+_extend_keys(_PREGENERATED_CELLS)
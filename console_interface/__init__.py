@@ -1,7 +1,8 @@
 """Пакет для консольного ввода/вывода."""
 
-from .console_io import ConsoleIO
+from .console_io import ConsoleIO, parse_move
 
 __all__ = [
-    'ConsoleIO'
+    'ConsoleIO',
+    'parse_move'
 ]
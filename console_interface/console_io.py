@@ -9,9 +9,13 @@ from board.cell import Cell
 class ConsoleIO:
     """Адаптер для консольного ввода/вывода."""
     
-    def read_move(self) -> Tuple[Cell, Cell]:
+    def read_move(self, width: int = 8, height: int = 8) -> Tuple[Cell, Cell]:
         """Прочитать ход игрока.
         
+        Args:
+            width: Ширина доски
+            height: Высота доски
+        
         Returns:
             Tuple[Cell, Cell]: Пара ячеек для свопа
             
@@ -21,7 +25,7 @@ class ConsoleIO:
         while True:
             try:
                 input_str = input("Введите ход (row1 col1 row2 col2): ").strip()
-                return self._parse_coordinates(input_str)
+                return self._parse_coordinates(input_str, width, height)
             except ValueError as e:
                 print(f"Ошибка ввода: {e}")
                 print("Используйте формат: row1 col1 row2 col2 (например: 0 1 0 2)")
@@ -119,11 +123,13 @@ class ConsoleIO:
             else:
                 print("Пожалуйста, введите 'y' или 'n'")
     
-    def _parse_coordinates(self, input_str: str) -> Tuple[Cell, Cell]:
+    def _parse_coordinates(self, input_str: str, width: int = 8, height: int = 8) -> Tuple[Cell, Cell]:
         """Распарсить координаты из строки.
         
         Args:
             input_str: Строка с координатами
+            width: Ширина доски
+            height: Высота доски
             
         Returns:
             Tuple[Cell, Cell]: Пара ячеек
@@ -131,28 +137,46 @@ class ConsoleIO:
         Raises:
             ValueError: Если формат неверный
         """
-        parts = input_str.split()
+        return parse_move(input_str, width, height)
+
+
+def parse_move(input_str: str, width: int = 8, height: int = 8) -> Tuple[Cell, Cell]:
+    """Распарсить ход вида "row1 col1 row2 col2".
+    
+    Args:
+        input_str: Строка с координатами
+        width: Ширина доски
+        height: Высота доски
         
-        if len(parts) != 4:
-            raise ValueError("Неверный формат ввода. Используйте: row1 col1 row2 col2")
+    Returns:
+        Tuple[Cell, Cell]: Пара соседних ячеек
         
-        try:
-            row1, col1, row2, col2 = map(int, parts)
-            
-            # Проверяем диапазон координат
-            if not (0 <= row1 < 8 and 0 <= col1 < 8 and 0 <= row2 < 8 and 0 <= col2 < 8):
-                raise ValueError("Координаты должны быть в диапазоне [0-7]")
-            
-            cell1 = Cell(row1, col1)
-            cell2 = Cell(row2, col2)
-            
-            # Проверяем, что ячейки соседние
-            if not cell1.is_adjacent(cell2):
-                raise ValueError("Ячейки должны быть соседними")
-            
-            return cell1, cell2
-            
-        except ValueError as e:
-            if "invalid literal" in str(e):
-                raise ValueError("Координаты должны быть числами")
-            raise
+    Raises:
+        ValueError: Если формат неверный
+    """
+    parts = input_str.split()
+    
+    if len(parts) != 4:
+        raise ValueError("Неверный формат ввода. Используйте: row1 col1 row2 col2")
+    
+    try:
+        row1, col1, row2, col2 = map(int, parts)
+        
+        cell1 = Cell.of(row1, col1)
+        cell2 = Cell.of(row2, col2)
+        
+        # Проверяем диапазон координат
+        if not (cell1.is_valid(width, height) and cell2.is_valid(width, height)):
+            raise ValueError(f"Строки должны быть в диапазоне [0-{height - 1}], "
+                             f"столбцы - в диапазоне [0-{width - 1}]")
+        
+        # Проверяем, что ячейки соседние
+        if not cell1.is_adjacent(cell2):
+            raise ValueError("Ячейки должны быть соседними")
+        
+        return cell1, cell2
+        
+    except ValueError as e:
+        if "invalid literal" in str(e):
+            raise ValueError("Координаты должны быть числами")
+        raise
@@ -4,10 +4,16 @@ from .game_state import GameState
 from .game_state_builder import GameStateBuilder
 from .service_container import ServiceContainer
 from .game_controller import GameController
+from .board_pool import BoardPool
+from .move_journal import MoveJournal
+from .cascade_step import CascadeStep
 
 __all__ = [
     'GameState',
     'GameStateBuilder',
     'ServiceContainer',
-    'GameController'
+    'GameController',
+    'BoardPool',
+    'MoveJournal',
+    'CascadeStep'
 ]
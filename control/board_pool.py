@@ -0,0 +1,153 @@
+"""Пул заранее сгенерированных досок с фоновым пополнением."""
+
+import queue
+import random as random_module
+import threading
+from typing import Optional, Tuple
+
+from board.board_factory import BoardFactory
+from board.mutable_board import MutableBoard
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.pattern_move_generator import PatternMoveGenerator
+
+
+# Интервал, с которым фоновый поток проверяет флаг остановки при полном пуле
+_REFILL_POLL_SECONDS = 0.1
+
+
+class BoardPool:
+    """Ограниченная очередь готовых досок без совпадений и хотя бы с одним ходом.
+    
+    Фоновый поток держит очередь заполненной, поэтому выдача доски
+    при старте игры стоит O(1). Если очередь пуста, доска строится
+    синхронно, так что acquire() никогда не блокируется на ожидании.
+    """
+    
+    def __init__(self, capacity: int = 16, seed: Optional[int] = None, move_generator=None,
+                 width: int = 8, height: int = 8):
+        """Инициализировать пул.
+        
+        Args:
+            capacity: Максимальное количество готовых досок
+            seed: Начальное значение последовательности seed досок
+                (None для системного)
+            move_generator: Генератор ходов для проверки досок
+            width: Ширина досок
+            height: Высота досок
+        
+        Raises:
+            ValueError: Если capacity не положительна
+        """
+        if capacity <= 0:
+            raise ValueError("Ёмкость пула должна быть положительной")
+        
+        self._capacity = capacity
+        self._boards: queue.Queue = queue.Queue(maxsize=capacity)
+        self._seeds = random_module.Random(seed)
+        self._move_generator = move_generator if move_generator is not None else PatternMoveGenerator()
+        self._width = width
+        self._height = height
+        
+        # Генерация идёт под блокировкой: i-я доска всегда строится из i-го seed,
+        # а генератор ходов с кэшем не используется из двух потоков сразу
+        self._generation_lock = threading.Lock()
+        self._stop_event = threading.Event()
+        self._worker: Optional[threading.Thread] = None
+    
+    def capacity(self) -> int:
+        """Получить ёмкость пула.
+        
+        Returns:
+            int: Максимальное количество готовых досок
+        """
+        return self._capacity
+    
+    def board_size(self) -> Tuple[int, int]:
+        """Получить размер выдаваемых досок.
+        
+        Returns:
+            Tuple[int, int]: Ширина и высота
+        """
+        return self._width, self._height
+    
+    def size(self) -> int:
+        """Получить количество готовых досок.
+        
+        Returns:
+            int: Текущий размер очереди
+        """
+        return self._boards.qsize()
+    
+    def is_running(self) -> bool:
+        """Проверить, работает ли фоновое пополнение.
+        
+        Returns:
+            bool: True, если фоновый поток запущен
+        """
+        return self._worker is not None and self._worker.is_alive()
+    
+    def acquire(self) -> MutableBoard:
+        """Получить готовую доску.
+        
+        Returns:
+            MutableBoard: Доска без совпадений хотя бы с одним ходом
+        
+        Note:
+            При пустой очереди доска строится синхронно
+        """
+        try:
+            return self._boards.get_nowait()
+        except queue.Empty:
+            return self._generate()
+    
+    def fill(self) -> None:
+        """Синхронно заполнить пул до ёмкости."""
+        while not self._boards.full():
+            try:
+                self._boards.put_nowait(self._generate())
+            except queue.Full:
+                break
+    
+    def start(self) -> None:
+        """Запустить фоновое пополнение пула."""
+        if self.is_running():
+            return
+        
+        self._stop_event.clear()
+        self._worker = threading.Thread(target=self._refill_loop, name="board-pool", daemon=True)
+        self._worker.start()
+    
+    def stop(self, timeout: Optional[float] = None) -> None:
+        """Остановить фоновое пополнение пула.
+        
+        Args:
+            timeout: Максимальное время ожидания потока в секундах
+        """
+        self._stop_event.set()
+        if self._worker is not None:
+            self._worker.join(timeout)
+            self._worker = None
+    
+    def _refill_loop(self) -> None:
+        """Цикл фонового потока: строить доски, пока пул не остановлен."""
+        while not self._stop_event.is_set():
+            board = self._generate()
+            
+            while not self._stop_event.is_set():
+                try:
+                    self._boards.put(board, timeout=_REFILL_POLL_SECONDS)
+                    break
+                except queue.Full:
+                    continue
+    
+    def _generate(self) -> MutableBoard:
+        """Построить очередную доску из следующего seed последовательности.
+        
+        Returns:
+            MutableBoard: Доска без совпадений хотя бы с одним ходом
+        """
+        with self._generation_lock:
+            board_seed = self._seeds.getrandbits(64)
+            return BoardFactory.create_board_constructive(
+                RandomProviderDefault(board_seed), self._move_generator, self._width, self._height
+            )
@@ -0,0 +1,24 @@
+"""Результат одного шага каскада."""
+
+from dataclasses import dataclass
+from typing import FrozenSet, Tuple
+
+from board.cell import Cell
+
+
+@dataclass(frozen=True)
+class CascadeStep:
+    """Изменения доски и очки за один шаг каскада.
+    
+    Шаг описывает удаление совпадений, падение фишек и заполнение
+    пустых ячеек. Перемещения перечислены по столбцам сверху вниз,
+    заполненные ячейки - по столбцам в порядке запросов к поставщику
+    случайностей.
+    """
+    
+    cascade_index: int
+    matches: FrozenSet[FrozenSet[Cell]]
+    removed_count: int
+    points: int
+    moved: Tuple[Tuple[Cell, Cell], ...]
+    filled: Tuple[Cell, ...]
@@ -1,8 +1,21 @@
 """Основной контроллер игровой логики."""
 
+from operator import methodcaller
+from typing import Iterator, List, Optional, Set, Tuple
+
 from board.cell import Cell
 from board.mutable_board import MutableBoard
+from .cascade_step import CascadeStep
 from .game_state import GameState
+from .move_journal import CascadeDelta, JournalEntry, empty_indexes, pack_tiles
+
+
+# Таймеры генератора ходов по именам методов
+_MOVE_GENERATOR_TIMERS = {
+    'generate_all_moves': 'move_generator.generate_all_moves',
+    'find_first_move': 'move_generator.find_first_move',
+    'has_available_moves': 'move_generator.has_available_moves',
+}
 
 
 class GameController:
@@ -15,13 +28,30 @@ class GameController:
             services: Контейнер с игровыми сервисами
         """
         self._services = services
-        self._swap_validator = services.get_swap_validator()
-        self._match_finder = services.get_match_finder()
-        self._match_resolver = services.get_match_resolver()
-        self._gravity_engine = services.get_gravity_engine()
-        self._score_manager = services.get_score_manager()
         self._combo_tracker = services.get_combo_tracker()
         self._random_provider = services.get_random_provider()
+        
+        # Выключенные метрики возвращают сервисы без обёрток
+        metrics = services.get_metrics()
+        self._metrics = metrics
+        self._swap_validator = metrics.instrument(
+            services.get_swap_validator(), {'is_valid_swap': 'swap_validator.is_valid_swap'})
+        self._match_finder = metrics.instrument(
+            services.get_match_finder(), {'find_matches': 'cascade.find'})
+        self._match_resolver = metrics.instrument(
+            services.get_match_resolver(), {'remove_matches': 'cascade.remove'})
+        self._gravity_engine = metrics.instrument(
+            services.get_gravity_engine(), {'apply_gravity': 'cascade.gravity', 'refill': 'cascade.refill'})
+        self._score_manager = metrics.instrument(
+            services.get_score_manager(), {'score_for_removed': 'cascade.score'})
+        # Замеряются копии доски, которые делает сам контроллер; копии внутри
+        # валидатора входят в замер swap_validator.is_valid_swap
+        self._clone_board = metrics.timed('board.clone', methodcaller('clone'))
+        self._move_generator_source = None
+        self._move_generator = None
+        # Оборачивается функция класса, а не связанный метод: иначе
+        # экземпляр ссылался бы сам на себя
+        self._timed_perform_move = metrics.timed('move.perform', type(self)._perform_move)
     
     def perform_move(self, state: GameState, a: Cell, b: Cell) -> bool:
         """Выполнить ход игрока.
@@ -37,23 +67,178 @@ class GameController:
         Raises:
             ValueError: Если ячейки не соседние или вне доски
         """
+        return self._timed_perform_move(self, state, a, b)
+    
+    def _perform_move(self, state: GameState, a: Cell, b: Cell) -> bool:
+        """Выполнить ход игрока без замера времени.
+        
+        Args:
+            state: Текущее состояние игры
+            a: Первая ячейка для свопа
+            b: Вторая ячейка для свопа
+            
+        Returns:
+            bool: True если ход выполнен успешно, False если невалидный
+        """
+        steps = self.stream_move(state, a, b)
+        if steps is None:
+            return False
+        
+        for _ in steps:
+            pass
+        return True
+    
+    def stream_move(self, state: GameState, a: Cell, b: Cell) -> Optional[Iterator[CascadeStep]]:
+        """Начать ход игрока с выдачей шагов каскада по мере выполнения.
+        
+        Args:
+            state: Текущее состояние игры
+            a: Первая ячейка для свопа
+            b: Вторая ячейка для свопа
+            
+        Returns:
+            Optional[Iterator[CascadeStep]]: Шаги каскада или None, если ход невалидный
+            
+        Raises:
+            ValueError: Если ячейки не соседние или вне доски
+            
+        Note:
+            Состояние обновляется только после выдачи последнего шага.
+            Если закрыть поток раньше (close() или сборка мусора), ход не
+            применяется: поставщик случайностей и трекер комбо возвращаются
+            к состоянию до хода. Если поставщик не сохраняет состояние,
+            откатить его нельзя, и при закрытии каскад доводится до конца
+            и ход применяется
+        """
         # Проверяем валидность свопа
         if not self._swap_validator.is_valid_swap(state.board, a, b):
-            return False
+            return None
+        return self._stream_move(state, a, b)
+    
+    def _stream_move(self, state: GameState, a: Cell, b: Cell) -> Iterator[CascadeStep]:
+        """Выполнить проверенный ход, выдавая шаги каскада.
         
+        Args:
+            state: Текущее состояние игры
+            a: Первая ячейка для свопа
+            b: Вторая ячейка для свопа
+            
+        Returns:
+            Iterator[CascadeStep]: Шаги каскада
+        """
         # Создаём изменяемую копию доски
-        mutable_board = state.board.clone()
+        mutable_board = self._clone_board(state.board)
         
         # Выполняем своп
         mutable_board.swap(a, b)
         
+        # Запоминаем состояние для журнала и для отката прерванного хода
+        random_state = self._random_provider.get_state()
+        combo_index = self._combo_tracker.current_index()
+        
         # Выполняем каскадное разрешение совпадений
-        total_points = self._execute_cascade(mutable_board, state)
+        deltas = [] if state.journal is not None else None
+        total_points = 0
+        steps = self.iter_cascade(mutable_board, deltas)
+        try:
+            for step in steps:
+                total_points += step.points
+                yield step
+        except GeneratorExit:
+            if random_state is not None:
+                self._random_provider.set_state(random_state)
+                self._combo_tracker.set_index(combo_index)
+                raise
+            total_points += sum(step.points for step in steps)
+            self._commit_move(state, a, b, mutable_board, total_points, deltas, random_state)
+            raise
         
-        # Обновляем состояние
-        state.board = mutable_board
-        state.add_score(total_points)
+        self._commit_move(state, a, b, mutable_board, total_points, deltas, random_state)
+    
+    def _commit_move(self, state: GameState, a: Cell, b: Cell, board: MutableBoard,
+                     points: int, deltas: Optional[List[CascadeDelta]],
+                     random_state: Optional[tuple]) -> None:
+        """Применить выполненный ход к состоянию.
         
+        Args:
+            state: Текущее состояние игры
+            a: Первая ячейка свопа
+            b: Вторая ячейка свопа
+            board: Доска после каскада
+            points: Очки за ход
+            deltas: Изменения шагов каскада для журнала (None - журнала нет)
+            random_state: Состояние поставщика случайностей перед ходом
+        """
+        # Обновляем состояние, сохранив прежнюю доску в истории; при журнале
+        # поставщик восстанавливается по журналу, и снимку его состояние не нужно
+        state.record_snapshot(random_state if deltas is None else None)
+        state.board = board
+        state.add_score(points)
+        
+        if deltas is not None:
+            state.journal.record(JournalEntry(a, b, points, tuple(deltas)), random_state)
+    
+    def undo(self, state: GameState) -> bool:
+        """Отменить последний ход по журналу или по истории снимков.
+        
+        Args:
+            state: Состояние игры с журналом или историей
+            
+        Returns:
+            bool: True если ход отменён, False если отменять нечего
+            
+        Note:
+            Поставщик случайностей возвращается к состоянию перед ходом,
+            чтобы следующие ходы совпадали с воспроизведением журнала.
+            При наличии журнала снимок истории снимается вместе с ходом
+        """
+        if state.journal is None:
+            snapshot = state.pop_snapshot()
+            if snapshot is None:
+                return False
+            state.board, state.score, state.moves_available, random_state = snapshot
+            if random_state is not None:
+                self._random_provider.set_state(random_state)
+            return True
+        
+        board = self._clone_board(state.board)
+        entry = state.journal.undo(board)
+        if entry is None:
+            return False
+        
+        state.pop_snapshot()
+        state.board = board
+        state.score -= entry.points
+        state.journal.restore_random(self._random_provider)
+        self.update_moves_available(state)
+        return True
+    
+    def redo(self, state: GameState) -> bool:
+        """Повторить отменённый ход по журналу.
+        
+        Args:
+            state: Состояние игры с журналом
+            
+        Returns:
+            bool: True если ход повторён, False если повторять нечего
+            
+        Note:
+            Фишки хода берутся из журнала; поставщик случайностей
+            возвращается к состоянию после хода
+        """
+        if state.journal is None:
+            return False
+        
+        board = self._clone_board(state.board)
+        entry = state.journal.redo(board)
+        if entry is None:
+            return False
+        
+        state.record_snapshot()
+        state.board = board
+        state.add_score(entry.points)
+        state.journal.restore_random(self._random_provider)
+        self.update_moves_available(state)
         return True
     
     def update_moves_available(self, state: GameState) -> None:
@@ -63,7 +248,10 @@ class GameController:
             state: Состояние для обновления
         """
         move_generator = self._services.get_move_generator()
-        has_moves = move_generator.has_available_moves(state.board)
+        if move_generator is not self._move_generator_source:
+            self._move_generator_source = move_generator
+            self._move_generator = self._metrics.instrument(move_generator, _MOVE_GENERATOR_TIMERS)
+        has_moves = self._move_generator.has_available_moves(state.board)
         state.set_moves_available(has_moves)
     
     def is_game_over(self, state: GameState) -> bool:
@@ -77,18 +265,24 @@ class GameController:
         """
         return not state.has_moves()
     
-    def _execute_cascade(self, board: MutableBoard, state: GameState) -> int:
-        """Выполнить каскадное разрешение совпадений.
+    def iter_cascade(self, board: MutableBoard,
+                     deltas: Optional[List[CascadeDelta]] = None) -> Iterator[CascadeStep]:
+        """Выполнять каскадное разрешение совпадений по шагам.
         
         Args:
-            board: Доска для обработки
-            state: Состояние для обновления счёта
+            board: Доска для обработки (изменяется на месте)
+            deltas: Список, в который записываются изменения каждого шага
+                для журнала ходов (None - не записывать)
             
         Returns:
-            int: Общее количество очков за каскад
+            Iterator[CascadeStep]: Шаги каскада; каждый выдаётся сразу после
+                заполнения доски, следующий ищется при запросе
+            
+        Note:
+            Доска должна быть заполнена, как после свопа: перемещения
+            и заполнения шага считаются только по столбцам удалённых фишек
         """
         self._combo_tracker.reset()
-        total_points = 0
         
         while True:
             # Ищем совпадения
@@ -97,21 +291,78 @@ class GameController:
             if len(matches) == 0:
                 break
             
+            matched = set().union(*matches)
+            if deltas is not None:
+                empty_before = empty_indexes(board)
+                removed = pack_tiles(board, matched)
+            
             # Удаляем совпадения
             removed_count = self._match_resolver.remove_matches(board, matches)
             
             # Начисляем очки
             cascade_index = self._combo_tracker.current_index()
             points = self._score_manager.score_for_removed(removed_count, cascade_index)
-            total_points += points
             
             # Применяем гравитацию
+            columns = {cell.col() for cell in matched}
+            moved, filled = self._column_changes(board, columns)
             self._gravity_engine.apply_gravity(board)
             
             # Заполняем пустые ячейки
+            if deltas is not None:
+                holes = empty_indexes(board)
             self._gravity_engine.refill(board, self._random_provider)
+            if deltas is not None:
+                width = board.width()
+                refilled = [Cell.of(index // width, index % width) for index in holes]
+                deltas.append(CascadeDelta(removed, pack_tiles(board, refilled), empty_before))
             
             # Увеличиваем индекс каскада
             self._combo_tracker.increment()
+            self._metrics.observe('cascade.removed_tiles', removed_count)
+            
+            yield CascadeStep(cascade_index, frozenset(matches), removed_count, points, moved, filled)
         
-        return total_points
+        self._metrics.observe('cascade.depth', self._combo_tracker.current_index())
+    
+    def _execute_cascade(self, board: MutableBoard, state: GameState,
+                         steps: Optional[List[CascadeDelta]] = None) -> int:
+        """Выполнить каскадное разрешение совпадений.
+        
+        Args:
+            board: Доска для обработки
+            state: Состояние для обновления счёта
+            steps: Список, в который записываются изменения каждого шага
+                для журнала ходов (None - не записывать)
+            
+        Returns:
+            int: Общее количество очков за каскад
+        """
+        return sum(step.points for step in self.iter_cascade(board, steps))
+    
+    @staticmethod
+    def _column_changes(board: MutableBoard, columns: Set[int]) -> Tuple[Tuple, Tuple]:
+        """Вычислить перемещения гравитации и ячейки заполнения до их выполнения.
+        
+        Args:
+            board: Доска после удаления совпадений
+            columns: Столбцы с пустыми ячейками
+            
+        Returns:
+            Tuple[Tuple, Tuple]: Пары (откуда, куда) и заполняемые ячейки
+            
+        Note:
+            Гравитация сохраняет порядок фишек в столбце, поэтому i-я
+            сверху фишка оказывается в строке (число пустых) + i
+        """
+        height = board.height()
+        moved = []
+        filled = []
+        for col in sorted(columns):
+            rows = [row for row in range(height) if board.tile_at(Cell.of(row, col)) is not None]
+            depth = height - len(rows)
+            for offset, row in enumerate(rows):
+                if row != depth + offset:
+                    moved.append((Cell.of(row, col), Cell.of(depth + offset, col)))
+            filled.extend(Cell.of(row, col) for row in range(depth))
+        return tuple(moved), tuple(filled)
@@ -1,9 +1,10 @@
 """Состояние игры."""
 
-from dataclasses import dataclass
-from typing import Optional
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
 
 from board.board import Board
+from .move_journal import MoveJournal
 
 
 @dataclass
@@ -13,6 +14,9 @@ class GameState:
     board: Board
     score: int
     moves_available: bool
+    history_limit: int = 0
+    history: List[Tuple[Board, int, bool, Optional[tuple]]] = field(default_factory=list)
+    journal: Optional[MoveJournal] = None
     
     def __post_init__(self):
         """Валидация после инициализации."""
@@ -20,6 +24,8 @@ class GameState:
             raise ValueError("Счёт не может быть отрицательным")
         if self.board is None:
             raise ValueError("Доска обязательна")
+        if self.history_limit < 0:
+            raise ValueError("Размер истории не может быть отрицательным")
     
     def get_score(self) -> int:
         """Получить текущий счёт.
@@ -55,3 +61,53 @@ class GameState:
             available: Доступны ли ходы
         """
         self.moves_available = available
+    
+    def record_snapshot(self, random_state: Optional[tuple] = None) -> None:
+        """Сохранить текущее состояние в историю перед заменой доски.
+        
+        Args:
+            random_state: Состояние поставщика случайностей перед ходом
+            
+        Note:
+            Доска сохраняется ссылкой без копии: контроллер не меняет
+            доску состояния на месте, а заменяет её новой.
+            При history_limit = 0 история не ведётся
+        """
+        if self.history_limit == 0:
+            return
+        
+        self.history.append((self.board, self.score, self.moves_available, random_state))
+        if len(self.history) > self.history_limit:
+            del self.history[0]
+    
+    def can_undo(self) -> bool:
+        """Проверить, есть ли в истории снимок для отмены.
+        
+        Returns:
+            bool: True если историю можно откатить
+        """
+        return len(self.history) > 0
+    
+    def pop_snapshot(self) -> Optional[Tuple[Board, int, bool, Optional[tuple]]]:
+        """Извлечь последний снимок из истории.
+        
+        Returns:
+            Optional[Tuple[Board, int, bool, Optional[tuple]]]: Доска, счёт,
+            флаг доступности ходов и состояние поставщика случайностей,
+            или None если история пуста
+            
+        Note:
+            Снимок восстанавливает GameController.undo - единственный путь
+            отмены, согласующий историю с журналом ходов
+        """
+        if not self.history:
+            return None
+        return self.history.pop()
+    
+    def snapshots(self) -> List[Board]:
+        """Получить доски из истории от старых к новым.
+        
+        Returns:
+            List[Board]: Сохранённые доски
+        """
+        return [snapshot[0] for snapshot in self.history]
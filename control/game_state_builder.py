@@ -3,6 +3,7 @@
 from typing import Optional
 
 from .game_state import GameState
+from .move_journal import MoveJournal
 from board.board import Board
 
 
@@ -14,6 +15,8 @@ class GameStateBuilder:
         self._board: Optional[Board] = None
         self._score: int = 0
         self._moves_available: bool = True
+        self._history_limit: int = 0
+        self._journal: Optional[MoveJournal] = None
     
     def with_board(self, board: Board) -> 'GameStateBuilder':
         """Установить доску.
@@ -51,6 +54,30 @@ class GameStateBuilder:
         self._moves_available = available
         return self
     
+    def with_history(self, limit: int) -> 'GameStateBuilder':
+        """Включить историю досок для отмены и повтора.
+        
+        Args:
+            limit: Максимальное количество хранимых снимков (≥0)
+            
+        Returns:
+            GameStateBuilder: self для цепочки вызовов
+        """
+        self._history_limit = limit
+        return self
+    
+    def with_journal(self, seed: Optional[int] = None) -> 'GameStateBuilder':
+        """Включить журнал ходов для отмены, повтора и воспроизведения.
+        
+        Args:
+            seed: Seed партии, сохраняемый в журнале
+            
+        Returns:
+            GameStateBuilder: self для цепочки вызовов
+        """
+        self._journal = MoveJournal(seed)
+        return self
+    
     def build(self) -> GameState:
         """Создать GameState.
         
@@ -66,5 +93,7 @@ class GameStateBuilder:
         return GameState(
             board=self._board,
             score=self._score,
-            moves_available=self._moves_available
+            moves_available=self._moves_available,
+            history_limit=self._history_limit,
+            journal=self._journal
         )
@@ -0,0 +1,316 @@
+"""Журнал ходов с компактными изменениями доски для отмены и повтора."""
+
+from array import array
+from dataclasses import dataclass
+from typing import Dict, Iterable, List, Optional, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.tile import Tile
+from board.tile_kind import TileKind
+
+
+# Ячейка с фишкой упаковывается в одно число: index << 3 | code
+_CODE_BITS = 3
+_CODE_MASK = (1 << _CODE_BITS) - 1
+
+
+@dataclass(frozen=True)
+class CascadeDelta:
+    """Изменения доски за один шаг каскада.
+    
+    Все ячейки хранятся индексами row * width + col в array,
+    фишки - упакованными значениями index << 3 | code.
+    """
+    
+    removed: array
+    refilled: array
+    empty_before: array
+
+
+@dataclass(frozen=True)
+class JournalEntry:
+    """Запись журнала об одном ходе."""
+    
+    a: Cell
+    b: Cell
+    points: int
+    steps: Tuple[CascadeDelta, ...]
+
+
+def pack_tiles(board: Board, cells: Iterable[Cell]) -> array:
+    """Упаковать фишки в ячейках.
+    
+    Args:
+        board: Доска для чтения
+        cells: Непустые ячейки
+    
+    Returns:
+        array: Значения index << 3 | code в порядке обхода строк
+    """
+    width = board.width()
+    packed = sorted((cell.row() * width + cell.col()) << _CODE_BITS | board.tile_at(cell).code()
+                    for cell in cells)
+    return array('I', packed)
+
+
+def empty_indexes(board: Board) -> array:
+    """Найти пустые ячейки доски.
+    
+    Args:
+        board: Доска для чтения
+    
+    Returns:
+        array: Индексы пустых ячеек в порядке обхода строк
+    """
+    width = board.width()
+    return array('I', (cell.row() * width + cell.col()
+                       for cell in board.enumerate_cells() if board.tile_at(cell) is None))
+
+
+class MoveJournal:
+    """Журнал ходов партии с отменой и повтором по компактным изменениям.
+    
+    Вместо снимков досок хранятся своп, удалённые на каждом шаге каскада
+    фишки и фишки, выданные поставщиком случайностей при заполнении.
+    Вместе с seed партии журнал позволяет восстановить любой ход.
+    
+    Состояние поставщика случайностей сохраняется только перед каждой
+    random_checkpoint_interval-й записью. restore_random() возвращает
+    поставщик к текущей позиции журнала, повторяя от ближайшей точки выдачу
+    фишек по шагам записей, поэтому после отмены новые ходы берут фишки
+    с той же позиции потока, что и воспроизведение партии по seed и moves().
+    """
+    
+    def __init__(self, seed: Optional[int] = None, random_checkpoint_interval: int = 32):
+        """Создать пустой журнал.
+        
+        Args:
+            seed: Seed партии для последующего воспроизведения
+            random_checkpoint_interval: Через сколько записей сохраняется
+                состояние поставщика случайностей
+        
+        Raises:
+            ValueError: Если интервал не положителен
+        """
+        if random_checkpoint_interval <= 0:
+            raise ValueError("Интервал сохранения состояния должен быть положительным")
+        self._seed = seed
+        self._entries: List[JournalEntry] = []
+        self._cursor = 0
+        self._checkpoint_interval = random_checkpoint_interval
+        # Состояния поставщика по позиции журнала, кратной интервалу
+        self._random_states: Dict[int, tuple] = {}
+    
+    def seed(self) -> Optional[int]:
+        """Получить seed партии.
+        
+        Returns:
+            Optional[int]: Seed или None, если он неизвестен
+        """
+        return self._seed
+    
+    def entries(self) -> List[JournalEntry]:
+        """Получить применённые записи от первой к последней.
+        
+        Returns:
+            List[JournalEntry]: Записи до текущей позиции журнала
+        """
+        return self._entries[:self._cursor]
+    
+    def moves(self) -> List[Tuple[Cell, Cell]]:
+        """Получить применённые ходы для воспроизведения партии.
+        
+        Returns:
+            List[Tuple[Cell, Cell]]: Свопы в порядке выполнения
+        """
+        return [(entry.a, entry.b) for entry in self.entries()]
+    
+    def can_undo(self) -> bool:
+        """Проверить, есть ли ход для отмены.
+        
+        Returns:
+            bool: True если ход можно отменить
+        """
+        return self._cursor > 0
+    
+    def can_redo(self) -> bool:
+        """Проверить, есть ли отменённый ход для повтора.
+        
+        Returns:
+            bool: True если ход можно повторить
+        """
+        return self._cursor < len(self._entries)
+    
+    def record(self, entry: JournalEntry, random_state: Optional[tuple] = None) -> None:
+        """Добавить запись о выполненном ходе.
+        
+        Args:
+            entry: Запись о ходе
+            random_state: Состояние поставщика случайностей перед ходом
+                (None, если поставщик его не сохраняет)
+        
+        Note:
+            Отменённые ходы после текущей позиции отбрасываются
+        """
+        del self._entries[self._cursor:]
+        for position in [position for position in self._random_states if position > self._cursor]:
+            del self._random_states[position]
+        if self._cursor % self._checkpoint_interval == 0 and random_state is not None:
+            self._random_states[self._cursor] = random_state
+        self._entries.append(entry)
+        self._cursor += 1
+    
+    def restore_random(self, provider) -> bool:
+        """Вернуть поставщик случайностей к текущей позиции журнала.
+        
+        Args:
+            provider: Поставщик случайностей партии
+        
+        Returns:
+            bool: True если состояние восстановлено, False если для
+            ближайшей точки сохранения состояния нет
+        """
+        start = self._cursor - self._cursor % self._checkpoint_interval
+        state = self._random_states.get(start)
+        if state is None:
+            return False
+        
+        provider.set_state(state)
+        # Каждый шаг каскада заполнял пустые ячейки одним запросом фишек
+        for entry in self._entries[start:self._cursor]:
+            for step in entry.steps:
+                provider.next_tile_kinds(len(step.refilled))
+        return True
+    
+    def undo(self, board: Board) -> Optional[JournalEntry]:
+        """Отменить последний ход на доске.
+        
+        Args:
+            board: Доска после хода (изменяется на месте)
+        
+        Returns:
+            Optional[JournalEntry]: Отменённая запись или None
+        """
+        if not self.can_undo():
+            return None
+        
+        self._cursor -= 1
+        entry = self._entries[self._cursor]
+        for step in reversed(entry.steps):
+            self._undo_step(board, step)
+        board.swap(entry.a, entry.b)
+        return entry
+    
+    def redo(self, board: Board) -> Optional[JournalEntry]:
+        """Повторить отменённый ход на доске.
+        
+        Args:
+            board: Доска до хода (изменяется на месте)
+        
+        Returns:
+            Optional[JournalEntry]: Повторённая запись или None
+        """
+        if not self.can_redo():
+            return None
+        
+        entry = self._entries[self._cursor]
+        self._cursor += 1
+        board.swap(entry.a, entry.b)
+        for step in entry.steps:
+            self._redo_step(board, step)
+        return entry
+    
+    def _undo_step(self, board: Board, step: CascadeDelta) -> None:
+        """Вернуть доску к состоянию перед шагом каскада.
+        
+        Args:
+            board: Доска после шага
+            step: Изменения шага
+        """
+        width = board.width()
+        removed = {packed >> _CODE_BITS: packed & _CODE_MASK for packed in step.removed}
+        refilled = {packed >> _CODE_BITS for packed in step.refilled}
+        empty = set(step.empty_before)
+        
+        # Уцелевшие фишки лежат внизу столбца в исходном порядке;
+        # возвращаем их в ячейки, которые не удалялись и не были пусты
+        for col in self._columns(removed.keys() | refilled, width):
+            column = [Cell.of(row, col) for row in range(board.height())]
+            survivors = [board.tile_at(cell) for row, cell in enumerate(column)
+                         if row * width + col not in refilled and board.tile_at(cell) is not None]
+            survivors.reverse()
+            target = []
+            for row in range(len(column)):
+                index = row * width + col
+                if index in removed:
+                    target.append(Tile.of(TileKind.from_code(removed[index])))
+                elif index in empty:
+                    target.append(None)
+                else:
+                    target.append(survivors.pop())
+            self._write_column(board, column, target)
+    
+    def _redo_step(self, board: Board, step: CascadeDelta) -> None:
+        """Применить шаг каскада без обращения к поставщику случайностей.
+        
+        Args:
+            board: Доска перед шагом
+            step: Изменения шага
+        """
+        width = board.width()
+        height = board.height()
+        removed = {packed >> _CODE_BITS for packed in step.removed}
+        refilled = {packed >> _CODE_BITS: packed & _CODE_MASK for packed in step.refilled}
+        
+        for col in self._columns(removed | refilled.keys(), width):
+            column = [Cell.of(row, col) for row in range(height)]
+            survivors = [board.tile_at(cell) for row, cell in enumerate(column)
+                         if row * width + col not in removed and board.tile_at(cell) is not None]
+            target = [None] * (height - len(survivors)) + survivors
+            for row in range(height):
+                code = refilled.get(row * width + col)
+                if code is not None:
+                    target[row] = Tile.of(TileKind.from_code(code))
+            self._write_column(board, column, target)
+    
+    def _columns(self, indexes: Iterable[int], width: int) -> List[int]:
+        """Получить столбцы, затронутые шагом каскада.
+        
+        Args:
+            indexes: Индексы изменённых ячеек
+            width: Ширина доски
+        
+        Returns:
+            List[int]: Номера столбцов по возрастанию
+        """
+        return sorted({index % width for index in indexes})
+    
+    def _write_column(self, board: Board, column: List[Cell], target: List[Optional[Tile]]) -> None:
+        """Записать столбец, не трогая ячейки, фишка в которых не меняется.
+        
+        Args:
+            board: Доска для изменения
+            column: Ячейки столбца сверху вниз
+            target: Новые фишки ячеек
+        
+        Note:
+            Пропуск записей сохраняет общие с копиями строки MutableBoard
+            и не меняет версию доски там, где содержимое то же
+        """
+        for cell, tile in zip(column, target):
+            if board.tile_at(cell) != tile:
+                board.set_tile(cell, tile)
+    
+    def _cell(self, index: int, width: int) -> Cell:
+        """Получить ячейку по индексу.
+        
+        Args:
+            index: Индекс row * width + col
+            width: Ширина доски
+        
+        Returns:
+            Cell: Ячейка
+        """
+        row, col = divmod(index, width)
+        return Cell.of(row, col)
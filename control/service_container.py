@@ -1,6 +1,13 @@
 """Контейнер для управления зависимостями сервисов."""
 
-from typing import Dict, Any
+from typing import Dict, Any, Tuple
+
+from metrics.metrics import Metrics
+from metrics.null_metrics import NullMetrics
+
+
+# Общий экземпляр для контейнеров без зарегистрированных метрик
+_NULL_METRICS = NullMetrics()
 
 
 class ServiceContainer:
@@ -74,6 +81,58 @@ class ServiceContainer:
         """
         self._services['move_generator'] = generator
     
+    def register_board_pool(self, pool) -> None:
+        """Зарегистрировать пул готовых досок.
+        
+        Args:
+            pool: Пул досок для быстрого старта игры
+            
+        Raises:
+            ValueError: Если размер досок пула отличается от размера
+                досок новых партий
+            
+        Note:
+            Доски пула строятся из seed самого пула, поэтому партия с доской
+            из пула не воспроизводится по seed поставщика случайностей
+        """
+        if pool.board_size() != self.get_board_size():
+            width, height = pool.board_size()
+            expected_width, expected_height = self.get_board_size()
+            raise ValueError(f"Пул выдаёт доски {width}x{height}, а партии ждут "
+                             f"{expected_width}x{expected_height}")
+        self._services['board_pool'] = pool
+    
+    def register_board_size(self, width: int, height: int) -> None:
+        """Зарегистрировать размер досок новых партий.
+        
+        Args:
+            width: Ширина доски
+            height: Высота доски
+            
+        Raises:
+            ValueError: Если размер не положителен, на доске такого
+                размера невозможен ни один ход или он отличается от
+                размера досок зарегистрированного пула
+        """
+        if width <= 0 or height <= 0:
+            raise ValueError("Размер доски должен быть положительным")
+        # Для хода нужна линия хотя бы из трёх ячеек, а в одиночной линии
+        # из трёх своп не может собрать тройку без исходного совпадения
+        if max(width, height) < 3 or (min(width, height) == 1 and max(width, height) == 3):
+            raise ValueError(f"На доске {width}x{height} невозможен ни один ход")
+        if self.has_board_pool() and self.get_board_pool().board_size() != (width, height):
+            raise ValueError(f"Размер {width}x{height} отличается от размера досок пула")
+        self._services['board_size'] = (width, height)
+    
+    def register_metrics(self, metrics: Metrics) -> None:
+        """Зарегистрировать сбор метрик.
+        
+        Args:
+            metrics: Метрики, в которые пишут создаваемые после этого
+                GameController
+        """
+        self._services['metrics'] = metrics
+    
     def get_swap_validator(self):
         """Получить валидатор свопов.
         
@@ -162,6 +221,41 @@ class ServiceContainer:
         """
         return self._services['move_generator']
     
+    def get_board_pool(self):
+        """Получить пул готовых досок.
+        
+        Returns:
+            BoardPool: Зарегистрированный пул
+            
+        Raises:
+            KeyError: Если пул не зарегистрирован
+        """
+        return self._services['board_pool']
+    
+    def get_board_size(self) -> Tuple[int, int]:
+        """Получить размер досок новых партий.
+        
+        Returns:
+            Tuple[int, int]: Ширина и высота (по умолчанию 8x8)
+        """
+        return self._services.get('board_size', (8, 8))
+    
+    def get_metrics(self) -> Metrics:
+        """Получить метрики.
+        
+        Returns:
+            Metrics: Зарегистрированные метрики или NullMetrics
+        """
+        return self._services.get('metrics', _NULL_METRICS)
+    
+    def has_board_pool(self) -> bool:
+        """Проверить, зарегистрирован ли пул готовых досок.
+        
+        Returns:
+            bool: True, если пул зарегистрирован
+        """
+        return 'board_pool' in self._services
+    
     def get_services(self) -> Dict[str, Any]:
         """Получить все зарегистрированные сервисы.
         
@@ -169,3 +263,14 @@ class ServiceContainer:
             Dict[str, Any]: Словарь всех сервисов
         """
         return self._services.copy()
+    
+    def copy(self) -> 'ServiceContainer':
+        """Создать контейнер с теми же сервисами.
+        
+        Returns:
+            ServiceContainer: Новый контейнер, в котором можно заменить
+            отдельные сервисы, не затрагивая исходный
+        """
+        container = ServiceContainer()
+        container._services = self._services.copy()
+        return container
@@ -1,6 +1,9 @@
 """Главный файл игры Три-в-ряд."""
 
+from typing import Iterable, Optional, Tuple
+
 from board.board_factory import BoardFactory
+from board.cell import Cell
 from random_generator.random_provider_default import RandomProviderDefault
 from rules.swap_validator import SwapValidator
 from rules.match_finder import MatchFinder
@@ -9,15 +12,23 @@ from mechanics.match_resolver import MatchResolver
 from mechanics.gravity_engine import GravityEngine
 from scoring.score_manager import ScoreManager
 from scoring.combo_tracker import ComboTracker
+from control.game_state import GameState
 from control.game_state_builder import GameStateBuilder
 from control.service_container import ServiceContainer
 from control.game_controller import GameController
+from control.move_journal import MoveJournal
 from console_interface.console_io import ConsoleIO
+from persistence.game_archive import GameRecord
 
 
-def create_game_services() -> ServiceContainer:
+def create_game_services(seed: Optional[int] = None, width: int = 8, height: int = 8) -> ServiceContainer:
     """Создать контейнер с игровыми сервисами.
     
+    Args:
+        seed: Начальное значение поставщика случайностей (None для системного)
+        width: Ширина доски
+        height: Высота доски
+        
     Returns:
         ServiceContainer: Контейнер с зарегистрированными сервисами
     """
@@ -30,8 +41,9 @@ def create_game_services() -> ServiceContainer:
     container.register_gravity_engine(GravityEngine())
     container.register_score_manager(ScoreManager())
     container.register_combo_tracker(ComboTracker())
-    container.register_random_provider(RandomProviderDefault())
+    container.register_random_provider(RandomProviderDefault(seed))
     container.register_move_generator(MoveGenerator())
+    container.register_board_size(width, height)
     
     return container
 
@@ -44,12 +56,19 @@ def initialize_game(services: ServiceContainer):
         
     Returns:
         GameState: Начальное состояние игры
+        
+    Note:
+        Доска из зарегистрированного пула не зависит от seed поставщика
+        случайностей, поэтому такую партию нельзя воспроизвести по seed
     """
-    random_provider = services.get_random_provider()
-    match_finder = services.get_match_finder()
-    
-    # Создаём доску без начальных совпадений
-    board = BoardFactory.create_board_without_matches(random_provider, match_finder)
+    # Создаём доску без начальных совпадений и хотя бы с одним ходом
+    if services.has_board_pool():
+        board = services.get_board_pool().acquire()
+    else:
+        width, height = services.get_board_size()
+        board = BoardFactory.create_board_constructive(
+            services.get_random_provider(), services.get_move_generator(), width, height
+        )
     
     # Создаём начальное состояние игры
     game_state = (GameStateBuilder()
@@ -61,6 +80,78 @@ def initialize_game(services: ServiceContainer):
     return game_state
 
 
+def replay_game(seed: int, moves: Iterable[Tuple[Cell, Cell]]):
+    """Воспроизвести партию по seed и списку ходов.
+    
+    Args:
+        seed: Seed партии, с которым создавались сервисы
+        moves: Ходы в порядке выполнения (например, MoveJournal.moves())
+        
+    Returns:
+        GameState: Состояние после всех ходов с журналом для отмены
+        
+    Raises:
+        ValueError: Если очередной ход невалиден, то есть партия
+            не соответствует seed
+    """
+    services = create_game_services(seed)
+    game_state = initialize_game(services)
+    game_state.journal = MoveJournal(seed)
+    game_controller = GameController(services)
+    
+    for number, (a, b) in enumerate(moves, start=1):
+        if not game_controller.perform_move(game_state, a, b):
+            raise ValueError(f"Ход {number} ({a}, {b}) невалиден для seed {seed}")
+        game_controller.update_moves_available(game_state)
+    
+    return game_state
+
+
+def _snapshot(game_state) -> GameState:
+    """Снять копию состояния для записи в архив.
+    
+    Args:
+        game_state: Текущее состояние игры
+        
+    Returns:
+        GameState: Состояние с копией доски
+    """
+    return GameState(board=game_state.board.clone(), score=game_state.score,
+                     moves_available=game_state.moves_available)
+
+
+def record_game(seed: int, moves: Iterable[Tuple[Cell, Cell]], snapshot_interval: int = 16) -> GameRecord:
+    """Воспроизвести партию и подготовить запись для архива.
+    
+    Args:
+        seed: Seed партии, с которым создавались сервисы
+        moves: Ходы в порядке выполнения
+        snapshot_interval: Через сколько ходов сохранять снимок доски
+        
+    Returns:
+        GameRecord: Запись с ходами, итоговым счётом и снимками
+        
+    Raises:
+        ValueError: Если очередной ход невалиден для seed
+    """
+    services = create_game_services(seed)
+    game_state = initialize_game(services)
+    game_controller = GameController(services)
+    snapshots = [_snapshot(game_state)]
+    played = []
+    
+    for number, (a, b) in enumerate(moves, start=1):
+        if not game_controller.perform_move(game_state, a, b):
+            raise ValueError(f"Ход {number} ({a}, {b}) невалиден для seed {seed}")
+        game_controller.update_moves_available(game_state)
+        played.append((a, b))
+        if number % snapshot_interval == 0:
+            snapshots.append(_snapshot(game_state))
+    
+    return GameRecord(seed=seed, moves=tuple(played), final_score=game_state.score,
+                      snapshots=tuple(snapshots))
+
+
 def play_game():
     """Основная функция игры."""
     console_io = ConsoleIO()
@@ -80,7 +171,7 @@ def play_game():
             
             # Читаем ход игрока
             try:
-                cell1, cell2 = console_io.read_move()
+                cell1, cell2 = console_io.read_move(game_state.board.width(), game_state.board.height())
                 
                 # Выполняем ход
                 success = game_controller.perform_move(game_state, cell1, cell2)
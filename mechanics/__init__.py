@@ -2,8 +2,10 @@
 
 from .match_resolver import MatchResolver
 from .gravity_engine import GravityEngine
+from .column_gravity_engine import ColumnGravityEngine
 
 __all__ = [
     'MatchResolver',
-    'GravityEngine'
+    'GravityEngine',
+    'ColumnGravityEngine'
 ]
@@ -0,0 +1,177 @@
+"""Движок гравитации, работающий со столбцами компактной доски."""
+
+import weakref
+from typing import Dict
+
+from board.compact_board import CompactBoard
+from board.tile_kind import EMPTY_CODE
+from .gravity_engine import GravityEngine
+
+try:
+    import numpy as np
+except ImportError:  # NumPy нужен только для векторного режима
+    np = None
+
+
+class ColumnGravityEngine(GravityEngine):
+    """Движок гравитации на сырых столбцах CompactBoard.
+    
+    Обрабатываются только столбцы с пустыми ячейками. После гравитации
+    запоминается глубина пустого префикса каждого столбца, поэтому refill
+    записывает только этот префикс. Порядок запросов к поставщику
+    случайностей совпадает с GravityEngine. Доски других типов
+    обрабатываются базовой реализацией.
+    """
+    
+    def __init__(self, use_numpy: bool = False):
+        """Инициализировать движок.
+        
+        Args:
+            use_numpy: Обрабатывать все столбцы сразу средствами NumPy
+            
+        Raises:
+            ImportError: Если запрошен режим NumPy, а пакет не установлен
+        """
+        if use_numpy and np is None:
+            raise ImportError("Для use_numpy=True требуется пакет numpy")
+        
+        self._use_numpy = use_numpy
+        self._pending_board = None
+        self._pending_version = None
+        self._hole_depths: Dict[int, int] = {}
+    
+    @staticmethod
+    def numpy_available() -> bool:
+        """Проверить, доступен ли векторный режим.
+        
+        Returns:
+            bool: True если установлен NumPy
+        """
+        return np is not None
+    
+    def apply_gravity(self, board) -> None:
+        """Применить гравитацию ко всем столбцам.
+        
+        Args:
+            board: Доска для обработки
+        """
+        if not isinstance(board, CompactBoard):
+            super().apply_gravity(board)
+            return
+        
+        codes = board.codes()
+        if EMPTY_CODE not in codes:
+            self._remember_holes(board, {})
+            return
+        
+        if self._use_numpy:
+            hole_depths = self._apply_gravity_numpy(codes, board.width(), board.height())
+        else:
+            hole_depths = self._apply_gravity_columns(codes, board.width(), board.height())
+        
+        board.mark_modified()
+        self._remember_holes(board, hole_depths)
+    
+    def refill(self, board, random) -> None:
+        """Заполнить пустые ячейки новыми фишками.
+        
+        Args:
+            board: Доска для заполнения
+            random: Поставщик случайных фишек
+        """
+        if not isinstance(board, CompactBoard):
+            super().refill(board, random)
+            return
+        
+        codes = board.codes()
+        width = board.width()
+        
+        if self._holes_known(board):
+            # Пустые ячейки образуют верхний префикс столбца, поэтому
+            # фишки пишутся срезом с шагом width
+            columns = sorted(self._hole_depths)
+            drawn = bytearray(sum(self._hole_depths[col] for col in columns))
+            random.fill_codes(drawn)
+            start = 0
+            for col in columns:
+                depth = self._hole_depths[col]
+                codes[col:col + depth * width:width] = drawn[start:start + depth]
+                start += depth
+        else:
+            empty = [index for col in range(width) for index in range(col, len(codes), width)
+                     if codes[index] == EMPTY_CODE]
+            drawn = bytearray(len(empty))
+            random.fill_codes(drawn)
+            for index, code in zip(empty, drawn):
+                codes[index] = code
+        
+        board.mark_modified()
+        self._pending_board = None
+    
+    def _apply_gravity_columns(self, codes: bytearray, width: int, height: int) -> Dict[int, int]:
+        """Сжать столбцы с пустыми ячейками по одному.
+        
+        Args:
+            codes: Буфер кодов доски
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            Dict[int, int]: Глубина пустого префикса для изменённых столбцов
+        """
+        hole_depths = {}
+        for col in range(width):
+            column = codes[col::width]
+            if EMPTY_CODE not in column:
+                continue
+            
+            tiles = column.replace(b'\x00', b'')
+            depth = height - len(tiles)
+            codes[col::width] = bytes(depth) + tiles
+            hole_depths[col] = depth
+        return hole_depths
+    
+    def _apply_gravity_numpy(self, codes: bytearray, width: int, height: int) -> Dict[int, int]:
+        """Сжать все столбцы сразу устойчивой сортировкой по признаку заполненности.
+        
+        Args:
+            codes: Буфер кодов доски
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            Dict[int, int]: Глубина пустого префикса для изменённых столбцов
+        """
+        grid = np.frombuffer(codes, dtype=np.uint8).reshape(height, width)
+        filled = grid != EMPTY_CODE
+        
+        # Устойчивая сортировка ставит пустые ячейки наверх, не меняя порядок фишек
+        order = np.argsort(filled, axis=0, kind='stable')
+        grid[...] = np.take_along_axis(grid, order, axis=0)
+        
+        depths = height - filled.sum(axis=0)
+        return {int(col): int(depths[col]) for col in np.flatnonzero(depths)}
+    
+    def _remember_holes(self, board: CompactBoard, hole_depths: Dict[int, int]) -> None:
+        """Запомнить пустые префиксы столбцов для следующего refill.
+        
+        Args:
+            board: Обработанная доска
+            hole_depths: Глубина пустого префикса по столбцам
+        """
+        self._pending_board = weakref.ref(board)
+        self._pending_version = board.version()
+        self._hole_depths = hole_depths
+    
+    def _holes_known(self, board: CompactBoard) -> bool:
+        """Проверить, что запомненные префиксы относятся к этой доске.
+        
+        Args:
+            board: Доска для заполнения
+            
+        Returns:
+            bool: True если доска не менялась после apply_gravity
+        """
+        return (self._pending_board is not None and
+                self._pending_board() is board and
+                self._pending_version == board.version())
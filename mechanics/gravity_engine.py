@@ -3,6 +3,7 @@
 from typing import List, Optional
 
 from board.mutable_board import MutableBoard
+from board.cell import Cell
 from board.tile import Tile
 
 
@@ -28,13 +29,14 @@ class GravityEngine:
             board: Доска для заполнения
             random: Поставщик случайных фишек
         """
-        for col in range(board.width()):
-            for row in range(board.height()):
-                from board.cell import Cell
-                cell = Cell(row, col)
-                if board.tile_at(cell) is None:
-                    tile_kind = random.next_tile_kind()
-                    board.set_tile(cell, Tile(tile_kind))
+        empty = [cell for cell in (Cell.of(row, col)
+                                   for col in range(board.width())
+                                   for row in range(board.height()))
+                 if board.tile_at(cell) is None]
+        
+        # Фишки запрашиваются одним пакетом в порядке обхода по столбцам
+        for cell, tile_kind in zip(empty, random.next_tile_kinds(len(empty))):
+            board.set_tile(cell, Tile.of(tile_kind))
     
     def _apply_gravity_to_column(self, board: MutableBoard, col: int) -> None:
         """Применить гравитацию к одному столбцу.
@@ -46,8 +48,7 @@ class GravityEngine:
         # Собираем все фишки в столбце
         column_tiles = []
         for row in range(board.height()):
-            from board.cell import Cell
-            cell = Cell(row, col)
+            cell = Cell.of(row, col)
             tile = board.tile_at(cell)
             column_tiles.append(tile)
         
@@ -56,8 +57,7 @@ class GravityEngine:
         
         # Заполняем столбец сжатыми фишками
         for row in range(board.height()):
-            from board.cell import Cell
-            cell = Cell(row, col)
+            cell = Cell.of(row, col)
             board.set_tile(cell, compacted_tiles[row])
     
     def _compact_column(self, tiles: List[Optional[Tile]]) -> List[Optional[Tile]]:
@@ -3,6 +3,7 @@
 from typing import Set
 
 from board.mutable_board import MutableBoard
+from board.bit_board import BitBoard
 from board.cell import Cell
 
 
@@ -24,6 +25,14 @@ class MatchResolver:
         """
         self._validate_match_groups(board, matches)
         
+        # Битовая доска удаляет все группы одной очисткой масок
+        if isinstance(board, BitBoard):
+            cells = 0
+            for group in matches:
+                for cell in group:
+                    cells |= 1 << (cell.row() * board.width() + cell.col())
+            return board.clear_cells(cells)
+        
         total_removed = 0
         
         for group in matches:
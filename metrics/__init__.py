@@ -0,0 +1,18 @@
+"""Пакет для метрик горячих путей."""
+
+from .histogram import Histogram
+from .metrics import Metrics
+from .null_metrics import NullMetrics
+from .metrics_registry import MetricsRegistry
+from .exporters import to_json, to_prometheus
+from .metrics_http_server import MetricsHttpServer
+
+__all__ = [
+    'Histogram',
+    'Metrics',
+    'NullMetrics',
+    'MetricsRegistry',
+    'to_json',
+    'to_prometheus',
+    'MetricsHttpServer'
+]
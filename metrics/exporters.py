@@ -0,0 +1,107 @@
+"""Выгрузка снимка метрик в JSON и текстовый формат Prometheus."""
+
+import json
+import re
+from typing import List
+
+from .histogram import Histogram
+from .metrics import Metrics
+
+
+_NANOS_PER_SECOND = 1e9
+# Границы le - концы двоичных октав, они совпадают с границами корзин
+# Histogram, поэтому накопленные количества точные. Набор границ
+# постоянный, как требует Prometheus
+_TIMER_BOUNDS = [(1 << bits) - 1 for bits in range(10, 35)]
+_VALUE_BOUNDS = [(1 << bits) - 1 for bits in range(0, 17)]
+
+
+def to_json(metrics: Metrics, indent: int = None) -> str:
+    """Выгрузить снимок метрик в JSON.
+    
+    Args:
+        metrics: Метрики
+        indent: Отступ вложенных уровней (None - одна строка)
+    
+    Returns:
+        str: Счётчики, таймеры в наносекундах и распределения
+    """
+    return json.dumps(metrics.snapshot(), ensure_ascii=False, indent=indent, sort_keys=True)
+
+
+def to_prometheus(metrics: Metrics, prefix: str = 'match3') -> str:
+    """Выгрузить метрики в текстовом формате Prometheus.
+    
+    Args:
+        metrics: Метрики
+        prefix: Префикс имён метрик
+    
+    Returns:
+        str: Счётчики как counter, таймеры как histogram в секундах,
+            распределения как histogram без единиц
+    
+    Note:
+        Таймеры выгружаются с границами от 1 мкс до 17 с, распределения -
+        от 0 до 65535, обе шкалы по октавам
+    """
+    lines: List[str] = []
+    for name, value in sorted(metrics.counters().items()):
+        metric = f'{prefix}_{_sanitize(name)}_total'
+        lines.append(f'# TYPE {metric} counter')
+        lines.append(f'{metric} {value}')
+    for name, histogram in sorted(metrics.timers().items()):
+        _append_histogram(lines, f'{prefix}_{_sanitize(name)}_seconds', histogram,
+                          _TIMER_BOUNDS, _NANOS_PER_SECOND)
+    for name, histogram in sorted(metrics.histograms().items()):
+        _append_histogram(lines, f'{prefix}_{_sanitize(name)}', histogram, _VALUE_BOUNDS, 1)
+    return '\n'.join(lines) + '\n' if lines else ''
+
+
+def _append_histogram(lines: List[str], metric: str, histogram: Histogram,
+                      bounds: List[int], scale: float) -> None:
+    """Добавить строки одной гистограммы.
+    
+    Args:
+        lines: Строки выгрузки (дополняются)
+        metric: Имя метрики
+        histogram: Гистограмма
+        bounds: Границы le по возрастанию в единицах гистограммы
+        scale: Делитель значений (1e9 для наносекунд в секунды)
+    """
+    lines.append(f'# TYPE {metric} histogram')
+    buckets = list(histogram.buckets())
+    position = 0
+    cumulative = 0
+    for bound in bounds:
+        while position < len(buckets) and buckets[position][0] <= bound:
+            cumulative += buckets[position][1]
+            position += 1
+        lines.append(f'{metric}_bucket{{le="{_number(bound, scale)}"}} {cumulative}')
+    lines.append(f'{metric}_bucket{{le="+Inf"}} {histogram.count()}')
+    lines.append(f'{metric}_sum {_number(histogram.total(), scale)}')
+    lines.append(f'{metric}_count {histogram.count()}')
+
+
+def _number(value: int, scale: float) -> str:
+    """Представить значение в единицах выгрузки.
+    
+    Args:
+        value: Целое значение
+        scale: Делитель
+    
+    Returns:
+        str: Число без лишних нулей
+    """
+    return str(value) if scale == 1 else repr(value / scale)
+
+
+def _sanitize(name: str) -> str:
+    """Привести имя к допустимому в Prometheus.
+    
+    Args:
+        name: Имя метрики в реестре
+    
+    Returns:
+        str: Имя из латинских букв, цифр и подчёркиваний
+    """
+    return re.sub(r'[^a-zA-Z0-9_]', '_', name)
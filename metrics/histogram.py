@@ -0,0 +1,165 @@
+"""Гистограмма целых значений с логарифмическими корзинами."""
+
+from typing import Dict, Iterator, List, Tuple
+
+
+# В каждой двоичной октаве 16 корзин: относительная погрешность не больше 1/16
+_SUB_BUCKET_BITS = 4
+_SUB_BUCKETS = 1 << _SUB_BUCKET_BITS
+_LINEAR_LIMIT = _SUB_BUCKETS * 2
+
+
+class Histogram:
+    """Распределение неотрицательных целых значений.
+    
+    Значения раскладываются по фиксированным корзинам как в
+    HDR-гистограмме: до 32 точно, дальше по 16 корзин на октаву. Запись -
+    O(1) без выделения памяти, объём не зависит от числа значений.
+    """
+    
+    def __init__(self):
+        """Создать пустую гистограмму."""
+        self.clear()
+    
+    def clear(self) -> None:
+        """Удалить все значения."""
+        self._counts: List[int] = [0] * _LINEAR_LIMIT
+        self._count = 0
+        self._total = 0
+        self._max = 0
+    
+    def record(self, value: int) -> None:
+        """Учесть одно значение.
+        
+        Args:
+            value: Значение (отрицательные учитываются как 0)
+        """
+        bucket = self._bucket(value)
+        if bucket >= len(self._counts):
+            self._counts.extend([0] * (bucket + 1 - len(self._counts)))
+        self._counts[bucket] += 1
+        self._count += 1
+        self._total += value
+        if value > self._max:
+            self._max = value
+    
+    def merge(self, other: 'Histogram') -> None:
+        """Добавить значения другой гистограммы.
+        
+        Args:
+            other: Гистограмма для добавления
+        """
+        if len(other._counts) > len(self._counts):
+            self._counts.extend([0] * (len(other._counts) - len(self._counts)))
+        for bucket, count in enumerate(other._counts):
+            self._counts[bucket] += count
+        self._count += other._count
+        self._total += other._total
+        self._max = max(self._max, other._max)
+    
+    def count(self) -> int:
+        """Получить количество значений.
+        
+        Returns:
+            int: Число учтённых значений
+        """
+        return self._count
+    
+    def total(self) -> int:
+        """Получить сумму значений.
+        
+        Returns:
+            int: Сумма учтённых значений
+        """
+        return self._total
+    
+    def mean(self) -> float:
+        """Получить среднее значение.
+        
+        Returns:
+            float: Среднее (0 без значений)
+        """
+        return self._total / self._count if self._count else 0.0
+    
+    def max(self) -> int:
+        """Получить максимальное значение.
+        
+        Returns:
+            int: Максимум
+        """
+        return self._max
+    
+    def percentile(self, percent: float) -> int:
+        """Получить перцентиль.
+        
+        Args:
+            percent: Перцентиль от 0 до 100
+        
+        Returns:
+            int: Нижняя граница корзины, в которую попал перцентиль
+        """
+        if self._count == 0:
+            return 0
+        rank = max(1, round(self._count * percent / 100))
+        seen = 0
+        for bucket, count in enumerate(self._counts):
+            seen += count
+            if seen >= rank:
+                return min(self._lower_bound(bucket), self._max)
+        return self._max
+    
+    def buckets(self) -> Iterator[Tuple[int, int]]:
+        """Перебрать непустые корзины.
+        
+        Returns:
+            Iterator[Tuple[int, int]]: Пары (наибольшее значение корзины, количество)
+                по возрастанию
+        """
+        for bucket, count in enumerate(self._counts):
+            if count:
+                yield self._lower_bound(bucket + 1) - 1, count
+    
+    def summary(self) -> Dict[str, float]:
+        """Получить сводку для вывода.
+        
+        Returns:
+            Dict[str, float]: Количество, среднее, p50, p90, p99 и максимум
+        """
+        return {
+            'count': self._count,
+            'mean': round(self.mean(), 1),
+            'p50': self.percentile(50),
+            'p90': self.percentile(90),
+            'p99': self.percentile(99),
+            'max': self._max,
+        }
+    
+    @staticmethod
+    def _bucket(value: int) -> int:
+        """Найти корзину значения.
+        
+        Args:
+            value: Значение
+        
+        Returns:
+            int: Индекс корзины
+        """
+        if value < _LINEAR_LIMIT:
+            return max(value, 0)
+        exponent = value.bit_length() - _SUB_BUCKET_BITS - 1
+        return exponent * _SUB_BUCKETS + (value >> exponent)
+    
+    @staticmethod
+    def _lower_bound(bucket: int) -> int:
+        """Найти наименьшее значение корзины.
+        
+        Args:
+            bucket: Индекс корзины
+        
+        Returns:
+            int: Наименьшее значение
+        """
+        if bucket < _LINEAR_LIMIT:
+            return bucket
+        exponent = bucket // _SUB_BUCKETS - 1
+        return (bucket - exponent * _SUB_BUCKETS) << exponent
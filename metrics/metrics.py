@@ -0,0 +1,109 @@
+"""Абстрактный интерфейс сбора метрик."""
+
+from abc import ABC, abstractmethod
+from typing import Any, Callable, Dict
+
+from .histogram import Histogram
+
+
+class Metrics(ABC):
+    """Абстрактный интерфейс сбора метрик горячих путей.
+    
+    Замеры времени встраиваются обёртками функций и сервисов при
+    создании объектов, поэтому выключенные метрики не добавляют
+    проверок в горячие пути.
+    """
+    
+    @abstractmethod
+    def enabled(self) -> bool:
+        """Проверить, собираются ли метрики.
+        
+        Returns:
+            bool: True если значения записываются
+        """
+        pass
+    
+    @abstractmethod
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Увеличить счётчик.
+        
+        Args:
+            name: Имя счётчика
+            amount: Приращение
+        """
+        pass
+    
+    @abstractmethod
+    def observe(self, name: str, value: int) -> None:
+        """Учесть значение в распределении.
+        
+        Args:
+            name: Имя гистограммы
+            value: Неотрицательное целое значение
+        """
+        pass
+    
+    @abstractmethod
+    def timed(self, name: str, func: Callable) -> Callable:
+        """Обернуть функцию замером количества вызовов и времени.
+        
+        Args:
+            name: Имя таймера
+            func: Замеряемая функция
+        
+        Returns:
+            Callable: Функция с тем же поведением
+        """
+        pass
+    
+    def instrument(self, service: Any, methods: Dict[str, str]) -> Any:
+        """Обернуть методы сервиса замерами времени.
+        
+        Args:
+            service: Сервис
+            methods: Имена таймеров по именам методов
+        
+        Returns:
+            Any: Объект с теми же методами и атрибутами, что у service
+        
+        Note:
+            Реализация по умолчанию ничего не оборачивает
+        """
+        return service
+    
+    def counters(self) -> Dict[str, int]:
+        """Получить все счётчики.
+        
+        Returns:
+            Dict[str, int]: Значения по именам
+        """
+        return {}
+    
+    def timers(self) -> Dict[str, Histogram]:
+        """Получить все таймеры.
+        
+        Returns:
+            Dict[str, Histogram]: Время вызовов в наносекундах по именам
+        """
+        return {}
+    
+    def histograms(self) -> Dict[str, Histogram]:
+        """Получить все распределения.
+        
+        Returns:
+            Dict[str, Histogram]: Гистограммы по именам
+        """
+        return {}
+    
+    def snapshot(self) -> Dict[str, Dict[str, Any]]:
+        """Получить текущие значения метрик.
+        
+        Returns:
+            Dict[str, Dict[str, Any]]: Счётчики, сводки таймеров в
+                наносекундах и сводки распределений
+        """
+        return {
+            'counters': self.counters(),
+            'timers': {name: histogram.summary() for name, histogram in self.timers().items()},
+            'histograms': {name: histogram.summary() for name, histogram in self.histograms().items()},
+        }
@@ -0,0 +1,74 @@
+"""HTTP-точка для локального сбора метрик."""
+
+import threading
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Optional, Tuple
+
+from .exporters import to_json, to_prometheus
+from .metrics import Metrics
+
+
+class MetricsHttpServer:
+    """HTTP-сервер метрик в фоновом потоке.
+    
+    GET /metrics отдаёт текстовый формат Prometheus, GET /metrics.json -
+    снимок в JSON. Предназначен для локального сбора, не для внешней сети.
+    """
+    
+    def __init__(self, metrics: Metrics, host: str = '127.0.0.1', port: int = 0):
+        """Создать сервер.
+        
+        Args:
+            metrics: Выгружаемые метрики
+            host: Адрес
+            port: Порт (0 - выбрать свободный)
+        """
+        self._metrics = metrics
+        self._host = host
+        self._port = port
+        self._server: Optional[ThreadingHTTPServer] = None
+        self._thread: Optional[threading.Thread] = None
+    
+    def start(self) -> None:
+        """Начать принимать запросы."""
+        metrics = self._metrics
+        
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                if self.path == '/metrics':
+                    body, content_type = to_prometheus(metrics), 'text/plain; version=0.0.4'
+                elif self.path == '/metrics.json':
+                    body, content_type = to_json(metrics), 'application/json'
+                else:
+                    self.send_error(404)
+                    return
+                payload = body.encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', f'{content_type}; charset=utf-8')
+                self.send_header('Content-Length', str(len(payload)))
+                self.end_headers()
+                self.wfile.write(payload)
+            
+            def log_message(self, format, *args):
+                pass
+        
+        self._server = ThreadingHTTPServer((self._host, self._port), Handler)
+        self._thread = threading.Thread(target=self._server.serve_forever, daemon=True)
+        self._thread.start()
+    
+    def address(self) -> Tuple[str, int]:
+        """Получить адрес, на котором слушает сервер.
+        
+        Returns:
+            Tuple[str, int]: (host, port)
+        """
+        return self._server.server_address[:2]
+    
+    def close(self) -> None:
+        """Остановить сервер и дождаться потока."""
+        if self._server is not None:
+            self._server.shutdown()
+            self._server.server_close()
+            self._thread.join()
+            self._server = None
+            self._thread = None
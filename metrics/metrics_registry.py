@@ -0,0 +1,182 @@
+"""Метрики в памяти процесса: счётчики, таймеры и распределения."""
+
+import time
+from functools import wraps
+from typing import Any, Callable, Dict
+
+from .histogram import Histogram
+from .metrics import Metrics
+
+
+class _InstrumentedService:
+    """Обёртка сервиса, замеряющая выбранные методы.
+    
+    Замеряемые методы подменяются атрибутами экземпляра, остальные
+    атрибуты читаются у исходного сервиса.
+    """
+    
+    def __init__(self, service: Any, wrapped: Dict[str, Callable]):
+        """Создать обёртку.
+        
+        Args:
+            service: Исходный сервис
+            wrapped: Обёрнутые методы по именам
+        """
+        self._service = service
+        self.__dict__.update(wrapped)
+    
+    def __getattr__(self, name: str) -> Any:
+        return getattr(self._service, name)
+
+
+class MetricsRegistry(Metrics):
+    """Метрики, собираемые в памяти процесса.
+    
+    Таймеры хранят время вызовов в наносекундах в Histogram, количество
+    вызовов - это число значений таймера. Распределения (глубина каскада,
+    число удалённых фишек) хранятся такими же гистограммами.
+    """
+    
+    def __init__(self):
+        """Создать пустой реестр."""
+        self._counters: Dict[str, int] = {}
+        self._timers: Dict[str, Histogram] = {}
+        self._histograms: Dict[str, Histogram] = {}
+    
+    def enabled(self) -> bool:
+        """Проверить, собираются ли метрики.
+        
+        Returns:
+            bool: Всегда True
+        """
+        return True
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Увеличить счётчик.
+        
+        Args:
+            name: Имя счётчика
+            amount: Приращение
+        """
+        self._counters[name] = self._counters.get(name, 0) + amount
+    
+    def observe(self, name: str, value: int) -> None:
+        """Учесть значение в распределении.
+        
+        Args:
+            name: Имя гистограммы
+            value: Неотрицательное целое значение
+        """
+        self.histogram(name).record(value)
+    
+    def timed(self, name: str, func: Callable) -> Callable:
+        """Обернуть функцию замером количества вызовов и времени.
+        
+        Args:
+            name: Имя таймера
+            func: Замеряемая функция
+        
+        Returns:
+            Callable: Функция с тем же поведением
+        """
+        histogram = self.timer(name)
+        clock = time.perf_counter_ns
+        
+        @wraps(func)
+        def wrapper(*args, **kwargs):
+            started = clock()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.record(clock() - started)
+        return wrapper
+    
+    def instrument(self, service: Any, methods: Dict[str, str]) -> Any:
+        """Обернуть методы сервиса замерами времени.
+        
+        Args:
+            service: Сервис
+            methods: Имена таймеров по именам методов
+        
+        Returns:
+            Any: Обёртка с теми же методами и атрибутами, что у service
+        """
+        wrapped = {method: self.timed(name, getattr(service, method))
+                   for method, name in methods.items()}
+        return _InstrumentedService(service, wrapped)
+    
+    def counter(self, name: str) -> int:
+        """Получить значение счётчика.
+        
+        Args:
+            name: Имя счётчика
+        
+        Returns:
+            int: Значение (0 для неизвестного счётчика)
+        """
+        return self._counters.get(name, 0)
+    
+    def timer(self, name: str) -> Histogram:
+        """Получить гистограмму таймера, создав её при необходимости.
+        
+        Args:
+            name: Имя таймера
+        
+        Returns:
+            Histogram: Время вызовов в наносекундах
+        """
+        histogram = self._timers.get(name)
+        if histogram is None:
+            histogram = self._timers[name] = Histogram()
+        return histogram
+    
+    def histogram(self, name: str) -> Histogram:
+        """Получить гистограмму распределения, создав её при необходимости.
+        
+        Args:
+            name: Имя гистограммы
+        
+        Returns:
+            Histogram: Распределение значений
+        """
+        histogram = self._histograms.get(name)
+        if histogram is None:
+            histogram = self._histograms[name] = Histogram()
+        return histogram
+    
+    def timers(self) -> Dict[str, Histogram]:
+        """Получить все таймеры.
+        
+        Returns:
+            Dict[str, Histogram]: Гистограммы времени по именам
+        """
+        return dict(self._timers)
+    
+    def histograms(self) -> Dict[str, Histogram]:
+        """Получить все распределения.
+        
+        Returns:
+            Dict[str, Histogram]: Гистограммы по именам
+        """
+        return dict(self._histograms)
+    
+    def counters(self) -> Dict[str, int]:
+        """Получить все счётчики.
+        
+        Returns:
+            Dict[str, int]: Значения по именам
+        """
+        return dict(self._counters)
+    
+    def reset(self) -> None:
+        """Обнулить все значения.
+        
+        Note:
+            Гистограммы очищаются на месте: созданные ранее обёртки
+            продолжают писать в них
+        """
+        self._counters.clear()
+        for histogram in self._timers.values():
+            histogram.clear()
+        for histogram in self._histograms.values():
+            histogram.clear()
@@ -0,0 +1,50 @@
+"""Выключенные метрики."""
+
+from typing import Callable
+
+from .metrics import Metrics
+
+
+class NullMetrics(Metrics):
+    """Метрики, которые ничего не записывают.
+    
+    timed и instrument возвращают исходные объекты, поэтому замеряемые
+    вызовы выполняются без обёрток. Остальные методы пустые, снимок
+    не содержит значений.
+    """
+    
+    def enabled(self) -> bool:
+        """Проверить, собираются ли метрики.
+        
+        Returns:
+            bool: Всегда False
+        """
+        return False
+    
+    def increment(self, name: str, amount: int = 1) -> None:
+        """Ничего не делать.
+        
+        Args:
+            name: Имя счётчика
+            amount: Приращение
+        """
+    
+    def observe(self, name: str, value: int) -> None:
+        """Ничего не делать.
+        
+        Args:
+            name: Имя гистограммы
+            value: Значение
+        """
+    
+    def timed(self, name: str, func: Callable) -> Callable:
+        """Вернуть функцию без обёртки.
+        
+        Args:
+            name: Имя таймера
+            func: Функция
+        
+        Returns:
+            Callable: Та же функция
+        """
+        return func
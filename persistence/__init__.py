@@ -0,0 +1,12 @@
+"""Пакет для сохранения и восстановления игровых данных."""
+
+from .game_state_serializer import GameStateSerializer
+from .game_archive import GameRecord, ArchiveLayout, GameArchiveWriter, GameArchive
+
+__all__ = [
+    'GameStateSerializer',
+    'GameRecord',
+    'ArchiveLayout',
+    'GameArchiveWriter',
+    'GameArchive'
+]
@@ -0,0 +1,376 @@
+"""Архив завершённых партий из записей фиксированного размера."""
+
+import mmap
+import os
+import struct
+from dataclasses import dataclass
+from typing import Iterator, Optional, Tuple
+
+from board.cell import Cell
+from control.game_state import GameState
+from .game_state_serializer import GameStateSerializer
+
+
+# Заголовок файла: сигнатура, версия, резерв, ширина, высота,
+# максимум ходов, интервал снимков и размер записи
+_FILE_HEADER = struct.Struct('<4sBBHHHHI')
+_FILE_MAGIC = b'M3GA'
+_FILE_VERSION = 1
+
+# Заголовок записи: seed, итоговый счёт, число ходов и число снимков
+_RECORD_HEADER = struct.Struct('<QQHH')
+
+# Ход упаковывается в uint16: индекс первой ячейки << 1 | признак вертикали
+_MOVE_SIZE = 2
+_UINT16_MAX = 0xFFFF
+_UINT64_LIMIT = 1 << 64
+
+
+@dataclass(frozen=True)
+class GameRecord:
+    """Запись о завершённой партии.
+    
+    Снимок с номером k - состояние после k * snapshot_interval ходов,
+    нулевой снимок - начальная доска.
+    """
+    
+    seed: int
+    moves: Tuple[Tuple[Cell, Cell], ...]
+    final_score: int
+    snapshots: Tuple[GameState, ...] = ()
+
+
+@dataclass(frozen=True)
+class ArchiveLayout:
+    """Параметры, определяющие размер записи архива."""
+    
+    width: int = 8
+    height: int = 8
+    max_moves: int = 256
+    snapshot_interval: int = 16
+    
+    def __post_init__(self):
+        """Валидация после инициализации."""
+        if self.width <= 0 or self.height <= 0 or self.snapshot_interval <= 0:
+            raise ValueError("Размер доски и интервал снимков должны быть положительными")
+        if not 0 <= self.max_moves <= _UINT16_MAX:
+            raise ValueError("Максимум ходов должен помещаться в uint16")
+        # Наибольший упакованный ход: индекс последней ячейки << 1 | 1
+        if self.width * self.height * 2 - 1 > _UINT16_MAX:
+            raise ValueError(f"Ходы доски {self.width}x{self.height} не помещаются в uint16")
+    
+    def snapshot_slots(self) -> int:
+        """Получить количество мест под снимки в записи.
+        
+        Returns:
+            int: Начальный снимок и по одному на каждый интервал
+        """
+        return self.max_moves // self.snapshot_interval + 1
+    
+    def record_size(self) -> int:
+        """Получить размер записи архива.
+        
+        Returns:
+            int: Размер в байтах
+        """
+        return (_RECORD_HEADER.size + self.max_moves * _MOVE_SIZE +
+                self.snapshot_slots() * GameStateSerializer.record_size(self.width, self.height))
+
+
+class GameArchiveWriter:
+    """Запись партий в конец архива.
+    
+    Каждая партия занимает запись одного размера, поэтому её смещение
+    вычисляется по индексу без индекса и разбора соседних записей.
+    """
+    
+    def __init__(self, path: str, layout: Optional[ArchiveLayout] = None):
+        """Открыть архив для дозаписи, создав его при отсутствии.
+        
+        Args:
+            path: Путь к файлу архива
+            layout: Параметры записей (по умолчанию ArchiveLayout())
+        
+        Raises:
+            ValueError: Если существующий архив имеет другие параметры
+        """
+        self._layout = layout if layout is not None else ArchiveLayout()
+        self._serializer = GameStateSerializer()
+        self._buffer = bytearray(self._layout.record_size())
+        
+        exists = os.path.exists(path) and os.path.getsize(path) > 0
+        if exists:
+            with GameArchive(path) as archive:
+                if archive.layout() != self._layout:
+                    raise ValueError("Параметры архива не совпадают с указанными")
+                count = len(archive)
+            # Недописанный после аварийного завершения хвост отрезается,
+            # иначе все новые записи читались бы со сдвигом
+            os.truncate(path, _FILE_HEADER.size + count * self._layout.record_size())
+        
+        self._file = open(path, 'ab')
+        if not exists:
+            self._file.write(_FILE_HEADER.pack(
+                _FILE_MAGIC, _FILE_VERSION, 0, self._layout.width, self._layout.height,
+                self._layout.max_moves, self._layout.snapshot_interval, self._layout.record_size()))
+    
+    def layout(self) -> ArchiveLayout:
+        """Получить параметры записей.
+        
+        Returns:
+            ArchiveLayout: Параметры архива
+        """
+        return self._layout
+    
+    def append(self, record: GameRecord) -> None:
+        """Дописать партию в конец архива.
+        
+        Args:
+            record: Запись о партии
+        
+        Raises:
+            ValueError: Если seed или счёт не помещаются в uint64, ходов или
+                снимков больше, чем помещается в запись, размер доски снимка
+                не совпадает с архивом, либо ход не является свопом соседних
+                ячеек доски
+        """
+        layout = self._layout
+        if not 0 <= record.seed < _UINT64_LIMIT:
+            raise ValueError(f"Seed {record.seed} не помещается в uint64")
+        if not 0 <= record.final_score < _UINT64_LIMIT:
+            raise ValueError(f"Счёт {record.final_score} не помещается в uint64")
+        if len(record.moves) > layout.max_moves:
+            raise ValueError(f"Партия длиннее {layout.max_moves} ходов")
+        if len(record.snapshots) > layout.snapshot_slots():
+            raise ValueError(f"В записи помещается не более {layout.snapshot_slots()} снимков")
+        for snapshot in record.snapshots:
+            if (snapshot.board.width(), snapshot.board.height()) != (layout.width, layout.height):
+                raise ValueError(f"Снимок доски {snapshot.board.width()}x{snapshot.board.height()} "
+                                 f"не подходит архиву {layout.width}x{layout.height}")
+        
+        buffer = self._buffer
+        buffer[:] = bytes(len(buffer))
+        _RECORD_HEADER.pack_into(buffer, 0, record.seed, record.final_score,
+                                 len(record.moves), len(record.snapshots))
+        
+        offset = _RECORD_HEADER.size
+        packed = [self._pack_move(a, b) for a, b in record.moves]
+        struct.pack_into(f'<{len(packed)}H', buffer, offset, *packed)
+        
+        offset += layout.max_moves * _MOVE_SIZE
+        for snapshot in record.snapshots:
+            offset += self._serializer.encode_into(snapshot, buffer, offset)
+        self._file.write(buffer)
+    
+    def flush(self) -> None:
+        """Сбросить записанные партии на диск."""
+        self._file.flush()
+    
+    def close(self) -> None:
+        """Закрыть архив."""
+        self._file.close()
+    
+    def __enter__(self) -> 'GameArchiveWriter':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _pack_move(self, a: Cell, b: Cell) -> int:
+        """Упаковать своп соседних ячеек.
+        
+        Args:
+            a: Первая ячейка
+            b: Вторая ячейка
+        
+        Returns:
+            int: Индекс верхней левой ячейки << 1 | признак вертикального свопа
+        
+        Raises:
+            ValueError: Если ячейки не соседние или вне доски архива
+        """
+        if not a.is_adjacent(b):
+            raise ValueError(f"Ход ({a}, {b}) не является свопом соседних ячеек")
+        if not (a.is_valid(self._layout.width, self._layout.height) and
+                b.is_valid(self._layout.width, self._layout.height)):
+            raise ValueError(f"Ход ({a}, {b}) вне доски архива")
+        first = min(a, b, key=lambda cell: (cell.row(), cell.col()))
+        vertical = a.col() == b.col()
+        return (first.row() * self._layout.width + first.col()) << 1 | int(vertical)
+
+
+class GameArchive:
+    """Чтение архива партий через отображение файла в память.
+    
+    Записи читаются по смещению header + index * record_size прямо из
+    mmap, поэтому доступ по индексу не зависит от размера архива,
+    а последовательный обход идёт со скоростью чтения диска.
+    
+    Note:
+        Партии, дописанные после открытия, видны только после reopen()
+    """
+    
+    def __init__(self, path: str):
+        """Открыть архив только для чтения.
+        
+        Args:
+            path: Путь к файлу архива
+        
+        Raises:
+            ValueError: Если файл не является архивом партий
+        """
+        self._path = path
+        self._serializer = GameStateSerializer()
+        self._file = None
+        self._map = None
+        self.reopen()
+    
+    def reopen(self) -> None:
+        """Переоткрыть архив, чтобы увидеть дописанные партии.
+        
+        Raises:
+            ValueError: Если файл не является архивом партий
+        """
+        self.close()
+        self._file = open(self._path, 'rb')
+        self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+        if len(self._map) < _FILE_HEADER.size:
+            self.close()
+            raise ValueError("Файл слишком мал для архива партий")
+        
+        magic, version, _, width, height, max_moves, interval, record_size = \
+            _FILE_HEADER.unpack_from(self._map, 0)
+        if magic != _FILE_MAGIC or version != _FILE_VERSION:
+            self.close()
+            raise ValueError("Файл не является архивом партий поддерживаемой версии")
+        
+        self._layout = ArchiveLayout(width, height, max_moves, interval)
+        if record_size != self._layout.record_size():
+            self.close()
+            raise ValueError("Размер записи архива не соответствует параметрам")
+        
+        self._record_size = record_size
+        # Недописанный хвост после аварийного завершения не считается записью
+        self._count = (len(self._map) - _FILE_HEADER.size) // record_size
+    
+    def layout(self) -> ArchiveLayout:
+        """Получить параметры записей.
+        
+        Returns:
+            ArchiveLayout: Параметры архива
+        """
+        return self._layout
+    
+    def __len__(self) -> int:
+        return self._count
+    
+    def __getitem__(self, index: int) -> GameRecord:
+        return self.record(index)
+    
+    def __iter__(self) -> Iterator[GameRecord]:
+        return self.iter_records()
+    
+    def record(self, index: int, snapshots: bool = True) -> GameRecord:
+        """Прочитать партию по индексу.
+        
+        Args:
+            index: Индекс партии (отрицательный отсчитывается с конца)
+            snapshots: Декодировать ли снимки досок
+        
+        Returns:
+            GameRecord: Запись о партии
+        
+        Raises:
+            IndexError: Если индекс вне архива
+        """
+        if index < 0:
+            index += self._count
+        if not 0 <= index < self._count:
+            raise IndexError("Индекс партии вне архива")
+        return self._read(self._offset(index), snapshots)
+    
+    def iter_records(self, snapshots: bool = False) -> Iterator[GameRecord]:
+        """Последовательно перебрать партии.
+        
+        Args:
+            snapshots: Декодировать ли снимки досок
+        
+        Returns:
+            Iterator[GameRecord]: Партии в порядке записи
+        """
+        for index in range(self._count):
+            yield self._read(self._offset(index), snapshots)
+    
+    def iter_scores(self) -> Iterator[Tuple[int, int]]:
+        """Перебрать seed и итоговый счёт партий без разбора ходов.
+        
+        Returns:
+            Iterator[Tuple[int, int]]: Пары (seed, итоговый счёт)
+        """
+        for index in range(self._count):
+            seed, score, _, _ = _RECORD_HEADER.unpack_from(self._map, self._offset(index))
+            yield seed, score
+    
+    def close(self) -> None:
+        """Закрыть отображение и файл."""
+        if self._map is not None:
+            self._map.close()
+            self._map = None
+        if self._file is not None:
+            self._file.close()
+            self._file = None
+    
+    def __enter__(self) -> 'GameArchive':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+    
+    def _offset(self, index: int) -> int:
+        """Получить смещение записи в файле.
+        
+        Args:
+            index: Индекс партии
+        
+        Returns:
+            int: Смещение в байтах
+        """
+        return _FILE_HEADER.size + index * self._record_size
+    
+    def _read(self, offset: int, snapshots: bool) -> GameRecord:
+        """Прочитать запись по смещению.
+        
+        Args:
+            offset: Смещение записи
+            snapshots: Декодировать ли снимки досок
+        
+        Returns:
+            GameRecord: Запись о партии
+        """
+        layout = self._layout
+        seed, score, move_count, snapshot_count = _RECORD_HEADER.unpack_from(self._map, offset)
+        offset += _RECORD_HEADER.size
+        packed = struct.unpack_from(f'<{move_count}H', self._map, offset)
+        moves = tuple(self._unpack_move(value) for value in packed)
+        
+        states = ()
+        if snapshots:
+            offset += layout.max_moves * _MOVE_SIZE
+            size = GameStateSerializer.record_size(layout.width, layout.height)
+            states = tuple(self._serializer.decode(self._map, offset + number * size)
+                           for number in range(snapshot_count))
+        return GameRecord(seed=seed, moves=moves, final_score=score, snapshots=states)
+    
+    def _unpack_move(self, value: int) -> Tuple[Cell, Cell]:
+        """Распаковать своп.
+        
+        Args:
+            value: Упакованный ход
+        
+        Returns:
+            Tuple[Cell, Cell]: Пара соседних ячеек
+        """
+        row, col = divmod(value >> 1, self._layout.width)
+        if value & 1:
+            return Cell.of(row, col), Cell.of(row + 1, col)
+        return Cell.of(row, col), Cell.of(row, col + 1)
@@ -0,0 +1,377 @@
+"""Компактная двоичная и JSON-сериализация состояния игры."""
+
+import json
+import struct
+from typing import Optional, Tuple, Union
+
+from board.board import Board
+from board.cell import Cell
+from board.compact_board import CompactBoard
+from board.mutable_board import MutableBoard
+from board.tile import Tile
+from board.tile_kind import TileKind, EMPTY_CODE
+from control.game_state import GameState
+from random_generator.random_provider_default import RandomProviderDefault
+
+
+Buffer = Union[bytes, bytearray, memoryview]
+
+# Заголовок состояния: сигнатура, версия, флаги, ширина, высота, счёт
+_STATE_HEADER = struct.Struct('<4sBBHHQ')
+_STATE_MAGIC = b'M3GS'
+_STATE_VERSION = 1
+_FLAG_MOVES_AVAILABLE = 0x01
+
+# Состояние генератора: сигнатура, версия формата Random, флаги,
+# 625 слов состояния Mersenne Twister и сохранённое значение gauss
+_RANDOM_HEADER = struct.Struct('<4sBB')
+_RANDOM_WORDS = struct.Struct('<625I')
+_RANDOM_GAUSS = struct.Struct('<d')
+_RANDOM_MAGIC = b'M3RG'
+_RANDOM_FLAG_GAUSS = 0x01
+_RANDOM_FLAG_BATCHED = 0x02
+
+# Восемь ячеек по 3 бита занимают ровно 3 байта
+_CELLS_PER_GROUP = 8
+_BYTES_PER_GROUP = 3
+_MAX_CODE = len(TileKind.all())
+
+# 12 бит <-> 4 кода: таблицы для упаковки и распаковки без цикла по битам
+_UNPACK_TABLE = [bytes((bits >> shift) & 0x7 for shift in (0, 3, 6, 9)) for bits in range(4096)]
+_PACK_TABLE = {codes: bits for bits, codes in enumerate(_UNPACK_TABLE)}
+
+_JSON_SYMBOLS = '.' + ''.join(kind.value for kind in TileKind.all())
+
+
+class GameStateSerializer:
+    """Сериализатор GameState и состояния RandomProviderDefault.
+    
+    Двоичная запись состояния имеет фиксированный для размера доски
+    размер: 18 байт заголовка и 3 бита на ячейку (42 байта для 8x8).
+    Декодирование читает поля через struct.unpack_from прямо из
+    переданного буфера или memoryview без промежуточных копий.
+    """
+    
+    @staticmethod
+    def record_size(width: int = 8, height: int = 8) -> int:
+        """Получить размер двоичной записи состояния.
+        
+        Args:
+            width: Ширина доски
+            height: Высота доски
+        
+        Returns:
+            int: Размер записи в байтах
+        """
+        return _STATE_HEADER.size + GameStateSerializer._cells_size(width * height)
+    
+    def encode(self, state: GameState) -> bytes:
+        """Закодировать состояние в двоичную запись.
+        
+        Args:
+            state: Состояние игры
+        
+        Returns:
+            bytes: Запись фиксированного размера
+        """
+        buffer = bytearray(self.record_size(state.board.width(), state.board.height()))
+        self.encode_into(state, buffer)
+        return bytes(buffer)
+    
+    def encode_into(self, state: GameState, buffer: Union[bytearray, memoryview],
+                    offset: int = 0) -> int:
+        """Закодировать состояние в готовый буфер.
+        
+        Args:
+            state: Состояние игры
+            buffer: Изменяемый буфер (например, отображённый файл)
+            offset: Смещение записи в буфере
+        
+        Returns:
+            int: Количество записанных байт
+        
+        Raises:
+            ValueError: Если буфер слишком мал
+        """
+        board = state.board
+        width, height = board.width(), board.height()
+        size = self.record_size(width, height)
+        if len(buffer) - offset < size:
+            raise ValueError("Буфер слишком мал для записи состояния")
+        
+        flags = _FLAG_MOVES_AVAILABLE if state.moves_available else 0
+        _STATE_HEADER.pack_into(buffer, offset, _STATE_MAGIC, _STATE_VERSION, flags,
+                                width, height, state.score)
+        self._pack_codes(CompactBoard.codes_of(board), buffer, offset + _STATE_HEADER.size)
+        return size
+    
+    def decode(self, buffer: Buffer, offset: int = 0, compact: bool = False) -> GameState:
+        """Декодировать состояние из двоичной записи.
+        
+        Args:
+            buffer: Буфер с записью
+            offset: Смещение записи в буфере
+            compact: Вернуть доску CompactBoard вместо MutableBoard
+        
+        Returns:
+            GameState: Восстановленное состояние
+        
+        Raises:
+            ValueError: Если запись повреждена или имеет другой формат
+        """
+        view = memoryview(buffer)
+        width, height, flags, score = self._read_header(view, offset)
+        count = width * height
+        start = offset + _STATE_HEADER.size
+        if len(view) - start < self._cells_size(count):
+            raise ValueError("Запись состояния обрезана")
+        
+        codes = self._unpack_codes(view, start, count)
+        if count and max(codes) > _MAX_CODE:
+            raise ValueError("Неизвестный код фишки в записи состояния")
+        
+        board = self._board_from_codes(codes, width, height, compact)
+        return GameState(board=board, score=score,
+                         moves_available=bool(flags & _FLAG_MOVES_AVAILABLE))
+    
+    def encode_random(self, provider: RandomProviderDefault) -> bytes:
+        """Закодировать состояние генератора.
+        
+        Args:
+            provider: Поставщик случайностей
+        
+        Returns:
+            bytes: Двоичное состояние генератора и признак пакетного потока
+        """
+        version, words, gauss = provider.get_state()
+        has_gauss = gauss is not None
+        flags = ((_RANDOM_FLAG_GAUSS if has_gauss else 0) |
+                 (_RANDOM_FLAG_BATCHED if provider.is_batched() else 0))
+        return (_RANDOM_HEADER.pack(_RANDOM_MAGIC, version, flags) +
+                _RANDOM_WORDS.pack(*words) +
+                _RANDOM_GAUSS.pack(gauss if has_gauss else 0.0))
+    
+    def decode_random(self, buffer: Buffer, offset: int = 0,
+                      provider: Optional[RandomProviderDefault] = None) -> RandomProviderDefault:
+        """Восстановить состояние генератора.
+        
+        Args:
+            buffer: Буфер с состоянием генератора
+            offset: Смещение в буфере
+            provider: Поставщик для восстановления (по умолчанию новый
+                в сохранённом режиме потока)
+        
+        Returns:
+            RandomProviderDefault: Поставщик с восстановленным состоянием
+        
+        Raises:
+            ValueError: Если состояние повреждено или режим потока
+                переданного поставщика отличается от сохранённого
+        """
+        view = memoryview(buffer)
+        if len(view) - offset < self.random_size():
+            raise ValueError("Состояние генератора обрезано")
+        
+        magic, version, flags = _RANDOM_HEADER.unpack_from(view, offset)
+        if magic != _RANDOM_MAGIC:
+            raise ValueError("Неверная сигнатура состояния генератора")
+        offset += _RANDOM_HEADER.size
+        words = _RANDOM_WORDS.unpack_from(view, offset)
+        gauss, = _RANDOM_GAUSS.unpack_from(view, offset + _RANDOM_WORDS.size)
+        
+        provider = self._random_provider(provider, bool(flags & _RANDOM_FLAG_BATCHED))
+        provider.set_state((version, words, gauss if flags & _RANDOM_FLAG_GAUSS else None))
+        return provider
+    
+    @staticmethod
+    def random_size() -> int:
+        """Получить размер двоичного состояния генератора.
+        
+        Returns:
+            int: Размер в байтах
+        """
+        return _RANDOM_HEADER.size + _RANDOM_WORDS.size + _RANDOM_GAUSS.size
+    
+    def to_json(self, state: GameState, provider: Optional[RandomProviderDefault] = None) -> str:
+        """Представить состояние в JSON для отладки.
+        
+        Args:
+            state: Состояние игры
+            provider: Поставщик, состояние которого нужно добавить
+        
+        Returns:
+            str: JSON со строками доски вида "AB.CE..."
+        """
+        board = state.board
+        width = board.width()
+        codes = CompactBoard.codes_of(board)
+        document = {
+            'width': width,
+            'height': board.height(),
+            'score': state.score,
+            'moves_available': state.moves_available,
+            'board': [''.join(_JSON_SYMBOLS[code] for code in codes[row * width:(row + 1) * width])
+                      for row in range(board.height())],
+        }
+        if provider is not None:
+            version, words, gauss = provider.get_state()
+            document['random'] = {'version': version, 'state': list(words), 'gauss': gauss,
+                                  'batched': provider.is_batched()}
+        return json.dumps(document, ensure_ascii=False)
+    
+    def from_json(self, text: str, compact: bool = False) -> Tuple[GameState, Optional[RandomProviderDefault]]:
+        """Восстановить состояние из JSON.
+        
+        Args:
+            text: JSON, полученный из to_json()
+            compact: Вернуть доску CompactBoard вместо MutableBoard
+        
+        Returns:
+            Tuple[GameState, Optional[RandomProviderDefault]]: Состояние и
+            поставщик, если его состояние было сохранено
+        
+        Raises:
+            ValueError: Если JSON не соответствует формату
+        """
+        document = json.loads(text)
+        width, height = document['width'], document['height']
+        rows = document['board']
+        if len(rows) != height or any(len(row) != width for row in rows):
+            raise ValueError("Размер доски не совпадает с заявленным")
+        
+        try:
+            codes = bytearray(_JSON_SYMBOLS.index(symbol) for row in rows for symbol in row)
+        except ValueError:
+            raise ValueError("Неизвестный символ фишки в JSON") from None
+        
+        state = GameState(board=self._board_from_codes(codes, width, height, compact),
+                          score=document['score'],
+                          moves_available=document['moves_available'])
+        
+        provider = None
+        if 'random' in document:
+            random_state = document['random']
+            provider = RandomProviderDefault(batched=random_state.get('batched', False))
+            provider.set_state((random_state['version'], tuple(random_state['state']),
+                                random_state['gauss']))
+        return state, provider
+    
+    @staticmethod
+    def _random_provider(provider: Optional[RandomProviderDefault],
+                         batched: bool) -> RandomProviderDefault:
+        """Получить поставщика для восстановления состояния.
+        
+        Args:
+            provider: Переданный поставщик или None
+            batched: Сохранённый режим потока
+        
+        Returns:
+            RandomProviderDefault: Поставщик в сохранённом режиме
+        
+        Raises:
+            ValueError: Если режим переданного поставщика другой
+        """
+        if provider is None:
+            return RandomProviderDefault(batched=batched)
+        if provider.is_batched() != batched:
+            raise ValueError("Режим потока поставщика не совпадает с сохранённым")
+        return provider
+    
+    @staticmethod
+    def _cells_size(count: int) -> int:
+        """Получить размер упакованных ячеек.
+        
+        Args:
+            count: Количество ячеек
+        
+        Returns:
+            int: Размер в байтах, кратный группе из 8 ячеек
+        """
+        groups = (count + _CELLS_PER_GROUP - 1) // _CELLS_PER_GROUP
+        return groups * _BYTES_PER_GROUP
+    
+    def _read_header(self, view: memoryview, offset: int) -> Tuple[int, int, int, int]:
+        """Прочитать и проверить заголовок записи.
+        
+        Args:
+            view: Буфер с записью
+            offset: Смещение записи
+        
+        Returns:
+            Tuple[int, int, int, int]: Ширина, высота, флаги и счёт
+        
+        Raises:
+            ValueError: Если заголовок повреждён
+        """
+        if len(view) - offset < _STATE_HEADER.size:
+            raise ValueError("Запись состояния обрезана")
+        
+        magic, version, flags, width, height, score = _STATE_HEADER.unpack_from(view, offset)
+        if magic != _STATE_MAGIC:
+            raise ValueError("Неверная сигнатура записи состояния")
+        if version != _STATE_VERSION:
+            raise ValueError(f"Неподдерживаемая версия записи состояния: {version}")
+        return width, height, flags, score
+    
+    def _pack_codes(self, codes: bytearray, buffer, start: int) -> None:
+        """Упаковать коды по 3 бита в буфер.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            buffer: Изменяемый буфер
+            start: Смещение упакованных ячеек
+        """
+        padded = bytes(codes) + bytes(-len(codes) % _CELLS_PER_GROUP)
+        position = start
+        for index in range(0, len(padded), _CELLS_PER_GROUP):
+            bits = (_PACK_TABLE[padded[index:index + 4]] |
+                    _PACK_TABLE[padded[index + 4:index + 8]] << 12)
+            buffer[position] = bits & 0xFF
+            buffer[position + 1] = (bits >> 8) & 0xFF
+            buffer[position + 2] = bits >> 16
+            position += _BYTES_PER_GROUP
+    
+    def _unpack_codes(self, view: memoryview, start: int, count: int) -> bytearray:
+        """Распаковать коды из 3-битного представления.
+        
+        Args:
+            view: Буфер с записью
+            start: Смещение упакованных ячеек
+            count: Количество ячеек
+        
+        Returns:
+            bytearray: Коды фишек в порядке строк
+        """
+        codes = bytearray()
+        end = start + self._cells_size(count)
+        for position in range(start, end, _BYTES_PER_GROUP):
+            bits = view[position] | view[position + 1] << 8 | view[position + 2] << 16
+            codes += _UNPACK_TABLE[bits & 0xFFF]
+            codes += _UNPACK_TABLE[bits >> 12]
+        del codes[count:]
+        return codes
+    
+    def _board_from_codes(self, codes: bytearray, width: int, height: int,
+                          compact: bool) -> Board:
+        """Построить доску по кодам фишек.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            compact: Построить CompactBoard вместо MutableBoard
+        
+        Returns:
+            Board: Доска с фишками
+        """
+        if compact:
+            board = CompactBoard(width, height)
+            board.codes()[:] = codes
+            board.mark_modified()
+            return board
+        
+        board = MutableBoard(width, height)
+        for index, code in enumerate(codes):
+            if code != EMPTY_CODE:
+                board.set_tile(Cell.of(index // width, index % width), Tile.of(TileKind.from_code(code)))
+        return board
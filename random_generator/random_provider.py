@@ -1,9 +1,15 @@
 """Абстрактный интерфейс для генерации случайных значений."""
 
 from abc import ABC, abstractmethod
+from typing import List, Optional, Sequence
+
 from board.tile_kind import TileKind
 
 
+# Число попыток выборки с отклонением до детерминированного выбора
+_MAX_REJECTED_DRAWS = 32
+
+
 class RandomProvider(ABC):
     """Абстрактный интерфейс для генерации случайных значений."""
     
@@ -15,3 +21,63 @@ class RandomProvider(ABC):
             TileKind: Случайный тип фишки
         """
         pass
+    
+    def next_tile_kinds(self, count: int) -> List[TileKind]:
+        """Получить несколько случайных типов фишек подряд.
+        
+        Args:
+            count: Количество типов
+            
+        Returns:
+            List[TileKind]: Те же типы, что дали бы count вызовов next_tile_kind()
+        """
+        return [self.next_tile_kind() for _ in range(count)]
+    
+    def fill_codes(self, buffer) -> None:
+        """Записать коды случайных фишек в каждый байт буфера.
+        
+        Args:
+            buffer: Изменяемый байтовый буфер (bytearray или memoryview)
+            
+        Note:
+            Коды идут в том же порядке, что и next_tile_kinds(len(buffer))
+        """
+        buffer[:] = bytes(kind.code() for kind in self.next_tile_kinds(len(buffer)))
+    
+    def next_tile_kind_from(self, kinds: Sequence[TileKind]) -> TileKind:
+        """Получить случайный тип фишки из разрешённых.
+        
+        Args:
+            kinds: Непустой список разрешённых типов
+            
+        Returns:
+            TileKind: Случайный тип из kinds
+            
+        Note:
+            Реализация по умолчанию отбрасывает неподходящие значения
+            next_tile_kind() и после нескольких неудач берёт первый тип
+        """
+        for _ in range(_MAX_REJECTED_DRAWS):
+            kind = self.next_tile_kind()
+            if kind in kinds:
+                return kind
+        return kinds[0]
+    
+    def get_state(self) -> Optional[tuple]:
+        """Получить внутреннее состояние генератора.
+        
+        Returns:
+            Optional[tuple]: Состояние или None, если поставщик его не сохраняет
+        """
+        return None
+    
+    def set_state(self, state: tuple) -> None:
+        """Восстановить внутреннее состояние генератора.
+        
+        Args:
+            state: Состояние, полученное из get_state()
+            
+        Raises:
+            NotImplementedError: Если поставщик не сохраняет состояние
+        """
+        raise NotImplementedError("Поставщик случайностей не поддерживает восстановление состояния")
@@ -1,23 +1,58 @@
 """Стандартная реализация генератора случайных значений."""
 
 import random as random_module
-from typing import Optional
+import sys
+from array import array
+from typing import List, Optional, Sequence
 
 from .random_provider import RandomProvider
 from board.tile_kind import TileKind
 
+try:
+    import numpy as np
+except ImportError:  # NumPy только ускоряет пакетный режим, поток от него не зависит
+    np = None
+
+
+# Бит в одном слове пакетного потока
+_WORD_BITS = 32
+
 
 class RandomProviderDefault(RandomProvider):
-    """Стандартная реализация поставщика случайностей."""
+    """Стандартная реализация поставщика случайностей.
     
-    def __init__(self, seed: Optional[int] = None):
+    Обычный режим выбирает каждую фишку через random.choice; этот поток
+    сохраняется для существующих seed, журналов и архивов партий.
+    
+    Пакетный режим (batched=True) - другой поток для того же seed: каждая
+    фишка - это одно 32-битное слово Mersenne Twister, слова не меньше
+    наибольшего кратного числу типов отбрасываются, тип - остаток от
+    деления. next_tile_kinds и fill_codes берут все слова одним вызовом
+    getrandbits, поэтому последовательность фишек не зависит от того,
+    запрашиваются они по одной или пачками.
+    """
+    
+    def __init__(self, seed: Optional[int] = None, batched: bool = False):
         """Инициализировать генератор.
         
         Args:
             seed: Начальное значение (None для системного)
+            batched: Использовать пакетный поток фишек
         """
         self._random = random_module.Random(seed)
         self._tile_kinds = list(TileKind.all())
+        self._batched = batched
+        # Остатки 0..n-1 переводятся в коды фишек одной таблицей bytes.translate
+        self._code_table = bytes(kind.code() for kind in self._tile_kinds).ljust(256, b'\x00')
+        self._word_limit = (1 << _WORD_BITS) // len(self._tile_kinds) * len(self._tile_kinds)
+    
+    def is_batched(self) -> bool:
+        """Проверить, используется ли пакетный поток фишек.
+        
+        Returns:
+            bool: True для пакетного режима
+        """
+        return self._batched
     
     def next_tile_kind(self) -> TileKind:
         """Получить следующий случайный тип фишки.
@@ -25,7 +60,52 @@ class RandomProviderDefault(RandomProvider):
         Returns:
             TileKind: Случайный тип фишки
         """
-        return self._random.choice(self._tile_kinds)
+        if not self._batched:
+            return self._random.choice(self._tile_kinds)
+        
+        word = self._random.getrandbits(_WORD_BITS)
+        while word >= self._word_limit:
+            word = self._random.getrandbits(_WORD_BITS)
+        return self._tile_kinds[word % len(self._tile_kinds)]
+    
+    def next_tile_kinds(self, count: int) -> List[TileKind]:
+        """Получить несколько случайных типов фишек подряд.
+        
+        Args:
+            count: Количество типов
+        
+        Returns:
+            List[TileKind]: Те же типы, что дали бы count вызовов next_tile_kind()
+        """
+        if not self._batched:
+            choice = self._random.choice
+            kinds = self._tile_kinds
+            return [choice(kinds) for _ in range(count)]
+        
+        return [TileKind.from_code(code) for code in self._draw_codes(count)]
+    
+    def fill_codes(self, buffer) -> None:
+        """Записать коды случайных фишек в каждый байт буфера.
+        
+        Args:
+            buffer: Изменяемый байтовый буфер (bytearray или memoryview)
+        """
+        if not self._batched:
+            super().fill_codes(buffer)
+            return
+        
+        buffer[:] = self._draw_codes(len(buffer))
+    
+    def next_tile_kind_from(self, kinds: Sequence[TileKind]) -> TileKind:
+        """Получить случайный тип фишки из разрешённых.
+        
+        Args:
+            kinds: Непустой список разрешённых типов
+        
+        Returns:
+            TileKind: Случайный тип из kinds
+        """
+        return self._random.choice(kinds)
     
     def set_seed(self, seed: int) -> None:
         """Установить seed генератора.
@@ -34,3 +114,53 @@ class RandomProviderDefault(RandomProvider):
             seed: Новое начальное значение
         """
         self._random.seed(seed)
+    
+    def get_state(self) -> tuple:
+        """Получить внутреннее состояние генератора.
+        
+        Returns:
+            tuple: Состояние в формате random.Random.getstate()
+        
+        Note:
+            Пакетный режим не хранит заготовленных фишек, поэтому
+            состояние одинаково полно в обоих режимах
+        """
+        return self._random.getstate()
+    
+    def set_state(self, state: tuple) -> None:
+        """Восстановить внутреннее состояние генератора.
+        
+        Args:
+            state: Состояние, полученное из get_state()
+        """
+        self._random.setstate(state)
+    
+    def _draw_codes(self, count: int) -> bytes:
+        """Выбрать коды фишек пакетного потока.
+        
+        Args:
+            count: Количество кодов
+        
+        Returns:
+            bytes: Коды в порядке потока
+        
+        Note:
+            getrandbits(32 * n) в младших битах содержит первое слово,
+            поэтому слова в little-endian байтах идут в том же порядке,
+            что и при n вызовах getrandbits(32)
+        """
+        kinds_count = len(self._tile_kinds)
+        codes = b''
+        while len(codes) < count:
+            missing = count - len(codes)
+            raw = self._random.getrandbits(_WORD_BITS * missing).to_bytes(4 * missing, 'little')
+            if np is not None:
+                words = np.frombuffer(raw, dtype='<u4')
+                remainders = (words[words < self._word_limit] % kinds_count).astype(np.uint8).tobytes()
+            else:
+                words = array('I', raw)
+                if sys.byteorder == 'big':
+                    words.byteswap()
+                remainders = bytes([word % kinds_count for word in words if word < self._word_limit])
+            codes += remainders.translate(self._code_table)
+        return codes
@@ -2,10 +2,24 @@
 
 from .swap_validator import SwapValidator
 from .match_finder import MatchFinder
+from .run_length_match_finder import RunLengthMatchFinder
 from .move_generator import MoveGenerator
+from .pattern_move_generator import PatternMoveGenerator
+from .bitboard_match_finder import BitboardMatchFinder
+from .bitboard_move_generator import BitboardMoveGenerator
+from .stripe_executor import StripeExecutor
+from .tiled_match_finder import TiledMatchFinder
+from .tiled_move_generator import TiledMoveGenerator
 
 __all__ = [
     'SwapValidator',
     'MatchFinder', 
-    'MoveGenerator'
+    'RunLengthMatchFinder',
+    'MoveGenerator',
+    'PatternMoveGenerator',
+    'BitboardMatchFinder',
+    'BitboardMoveGenerator',
+    'StripeExecutor',
+    'TiledMatchFinder',
+    'TiledMoveGenerator'
 ]
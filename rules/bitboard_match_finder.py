@@ -0,0 +1,180 @@
+"""Поисковик совпадений на битовых масках типов фишек."""
+
+from typing import List, Set, Tuple
+
+from board.board import Board
+from board.bit_board import BitBoard
+from board.cell import Cell
+from .run_length_match_finder import RunLengthMatchFinder, Run
+
+
+class BitboardMatchFinder(RunLengthMatchFinder):
+    """Поисковик совпадений сдвигами и побитовым И над масками.
+    
+    Начала троек одного типа находятся выражением m & (m >> 1) & (m >> 2)
+    для строк и аналогичным сдвигом на ширину доски для столбцов. Серии
+    из найденных масок разрешаются так же, как в RunLengthMatchFinder,
+    поэтому результат совпадает с MatchFinder.
+    """
+    
+    def find_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти все совпадения на доске.
+        
+        Args:
+            board: Доска для поиска совпадений
+        
+        Returns:
+            Set[Set[Cell]]: Множество групп ячеек с совпадениями
+        """
+        bit_board = self._as_bit_board(board)
+        row_cells, col_cells = self._run_cells(bit_board)
+        if not any(row_cells) and not any(col_cells):
+            return set()
+        
+        row_runs = self._row_runs(bit_board, row_cells)
+        col_runs = self._column_runs(bit_board, col_cells)
+        
+        crossing = bool(self._union(row_cells) & self._union(col_cells))
+        return self._resolve_runs(row_runs, col_runs, crossing)
+    
+    def find_horizontal_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти горизонтальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+        
+        Returns:
+            Set[Set[Cell]]: Горизонтальные группы совпадений
+        """
+        bit_board = self._as_bit_board(board)
+        row_cells, _ = self._run_cells(bit_board)
+        return self._as_match_set(self._row_groups(self._row_runs(bit_board, row_cells)))
+    
+    def find_vertical_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти вертикальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+        
+        Returns:
+            Set[Set[Cell]]: Вертикальные группы совпадений
+        """
+        bit_board = self._as_bit_board(board)
+        _, col_cells = self._run_cells(bit_board)
+        return self._as_match_set(self._column_groups(self._column_runs(bit_board, col_cells)))
+    
+    def find_match_mask(self, board: Board) -> int:
+        """Найти маску всех ячеек, входящих в серии длиной ≥3.
+        
+        Args:
+            board: Доска для поиска
+        
+        Returns:
+            int: Битовая маска ячеек серий
+        
+        Note:
+            Пересекающиеся группы здесь не разрешаются; маска подходит
+            для быстрой оценки доски, а не для точного повторения каскада
+        """
+        row_cells, col_cells = self._run_cells(self._as_bit_board(board))
+        return self._union(row_cells) | self._union(col_cells)
+    
+    def _as_bit_board(self, board: Board) -> BitBoard:
+        """Получить битовое представление доски.
+        
+        Args:
+            board: Доска для чтения
+        
+        Returns:
+            BitBoard: Сама доска или её битовая копия
+        """
+        if isinstance(board, BitBoard):
+            return board
+        return BitBoard.from_board(board)
+    
+    def _run_cells(self, board: BitBoard) -> Tuple[List[int], List[int]]:
+        """Найти маски ячеек горизонтальных и вертикальных серий по типам.
+        
+        Args:
+            board: Битовая доска
+        
+        Returns:
+            Tuple[List[int], List[int]]: Маски ячеек серий для каждого типа
+        """
+        width = board.width()
+        row_cells = []
+        col_cells = []
+        for code, mask in enumerate(BitBoard.masks_of(board)):
+            if code == 0 or not mask:
+                continue
+            starts = mask & board.shifted(mask, 0, 1) & board.shifted(mask, 0, 2)
+            row_cells.append(starts | (starts << 1) | (starts << 2))
+            starts = mask & board.shifted(mask, 1, 0) & board.shifted(mask, 2, 0)
+            col_cells.append(starts | (starts << width) | (starts << 2 * width))
+        return row_cells, col_cells
+    
+    def _row_runs(self, board: BitBoard, cells: List[int]) -> List[Run]:
+        """Разобрать маски горизонтальных серий на серии.
+        
+        Args:
+            board: Битовая доска
+            cells: Маски ячеек серий для каждого типа
+        
+        Returns:
+            List[Run]: Серии (строка, начальный столбец, конечный столбец)
+                в порядке обхода строк
+        """
+        width = board.width()
+        runs = []
+        for mask in cells:
+            while mask:
+                index = (mask & -mask).bit_length() - 1
+                row, start = divmod(index, width)
+                end = start + 1
+                while end < width and mask >> (row * width + end) & 1:
+                    end += 1
+                runs.append((row, start, end))
+                mask &= ~(((1 << (end - start)) - 1) << index)
+        runs.sort()
+        return runs
+    
+    def _column_runs(self, board: BitBoard, cells: List[int]) -> List[Run]:
+        """Разобрать маски вертикальных серий на серии.
+        
+        Args:
+            board: Битовая доска
+            cells: Маски ячеек серий для каждого типа
+        
+        Returns:
+            List[Run]: Серии (столбец, начальная строка, конечная строка)
+                в порядке обхода столбцов
+        """
+        width = board.width()
+        height = board.height()
+        runs = []
+        for mask in cells:
+            while mask:
+                index = (mask & -mask).bit_length() - 1
+                start, col = divmod(index, width)
+                end = start + 1
+                while end < height and mask >> (end * width + col) & 1:
+                    end += 1
+                runs.append((col, start, end))
+                for row in range(start, end):
+                    mask &= ~(1 << (row * width + col))
+        runs.sort()
+        return runs
+    
+    def _union(self, masks: List[int]) -> int:
+        """Объединить маски.
+        
+        Args:
+            masks: Маски для объединения
+        
+        Returns:
+            int: Побитовое ИЛИ всех масок
+        """
+        union = 0
+        for mask in masks:
+            union |= mask
+        return union
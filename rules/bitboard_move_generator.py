@@ -0,0 +1,146 @@
+"""Генератор ходов на битовых масках типов фишек."""
+
+from typing import Iterator, Tuple
+
+from board.board import Board
+from board.bit_board import BitBoard
+from board.cell import Cell
+from .move_generator import MoveGenerator
+from .pattern_move_generator import _SWAP_PATTERNS
+
+
+class BitboardMoveGenerator(MoveGenerator):
+    """Генератор ходов арифметикой масок.
+    
+    Для каждого типа фишек и направления свопа шаблоны из
+    PatternMoveGenerator вычисляются сразу для всех ячеек сдвигами маски.
+    Результат и порядок ходов совпадают с MoveGenerator, в том числе
+    на досках с уже существующими сериями.
+    """
+    
+    def _iter_moves(self, board: Board) -> Iterator[Tuple[Cell, Cell]]:
+        """Перебрать валидные ходы по мере нахождения.
+        
+        Args:
+            board: Доска для анализа
+        
+        Returns:
+            Iterator[Tuple[Cell, Cell]]: Ходы в порядке обхода доски
+        """
+        bit_board = board if isinstance(board, BitBoard) else BitBoard.from_board(board)
+        right, down = self._valid_swap_masks(bit_board)
+        width = bit_board.width()
+        
+        # Бит p в right означает своп (p, p + 1), в down - своп (p, p + width)
+        pending = right | down
+        while pending:
+            low = pending & -pending
+            row, col = divmod(low.bit_length() - 1, width)
+            if right & low:
+                yield (Cell.of(row, col), Cell.of(row, col + 1))
+            if down & low:
+                yield (Cell.of(row, col), Cell.of(row + 1, col))
+            pending ^= low
+    
+    def _valid_swap_masks(self, board: BitBoard) -> Tuple[int, int]:
+        """Найти маски валидных горизонтальных и вертикальных свопов.
+        
+        Args:
+            board: Битовая доска
+        
+        Returns:
+            Tuple[int, int]: Маски левых и верхних ячеек валидных свопов
+        """
+        masks = BitBoard.masks_of(board)
+        masks[0] = board.empty_mask()
+        full = board.full_mask()
+        has_right = board.shifted(full, 0, 1)
+        has_down = board.shifted(full, 1, 0)
+        
+        right = down = 0
+        same_right = same_down = 0
+        row_starts = col_starts = 0
+        for code, mask in enumerate(masks):
+            if not mask:
+                continue
+            mask_right = board.shifted(mask, 0, 1)
+            mask_down = board.shifted(mask, 1, 0)
+            same_right |= mask & mask_right
+            same_down |= mask & mask_down
+            if code == 0:
+                continue
+            
+            # Фишка уходит вправо/вниз из p или приходит в p справа/снизу
+            right |= mask & board.shifted(self._completed(board, mask, 0, 1), 0, 1)
+            right |= mask_right & self._completed(board, mask, 0, -1)
+            down |= mask & board.shifted(self._completed(board, mask, 1, 0), 1, 0)
+            down |= mask_down & self._completed(board, mask, -1, 0)
+            
+            row_starts |= mask & mask_right & board.shifted(mask, 0, 2)
+            col_starts |= mask & mask_down & board.shifted(mask, 2, 0)
+        
+        total = row_starts.bit_count() + col_starts.bit_count()
+        right &= has_right
+        down &= has_down
+        if total == 0:
+            return right, down
+        
+        # Своп одинаковых фишек не меняет доску: валиден, если тройки уже есть
+        right |= same_right & has_right
+        down |= same_down & has_down
+        
+        # Уцелевшие тройки вдали от свопа тоже делают его валидным
+        width = board.width()
+        triples = (row_starts, col_starts, total)
+        right |= self._surviving(board, triples, has_right & ~right, 1)
+        down |= self._surviving(board, triples, has_down & ~down, width)
+        return right, down
+    
+    def _completed(self, board: BitBoard, mask: int, dr: int, dc: int) -> int:
+        """Найти ячейки, где перенесённая по (dr, dc) фишка завершает шаблон.
+        
+        Args:
+            board: Битовая доска
+            mask: Маска фишек одного типа
+            dr: Направление переноса по строке
+            dc: Направление переноса по столбцу
+        
+        Returns:
+            int: Маска ячеек назначения, в которых выполняется шаблон
+        """
+        completed = 0
+        for (r1, c1), (r2, c2) in _SWAP_PATTERNS[(dr, dc)]:
+            completed |= board.shifted(mask, r1, c1) & board.shifted(mask, r2, c2)
+        return completed
+    
+    def _surviving(self, board: BitBoard, triples: Tuple, candidates: int, step: int) -> int:
+        """Отобрать свопы, после которых остаётся тройка, не задетая свопом.
+        
+        Args:
+            board: Битовая доска
+            triples: Маски начал троек (горизонтальные, вертикальные) и их число
+            candidates: Маска первых ячеек проверяемых свопов
+            step: Расстояние до второй ячейки свопа в битах
+        
+        Returns:
+            int: Маска первых ячеек валидных свопов
+        """
+        row_starts, col_starts, total = triples
+        width = board.width()
+        valid = 0
+        while candidates:
+            low = candidates & -candidates
+            index = low.bit_length() - 1
+            touching_rows = 0
+            touching_cols = 0
+            for cell in (index, index + step):
+                col = cell % width
+                for shift in range(min(col, 2) + 1):
+                    touching_rows |= 1 << (cell - shift)
+                for shift in range(min(cell // width, 2) + 1):
+                    touching_cols |= 1 << (cell - shift * width)
+            touching = (row_starts & touching_rows).bit_count() + (col_starts & touching_cols).bit_count()
+            if total > touching:
+                valid |= low
+            candidates ^= low
+        return valid
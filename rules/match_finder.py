@@ -46,7 +46,7 @@ class MatchFinder:
             col = 0
             while col < board.width():
                 match_cells = self._find_matches_in_line(
-                    board, Cell(row, col), (0, 1)
+                    board, Cell.of(row, col), (0, 1)
                 )
                 if len(match_cells) >= 3:
                     matches.add(frozenset(match_cells))
@@ -71,7 +71,7 @@ class MatchFinder:
             row = 0
             while row < board.height():
                 match_cells = self._find_matches_in_line(
-                    board, Cell(row, col), (1, 0)
+                    board, Cell.of(row, col), (1, 0)
                 )
                 if len(match_cells) >= 3:
                     matches.add(frozenset(match_cells))
@@ -100,12 +100,12 @@ class MatchFinder:
         dx, dy = direction
         
         # Проверяем в положительном направлении
-        current = Cell(start.row() + dx, start.col() + dy)
+        current = Cell.of(start.row() + dx, start.col() + dy)
         while board.is_inside(current):
             current_tile = board.tile_at(current)
             if current_tile is not None and current_tile.kind() == start_tile.kind():
                 match_cells.add(current)
-                current = Cell(current.row() + dx, current.col() + dy)
+                current = Cell.of(current.row() + dx, current.col() + dy)
             else:
                 break
         
@@ -1,6 +1,7 @@
 """Генератор возможных ходов."""
 
-from typing import List, Tuple
+import weakref
+from typing import Iterator, List, Optional, Tuple
 
 from board.board import Board
 from board.cell import Cell
@@ -10,9 +11,14 @@ from .swap_validator import SwapValidator
 class MoveGenerator:
     """Генератор всех возможных ходов."""
     
-    def __init__(self):
-        """Инициализировать генератор."""
-        self._validator = SwapValidator()
+    def __init__(self, validator: Optional[SwapValidator] = None):
+        """Инициализировать генератор.
+        
+        Args:
+            validator: Валидатор свопов (по умолчанию полная проверка)
+        """
+        self._validator = validator if validator is not None else SwapValidator()
+        self._availability_cache = weakref.WeakKeyDictionary()
     
     def generate_all_moves(self, board: Board) -> List[Tuple[Cell, Cell]]:
         """Сгенерировать все возможные ходы.
@@ -23,23 +29,18 @@ class MoveGenerator:
         Returns:
             List[Tuple[Cell, Cell]]: Список всех валидных ходов
         """
-        moves = []
+        return list(self._iter_moves(board))
+    
+    def find_first_move(self, board: Board) -> Optional[Tuple[Cell, Cell]]:
+        """Найти первый валидный ход, не перебирая остальные.
         
-        # Проверяем все возможные пары соседних ячеек
-        for cell in board.enumerate_cells():
-            # Проверяем соседние ячейки
-            neighbors = self._get_neighbors(cell, board)
+        Args:
+            board: Доска для анализа
             
-            for neighbor in neighbors:
-                if self._validator.is_valid_swap(board, cell, neighbor):
-                    # Добавляем ход, если он ещё не добавлен
-                    move = (cell, neighbor)
-                    reverse_move = (neighbor, cell)
-                    
-                    if move not in moves and reverse_move not in moves:
-                        moves.append(move)
-        
-        return moves
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Первый ход в порядке generate_all_moves или None
+        """
+        return next(self._iter_moves(board), None)
     
     def has_available_moves(self, board: Board) -> bool:
         """Проверить, есть ли доступные ходы.
@@ -49,28 +50,45 @@ class MoveGenerator:
             
         Returns:
             bool: True если есть доступные ходы
+            
+        Note:
+            Результат запоминается для версии доски, поэтому повторный
+            вызов на неизменённой доске не выполняет поиск
         """
-        moves = self.generate_all_moves(board)
-        return len(moves) > 0
+        version = board.version()
+        if version is not None:
+            cached = self._availability_cache.get(board)
+            if cached is not None and cached[0] == version:
+                return cached[1]
+        
+        available = self.find_first_move(board) is not None
+        
+        if version is not None:
+            self._availability_cache[board] = (version, available)
+        return available
     
-    def _get_neighbors(self, cell: Cell, board: Board) -> List[Cell]:
-        """Получить соседние ячейки.
+    def _iter_moves(self, board: Board) -> Iterator[Tuple[Cell, Cell]]:
+        """Перебрать валидные ходы по мере нахождения.
         
         Args:
-            cell: Исходная ячейка
-            board: Доска для проверки границ
+            board: Доска для анализа
             
         Returns:
-            List[Cell]: Список соседних ячеек
+            Iterator[Tuple[Cell, Cell]]: Ходы в порядке обхода доски
         """
-        neighbors = []
-        
-        # Проверяем все четыре направления
-        directions = [(0, 1), (0, -1), (1, 0), (-1, 0)]
-        
-        for dx, dy in directions:
-            neighbor = Cell(cell.row() + dx, cell.col() + dy)
-            if board.is_inside(neighbor):
-                neighbors.append(neighbor)
+        check = self._validator.prepare(board)
+        width = board.width()
+        height = board.height()
         
-        return neighbors
+        # Каждая пара соседей проверяется один раз: сосед справа, затем снизу
+        for row in range(height):
+            for col in range(width):
+                cell = Cell.of(row, col)
+                if col + 1 < width:
+                    neighbor = Cell.of(row, col + 1)
+                    if check(cell, neighbor):
+                        yield (cell, neighbor)
+                if row + 1 < height:
+                    neighbor = Cell.of(row + 1, col)
+                    if check(cell, neighbor):
+                        yield (cell, neighbor)
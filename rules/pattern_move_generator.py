@@ -0,0 +1,170 @@
+"""Генератор ходов по таблице шаблонов вокруг свопа."""
+
+from typing import Iterator, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.compact_board import CompactBoard
+from board.tile_kind import EMPTY_CODE
+from .move_generator import MoveGenerator
+
+
+# Шаблоны для фишки, перенесённой в ячейку d по направлению (dr, dc).
+# Каждый шаблон - пара смещений от d, в которых должна стоять фишка того же
+# типа. Для горизонтального сдвига вправо это "XX_X" (пара сзади недоступна,
+# там теперь другая фишка), "X_XX" (пара впереди) и L-образные пары сверху,
+# снизу и по обе стороны по вертикали.
+_SWAP_PATTERNS = {}
+for _dr, _dc in ((0, 1), (0, -1), (1, 0), (-1, 0)):
+    _pr, _pc = _dc, _dr
+    _SWAP_PATTERNS[(_dr, _dc)] = (
+        ((_dr, _dc), (2 * _dr, 2 * _dc)),
+        ((_pr, _pc), (2 * _pr, 2 * _pc)),
+        ((-_pr, -_pc), (-2 * _pr, -2 * _pc)),
+        ((-_pr, -_pc), (_pr, _pc)),
+    )
+
+
+class PatternMoveGenerator(MoveGenerator):
+    """Генератор ходов без симуляции свопов.
+    
+    Каждый соседний своп проверяется по фиксированной таблице шаблонов,
+    совпадающих после переноса фишки. Результат и порядок ходов совпадают
+    с MoveGenerator, в том числе на досках с уже существующими сериями.
+    """
+    
+    def _iter_moves(self, board: Board) -> Iterator[Tuple[Cell, Cell]]:
+        """Перебрать валидные ходы по мере нахождения.
+        
+        Args:
+            board: Доска для анализа
+            
+        Returns:
+            Iterator[Tuple[Cell, Cell]]: Ходы в порядке обхода доски
+        """
+        codes = CompactBoard.codes_of(board)
+        width = board.width()
+        height = board.height()
+        triples = self._triple_starts(codes, width, height)
+        
+        for row in range(height):
+            for col in range(width):
+                for dr, dc in ((0, 1), (1, 0)):
+                    if row + dr < height and col + dc < width:
+                        if self._is_valid(codes, width, height, triples, row, col, dr, dc):
+                            yield (Cell.of(row, col), Cell.of(row + dr, col + dc))
+    
+    def _is_valid(self, codes: bytearray, width: int, height: int, triples: Tuple,
+                  row: int, col: int, dr: int, dc: int) -> bool:
+        """Проверить своп ячейки (row, col) с соседом (row + dr, col + dc).
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            triples: Начала троек (горизонтальные, вертикальные, их число)
+            row: Строка первой ячейки
+            col: Столбец первой ячейки
+            dr: Смещение соседа по строке
+            dc: Смещение соседа по столбцу
+            
+        Returns:
+            bool: True если после свопа на доске есть совпадение
+        """
+        first = codes[row * width + col]
+        second = codes[(row + dr) * width + col + dc]
+        total = triples[2]
+        
+        if first == second:
+            return total > 0
+        
+        if (self._completes_pattern(codes, width, height, row + dr, col + dc, first, dr, dc) or
+                self._completes_pattern(codes, width, height, row, col, second, -dr, -dc)):
+            return True
+        
+        # Уцелевшие тройки вдали от свопа тоже делают его валидным
+        return total > len(self._touching_triples(triples, width, height, row, col) |
+                           self._touching_triples(triples, width, height, row + dr, col + dc))
+    
+    def _completes_pattern(self, codes: bytearray, width: int, height: int,
+                           row: int, col: int, code: int, dr: int, dc: int) -> bool:
+        """Проверить шаблоны для фишки, перенесённой в (row, col).
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            row: Строка ячейки назначения
+            col: Столбец ячейки назначения
+            code: Код перенесённой фишки
+            dr: Направление переноса по строке
+            dc: Направление переноса по столбцу
+            
+        Returns:
+            bool: True если выполняется хотя бы один шаблон
+        """
+        if code == EMPTY_CODE:
+            return False
+        
+        for (r1, c1), (r2, c2) in _SWAP_PATTERNS[(dr, dc)]:
+            row1, col1, row2, col2 = row + r1, col + c1, row + r2, col + c2
+            if (0 <= row1 < height and 0 <= col1 < width and
+                    0 <= row2 < height and 0 <= col2 < width and
+                    codes[row1 * width + col1] == code and
+                    codes[row2 * width + col2] == code):
+                return True
+        return False
+    
+    def _triple_starts(self, codes: bytearray, width: int, height: int) -> Tuple:
+        """Найти все тройки одинаковых фишек подряд.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            Tuple: Отметки начал горизонтальных и вертикальных троек и их число
+        """
+        horizontal = bytearray(width * height)
+        vertical = bytearray(width * height)
+        total = 0
+        for row in range(height):
+            for col in range(width):
+                index = row * width + col
+                code = codes[index]
+                if code == EMPTY_CODE:
+                    continue
+                if col + 2 < width and codes[index + 1] == code and codes[index + 2] == code:
+                    horizontal[index] = 1
+                    total += 1
+                if (row + 2 < height and codes[index + width] == code and
+                        codes[index + 2 * width] == code):
+                    vertical[index] = 1
+                    total += 1
+        return horizontal, vertical, total
+    
+    def _touching_triples(self, triples: Tuple, width: int, height: int,
+                          row: int, col: int) -> set:
+        """Найти тройки, содержащие ячейку.
+        
+        Args:
+            triples: Начала троек (горизонтальные, вертикальные, их число)
+            width: Ширина доски
+            height: Высота доски
+            row: Строка ячейки
+            col: Столбец ячейки
+            
+        Returns:
+            set: Идентификаторы троек (направление, индекс начала)
+        """
+        horizontal, vertical, total = triples
+        touching = set()
+        if total == 0:
+            return touching
+        for shift in range(3):
+            if 0 <= col - shift and horizontal[row * width + col - shift]:
+                touching.add((0, row * width + col - shift))
+            if 0 <= row - shift and vertical[(row - shift) * width + col]:
+                touching.add((1, (row - shift) * width + col))
+        return touching
@@ -0,0 +1,209 @@
+"""Поисковик совпадений одним проходом по сериям кодов фишек."""
+
+from typing import List, Set, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.compact_board import CompactBoard
+from board.tile_kind import EMPTY_CODE
+from .match_finder import MatchFinder
+
+
+# Серия одинаковых фишек: (неподвижная координата, начало, конец не включая)
+Run = Tuple[int, int, int]
+
+
+class RunLengthMatchFinder(MatchFinder):
+    """Поисковик совпадений на основе кодирования длин серий.
+    
+    Каждая строка и каждый столбец просматриваются один раз по сырым
+    кодам фишек. Результат совпадает с MatchFinder, включая разрешение
+    пересечений L- и T-образных групп.
+    """
+    
+    def find_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти все совпадения на доске.
+        
+        Args:
+            board: Доска для поиска совпадений
+            
+        Returns:
+            Set[Set[Cell]]: Множество групп ячеек с совпадениями
+        """
+        codes = CompactBoard.codes_of(board)
+        width = board.width()
+        height = board.height()
+        
+        row_runs = self._scan_rows(codes, width, height)
+        col_runs = self._scan_columns(codes, width, height)
+        
+        crossing = bool(row_runs and col_runs and
+                        self._runs_intersect(row_runs, col_runs, width, height))
+        return self._resolve_runs(row_runs, col_runs, crossing)
+    
+    def _resolve_runs(self, row_runs: List[Run], col_runs: List[Run],
+                      crossing: bool) -> Set[Set[Cell]]:
+        """Собрать группы совпадений из найденных серий.
+        
+        Args:
+            row_runs: Горизонтальные серии в порядке обхода строк
+            col_runs: Вертикальные серии в порядке обхода столбцов
+            crossing: Есть ли ячейки, входящие и в горизонтальную, и в вертикальную серию
+            
+        Returns:
+            Set[Set[Cell]]: Множество групп ячеек с совпадениями
+        """
+        if not col_runs:
+            return set(self._row_groups(row_runs))
+        if not row_runs:
+            return set(self._column_groups(col_runs))
+        
+        if not crossing:
+            return set(self._row_groups(row_runs)).union(self._column_groups(col_runs))
+        
+        # Пересечения разрешаем так же, как базовый поисковик
+        horizontal = self._as_match_set(self._row_groups(row_runs))
+        vertical = self._as_match_set(self._column_groups(col_runs))
+        return self._remove_overlapping_matches(horizontal.union(vertical))
+    
+    def find_horizontal_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти горизонтальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+            
+        Returns:
+            Set[Set[Cell]]: Горизонтальные группы совпадений
+        """
+        codes = CompactBoard.codes_of(board)
+        runs = self._scan_rows(codes, board.width(), board.height())
+        return self._as_match_set(self._row_groups(runs))
+    
+    def find_vertical_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти вертикальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+            
+        Returns:
+            Set[Set[Cell]]: Вертикальные группы совпадений
+        """
+        codes = CompactBoard.codes_of(board)
+        runs = self._scan_columns(codes, board.width(), board.height())
+        return self._as_match_set(self._column_groups(runs))
+    
+    def _scan_rows(self, codes: bytearray, width: int, height: int) -> List[Run]:
+        """Найти серии длиной ≥3 в строках.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            List[Run]: Серии (строка, начальный столбец, конечный столбец)
+        """
+        runs = []
+        for row in range(height):
+            base = row * width
+            start = 0
+            while start < width - 2:
+                code = codes[base + start]
+                end = start + 1
+                while end < width and codes[base + end] == code:
+                    end += 1
+                if code != EMPTY_CODE and end - start >= 3:
+                    runs.append((row, start, end))
+                start = end
+        return runs
+    
+    def _scan_columns(self, codes: bytearray, width: int, height: int) -> List[Run]:
+        """Найти серии длиной ≥3 в столбцах.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            List[Run]: Серии (столбец, начальная строка, конечная строка)
+        """
+        runs = []
+        for col in range(width):
+            column = codes[col::width]
+            start = 0
+            while start < height - 2:
+                code = column[start]
+                end = start + 1
+                while end < height and column[end] == code:
+                    end += 1
+                if code != EMPTY_CODE and end - start >= 3:
+                    runs.append((col, start, end))
+                start = end
+        return runs
+    
+    def _runs_intersect(self, row_runs: List[Run], col_runs: List[Run],
+                        width: int, height: int) -> bool:
+        """Проверить, пересекаются ли горизонтальные и вертикальные серии.
+        
+        Args:
+            row_runs: Горизонтальные серии
+            col_runs: Вертикальные серии
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            bool: True если хотя бы одна ячейка входит в обе серии
+        """
+        covered = bytearray(width * height)
+        for row, start, end in row_runs:
+            base = row * width
+            covered[base + start:base + end] = b'\x01' * (end - start)
+        
+        for col, start, end in col_runs:
+            if any(covered[col + row * width] for row in range(start, end)):
+                return True
+        return False
+    
+    def _row_groups(self, runs: List[Run]) -> List[frozenset]:
+        """Построить группы ячеек для горизонтальных серий.
+        
+        Args:
+            runs: Горизонтальные серии
+            
+        Returns:
+            List[frozenset]: Группы в порядке обхода строк
+        """
+        return [frozenset(Cell.of(row, col) for col in range(start, end))
+                for row, start, end in runs]
+    
+    def _column_groups(self, runs: List[Run]) -> List[frozenset]:
+        """Построить группы ячеек для вертикальных серий.
+        
+        Args:
+            runs: Вертикальные серии
+            
+        Returns:
+            List[frozenset]: Группы в порядке обхода столбцов
+        """
+        return [frozenset(Cell.of(row, col) for row in range(start, end))
+                for col, start, end in runs]
+    
+    def _as_match_set(self, groups: List[frozenset]) -> Set[Set[Cell]]:
+        """Собрать множество групп тем же способом, что и MatchFinder.
+        
+        Args:
+            groups: Группы в порядке обхода
+            
+        Returns:
+            Set[Set[Cell]]: Множество групп
+            
+        Note:
+            Одинаковый порядок вставки даёт одинаковый порядок обхода
+            множества, поэтому равные по размеру пересекающиеся группы
+            разрешаются так же, как в базовом поисковике
+        """
+        matches = set()
+        for group in groups:
+            matches.add(group)
+        return {match for match in matches}
@@ -0,0 +1,124 @@
+"""Выполнение задач по полосам доски в пуле процессов."""
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+from typing import Callable, Iterable, Iterator, List, Optional, Tuple
+
+
+class StripeExecutor:
+    """Разбиение доски на полосы и выполнение задач по ним.
+    
+    Задачи получают байты своей полосы и выполняются в пуле процессов,
+    результаты возвращаются в порядке полос. При одном процессе или одной
+    полосе задачи выполняются в текущем процессе без сериализации.
+    """
+    
+    def __init__(self, workers: Optional[int] = None, stripe_size: int = 128):
+        """Инициализировать исполнитель.
+        
+        Args:
+            workers: Число процессов (None - по числу ядер, 1 - без пула)
+            stripe_size: Количество строк или столбцов в полосе
+        
+        Raises:
+            ValueError: Если stripe_size не положителен
+        """
+        if stripe_size <= 0:
+            raise ValueError("Размер полосы должен быть положительным")
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._stripe_size = stripe_size
+        self._pool: Optional[ProcessPoolExecutor] = None
+    
+    def workers(self) -> int:
+        """Получить число процессов.
+        
+        Returns:
+            int: Число рабочих процессов
+        """
+        return self._workers
+    
+    def stripes(self, length: int) -> List[Tuple[int, int]]:
+        """Разбить отрезок [0, length) на полосы.
+        
+        Args:
+            length: Высота или ширина доски
+        
+        Returns:
+            List[Tuple[int, int]]: Полосы (начало, конец не включая)
+        """
+        return [(start, min(start + self._stripe_size, length))
+                for start in range(0, length, self._stripe_size)]
+    
+    def map(self, task: Callable, arguments: List[Tuple]) -> Iterator:
+        """Выполнить задачу для каждой полосы.
+        
+        Args:
+            task: Функция уровня модуля (передаётся в другие процессы)
+            arguments: Аргументы вызова для каждой полосы
+        
+        Returns:
+            Iterator: Результаты в порядке полос
+        """
+        if self._workers == 1 or len(arguments) <= 1:
+            return (task(*args) for args in arguments)
+        if self._pool is None:
+            self._pool = ProcessPoolExecutor(max_workers=self._workers)
+        return self._pool.map(task, *zip(*arguments))
+    
+    def close(self) -> None:
+        """Остановить пул процессов."""
+        if self._pool is not None:
+            self._pool.shutdown()
+            self._pool = None
+    
+    def __enter__(self) -> 'StripeExecutor':
+        return self
+    
+    def __exit__(self, exc_type, exc_value, traceback) -> None:
+        self.close()
+
+
+def row_slice(codes: bytearray, width: int, start: int, end: int) -> bytes:
+    """Вырезать строки [start, end) из кодов доски.
+    
+    Args:
+        codes: Коды фишек в порядке строк
+        width: Ширина доски
+        start: Первая строка
+        end: Строка после последней
+    
+    Returns:
+        bytes: Коды строк в порядке строк
+    """
+    return bytes(codes[start * width:end * width])
+
+
+def column_slice(codes: bytearray, width: int, height: int, start: int, end: int) -> bytes:
+    """Вырезать столбцы [start, end) из кодов доски.
+    
+    Args:
+        codes: Коды фишек в порядке строк
+        width: Ширина доски
+        height: Высота доски
+        start: Первый столбец
+        end: Столбец после последнего
+    
+    Returns:
+        bytes: Коды подматрицы шириной end - start в порядке строк
+    """
+    return b''.join(codes[row * width + start:row * width + end] for row in range(height))
+
+
+def chain(results: Iterable[List]) -> List:
+    """Склеить списки результатов полос.
+    
+    Args:
+        results: Списки в порядке полос
+    
+    Returns:
+        List: Общий список
+    """
+    merged = []
+    for part in results:
+        merged.extend(part)
+    return merged
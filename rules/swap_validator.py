@@ -1,15 +1,30 @@
 """Валидатор для проверки допустимости свопов."""
 
-from typing import Set
+from typing import Callable, Set
 
 from board.board import Board
 from board.cell import Cell
 from board.tile import Tile
+from board.compact_board import CompactBoard
+from board.tile_kind import EMPTY_CODE
 
 
 class SwapValidator:
     """Валидатор для проверки допустимости свопов."""
     
+    def __init__(self, incremental: bool = False):
+        """Инициализировать валидатор.
+        
+        Args:
+            incremental: Проверять свопы локально, без копирования доски
+            
+        Note:
+            Локальная проверка учитывает только серии через переставленные
+            ячейки. На доске без совпадений (обычное состояние между ходами)
+            она эквивалентна полной проверке
+        """
+        self._incremental = incremental
+    
     def is_adjacent(self, a: Cell, b: Cell) -> bool:
         """Проверить, являются ли ячейки соседними.
         
@@ -42,6 +57,9 @@ class SwapValidator:
         if not board.is_inside(a) or not board.is_inside(b):
             raise ValueError("Ячейки вне доски")
         
+        if self._incremental:
+            return self.is_swap_creating_local_match(board, a, b)
+        
         # Симулируем своп
         simulated_board = self._simulate_swap(board, a, b)
         
@@ -52,6 +70,24 @@ class SwapValidator:
         
         return len(matches) > 0
     
+    def is_swap_creating_local_match(self, board: Board, a: Cell, b: Cell) -> bool:
+        """Проверить, создаёт ли своп серию через переставленные ячейки.
+        
+        Args:
+            board: Доска для проверки
+            a: Первая ячейка свопа (внутри доски)
+            b: Вторая ячейка свопа (внутри доски)
+            
+        Returns:
+            bool: True если после свопа через a или b проходит серия ≥3
+            
+        Note:
+            Доска не копируется: читается не более двух ячеек в каждую
+            сторону от переставленных ячеек
+        """
+        codes = board.codes() if isinstance(board, CompactBoard) else None
+        return self._creates_run(board, codes, a, b)
+    
     def is_valid_swap(self, board: Board, a: Cell, b: Cell) -> bool:
         """Проверить валидность свопа.
         
@@ -71,6 +107,129 @@ class SwapValidator:
         except ValueError:
             return False
     
+    def prepare(self, board: Board) -> Callable[[Cell, Cell], bool]:
+        """Подготовить проверку множества свопов на одной доске.
+        
+        Args:
+            board: Доска, которая не меняется, пока используется проверка
+            
+        Returns:
+            Callable[[Cell, Cell], bool]: Проверка свопа соседних ячеек
+            внутри доски с тем же результатом, что и is_valid_swap
+            
+        Note:
+            Ничего не читается заранее: коды фишек загружаются построчно
+            по мере продвижения проверок, а тройки на доске ищутся при первом
+            свопе без серии через переставленные ячейки. Поэтому поиск
+            первого хода, найденного в начале доски, не читает всю доску.
+            Своп валиден, если создаёт серию через переставленные ячейки либо
+            на доске остаётся тройка, которую он не задевает (своп одинаковых
+            фишек доску не меняет)
+        """
+        width = board.width()
+        height = board.height()
+        if isinstance(board, CompactBoard):
+            codes = board.codes()
+            loaded = height
+        else:
+            codes = bytearray(width * height)
+            loaded = 0
+        triples = None
+        
+        def load(rows: int) -> None:
+            nonlocal loaded
+            for row in range(loaded, min(rows, height)):
+                offset = row * width
+                for col in range(width):
+                    tile = board.tile_at(Cell.of(row, col))
+                    if tile is not None:
+                        codes[offset + col] = tile.kind().code()
+                loaded = row + 1
+        
+        def check(a: Cell, b: Cell) -> bool:
+            nonlocal triples
+            # Серия через переставленные ячейки задевает не более двух строк ниже
+            load(max(a.row(), b.row()) + 3)
+            if self._creates_run(board, codes, a, b):
+                return True
+            if self._incremental:
+                return False
+            
+            if triples is None:
+                load(height)
+                triples = self._triple_starts(codes, width, height)
+            if not triples:
+                return False
+            if codes[a.row() * width + a.col()] == codes[b.row() * width + b.col()]:
+                return True
+            touching = self._touching_triples(triples, width, a) | self._touching_triples(triples, width, b)
+            return len(triples) > len(touching)
+        
+        return check
+    
+    def _creates_run(self, board: Board, codes, a: Cell, b: Cell) -> bool:
+        """Проверить, создаёт ли своп серию через переставленные ячейки.
+        
+        Args:
+            board: Доска для проверки
+            codes: Буфер кодов доски или None для чтения через tile_at
+            a: Первая ячейка свопа
+            b: Вторая ячейка свопа
+            
+        Returns:
+            bool: True если после свопа через a или b проходит серия ≥3
+        """
+        code_a = self._code_at(board, codes, a.row(), a.col())
+        code_b = self._code_at(board, codes, b.row(), b.col())
+        
+        if code_a == code_b:
+            return False
+        
+        return (self._forms_run(board, codes, a, b, code_b) or
+                self._forms_run(board, codes, b, a, code_a))
+    
+    def _triple_starts(self, codes, width: int, height: int) -> Set:
+        """Найти начала всех троек одинаковых фишек подряд.
+        
+        Args:
+            codes: Коды фишек доски в порядке строк
+            width: Ширина доски
+            height: Высота доски
+            
+        Returns:
+            Set: Пары (направление, индекс начала), 0 - по строке, 1 - по столбцу
+        """
+        starts = set()
+        for index, code in enumerate(codes):
+            if code == EMPTY_CODE:
+                continue
+            row, col = divmod(index, width)
+            if col + 2 < width and codes[index + 1] == code and codes[index + 2] == code:
+                starts.add((0, index))
+            if row + 2 < height and codes[index + width] == code and codes[index + 2 * width] == code:
+                starts.add((1, index))
+        return starts
+    
+    def _touching_triples(self, triples: Set, width: int, cell: Cell) -> Set:
+        """Найти тройки, содержащие ячейку.
+        
+        Args:
+            triples: Начала троек (направление, индекс)
+            width: Ширина доски
+            cell: Ячейка
+            
+        Returns:
+            Set: Начала троек, в которые входит ячейка
+        """
+        row, col = cell.row(), cell.col()
+        touching = set()
+        for shift in range(3):
+            if col - shift >= 0 and (0, row * width + col - shift) in triples:
+                touching.add((0, row * width + col - shift))
+            if row - shift >= 0 and (1, (row - shift) * width + col) in triples:
+                touching.add((1, (row - shift) * width + col))
+        return touching
+    
     def _simulate_swap(self, board: Board, a: Cell, b: Cell) -> Board:
         """Симулировать своп на копии доски.
         
@@ -88,11 +247,11 @@ class SwapValidator:
         else:
             # Если нет метода clone, создаём новую доску и копируем содержимое
             from board.mutable_board import MutableBoard
-            simulated = MutableBoard()
+            simulated = MutableBoard(board.width(), board.height())
             for cell in board.enumerate_cells():
                 tile = board.tile_at(cell)
                 if tile is not None:
-                    simulated.set_tile(cell, Tile(tile.kind()))
+                    simulated.set_tile(cell, Tile.of(tile.kind()))
         
         # Выполняем своп на копии
         tile_a = simulated.tile_at(a)
@@ -101,3 +260,61 @@ class SwapValidator:
         simulated.set_tile(b, tile_a)
         
         return simulated
+    
+    def _forms_run(self, board: Board, codes, target: Cell, source: Cell, code: int) -> bool:
+        """Проверить, образует ли фишка, перенесённая в target, серию ≥3.
+        
+        Args:
+            board: Исходная доска
+            codes: Буфер кодов доски или None для чтения через tile_at
+            target: Ячейка, в которую переносится фишка
+            source: Ячейка, из которой переносится фишка
+            code: Код переносимой фишки
+            
+        Returns:
+            bool: True если по горизонтали или вертикали набирается ≥3
+        """
+        if code == EMPTY_CODE:
+            return False
+        
+        row, col = target.row(), target.col()
+        source_row, source_col = source.row(), source.col()
+        width, height = board.width(), board.height()
+        for dr, dc in ((0, 1), (1, 0)):
+            count = 1
+            for sign in (-1, 1):
+                for step in (1, 2):
+                    r, c = row + sign * step * dr, col + sign * step * dc
+                    # После свопа на месте source стоит другая фишка
+                    if r == source_row and c == source_col:
+                        break
+                    if not (0 <= r < height and 0 <= c < width):
+                        break
+                    if codes is not None:
+                        if codes[r * width + c] != code:
+                            break
+                    elif self._code_at(board, None, r, c) != code:
+                        break
+                    count += 1
+            if count >= 3:
+                return True
+        return False
+    
+    def _code_at(self, board: Board, codes, row: int, col: int) -> int:
+        """Прочитать код фишки без создания объектов, где это возможно.
+        
+        Args:
+            board: Доска для чтения
+            codes: Буфер кодов доски или None для чтения через tile_at
+            row: Номер строки
+            col: Номер столбца
+            
+        Returns:
+            int: Код фишки, 0 для пустой ячейки или ячейки вне доски
+        """
+        if not (0 <= row < board.height() and 0 <= col < board.width()):
+            return EMPTY_CODE
+        if codes is not None:
+            return codes[row * board.width() + col]
+        tile = board.tile_at(Cell.of(row, col))
+        return EMPTY_CODE if tile is None else tile.kind().code()
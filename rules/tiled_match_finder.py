@@ -0,0 +1,97 @@
+"""Поисковик совпадений по полосам доски в пуле процессов."""
+
+from typing import List, Optional
+
+from .run_length_match_finder import RunLengthMatchFinder, Run
+from .stripe_executor import StripeExecutor, chain, column_slice, row_slice
+
+
+_SCANNER = RunLengthMatchFinder()
+
+
+def _scan_row_stripe(chunk: bytes, width: int, row_offset: int) -> List[Run]:
+    """Найти горизонтальные серии в полосе строк.
+    
+    Args:
+        chunk: Коды строк полосы
+        width: Ширина доски
+        row_offset: Номер первой строки полосы на доске
+    
+    Returns:
+        List[Run]: Серии в координатах доски
+    """
+    runs = _SCANNER._scan_rows(chunk, width, len(chunk) // width)
+    return [(row + row_offset, start, end) for row, start, end in runs]
+
+
+def _scan_column_stripe(chunk: bytes, width: int, height: int, col_offset: int) -> List[Run]:
+    """Найти вертикальные серии в полосе столбцов.
+    
+    Args:
+        chunk: Коды столбцов полосы в порядке строк
+        width: Ширина полосы
+        height: Высота доски
+        col_offset: Номер первого столбца полосы на доске
+    
+    Returns:
+        List[Run]: Серии в координатах доски
+    """
+    runs = _SCANNER._scan_columns(chunk, width, height)
+    return [(col + col_offset, start, end) for col, start, end in runs]
+
+
+class TiledMatchFinder(RunLengthMatchFinder):
+    """Поисковик совпадений для очень больших досок.
+    
+    Горизонтальные серии ищутся в полосах целых строк, вертикальные - в
+    полосах целых столбцов. Каждая серия целиком лежит в одной полосе,
+    поэтому сшивка сводится к склейке списков в порядке полос, а
+    пересечения разрешаются как в RunLengthMatchFinder. Результат
+    совпадает с MatchFinder.
+    """
+    
+    def __init__(self, executor: Optional[StripeExecutor] = None):
+        """Инициализировать поисковик.
+        
+        Args:
+            executor: Исполнитель задач по полосам (по умолчанию все ядра)
+        """
+        self._executor = executor if executor is not None else StripeExecutor()
+    
+    def executor(self) -> StripeExecutor:
+        """Получить исполнитель задач по полосам.
+        
+        Returns:
+            StripeExecutor: Исполнитель
+        """
+        return self._executor
+    
+    def _scan_rows(self, codes: bytearray, width: int, height: int) -> List[Run]:
+        """Найти серии длиной ≥3 в строках по полосам.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+        
+        Returns:
+            List[Run]: Серии (строка, начальный столбец, конечный столбец)
+        """
+        tasks = [(row_slice(codes, width, start, end), width, start)
+                 for start, end in self._executor.stripes(height)]
+        return chain(self._executor.map(_scan_row_stripe, tasks))
+    
+    def _scan_columns(self, codes: bytearray, width: int, height: int) -> List[Run]:
+        """Найти серии длиной ≥3 в столбцах по полосам.
+        
+        Args:
+            codes: Коды фишек в порядке строк
+            width: Ширина доски
+            height: Высота доски
+        
+        Returns:
+            List[Run]: Серии (столбец, начальная строка, конечная строка)
+        """
+        tasks = [(column_slice(codes, width, height, start, end), end - start, height, start)
+                 for start, end in self._executor.stripes(width)]
+        return chain(self._executor.map(_scan_column_stripe, tasks))
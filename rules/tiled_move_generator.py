@@ -0,0 +1,108 @@
+"""Генератор ходов по полосам доски в пуле процессов."""
+
+from typing import Iterator, List, Optional, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.compact_board import CompactBoard
+from .pattern_move_generator import PatternMoveGenerator
+from .stripe_executor import StripeExecutor, row_slice
+from .tiled_match_finder import TiledMatchFinder
+
+
+# Строки ореола над полосой: шаблоны и тройки достают на две клетки вверх
+HALO_ABOVE = 2
+# Строки ореола под полосой: сосед свопа вниз и ещё две клетки за ним
+HALO_BELOW = 3
+
+_GENERATOR = PatternMoveGenerator()
+
+
+def _stripe_moves(window: bytes, width: int, own_start: int, own_end: int,
+                  row_offset: int, total: int) -> List[Tuple[int, int, int, int]]:
+    """Найти валидные ходы, начинающиеся в строках полосы.
+    
+    Args:
+        window: Коды строк полосы вместе с ореолом
+        width: Ширина доски
+        own_start: Первая строка полосы внутри окна
+        own_end: Строка после последней строки полосы внутри окна
+        row_offset: Номер первой строки окна на доске
+        total: Число троек на всей доске
+    
+    Returns:
+        List[Tuple[int, int, int, int]]: Ходы (строка, столбец, dr, dc) в координатах доски
+    
+    Note:
+        Тройки окна, задевающие ячейки свопов полосы, целиком лежат в
+        окне, поэтому локальных отметок начал достаточно, а общее число
+        троек берётся с доски
+    """
+    height = len(window) // width
+    horizontal, vertical, _ = _GENERATOR._triple_starts(window, width, height)
+    triples = (horizontal, vertical, total)
+    
+    moves = []
+    for row in range(own_start, own_end):
+        for col in range(width):
+            for dr, dc in ((0, 1), (1, 0)):
+                if row + dr < height and col + dc < width:
+                    if _GENERATOR._is_valid(window, width, height, triples, row, col, dr, dc):
+                        moves.append((row + row_offset, col, dr, dc))
+    return moves
+
+
+class TiledMoveGenerator(PatternMoveGenerator):
+    """Генератор ходов для очень больших досок.
+    
+    Доска делится на горизонтальные полосы с ореолом в HALO_ABOVE строк
+    сверху и HALO_BELOW снизу. Каждая полоса проверяет только свопы,
+    первая ячейка которых лежит в ней, поэтому ходы на границах полос не
+    теряются и не дублируются. Общее число троек считается заранее по
+    сериям TiledMatchFinder. Результат и порядок ходов совпадают с
+    MoveGenerator.
+    """
+    
+    def __init__(self, executor: Optional[StripeExecutor] = None):
+        """Инициализировать генератор.
+        
+        Args:
+            executor: Исполнитель задач по полосам (по умолчанию все ядра)
+        """
+        super().__init__()
+        self._finder = TiledMatchFinder(executor)
+    
+    def executor(self) -> StripeExecutor:
+        """Получить исполнитель задач по полосам.
+        
+        Returns:
+            StripeExecutor: Исполнитель
+        """
+        return self._finder.executor()
+    
+    def _iter_moves(self, board: Board) -> Iterator[Tuple[Cell, Cell]]:
+        """Перебрать валидные ходы по полосам.
+        
+        Args:
+            board: Доска для анализа
+        
+        Returns:
+            Iterator[Tuple[Cell, Cell]]: Ходы в порядке обхода доски
+        """
+        codes = CompactBoard.codes_of(board)
+        width = board.width()
+        height = board.height()
+        
+        # В серии длины L ровно L - 2 начала троек
+        runs = self._finder._scan_rows(codes, width, height) + self._finder._scan_columns(codes, width, height)
+        total = sum(end - start - 2 for _, start, end in runs)
+        
+        tasks = []
+        for start, end in self.executor().stripes(height):
+            top = max(start - HALO_ABOVE, 0)
+            bottom = min(end + HALO_BELOW, height)
+            tasks.append((row_slice(codes, width, top, bottom), width, start - top, end - top, top, total))
+        
+        for moves in self.executor().map(_stripe_moves, tasks):
+            for row, col, dr, dc in moves:
+                yield (Cell.of(row, col), Cell.of(row + dr, col + dc))
@@ -0,0 +1,20 @@
+"""Пакет для поиска ходов и запоминания оценок позиций."""
+
+from .transposition_table import (
+    TranspositionTable,
+    LruTranspositionTable,
+    DepthPreferredTranspositionTable
+)
+from .caching_match_finder import CachingMatchFinder
+from .caching_move_generator import CachingMoveGenerator
+from .move_search import MoveSearch, SearchResult
+
+__all__ = [
+    'TranspositionTable',
+    'LruTranspositionTable',
+    'DepthPreferredTranspositionTable',
+    'CachingMatchFinder',
+    'CachingMoveGenerator',
+    'MoveSearch',
+    'SearchResult'
+]
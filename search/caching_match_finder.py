@@ -0,0 +1,76 @@
+"""Поисковик совпадений с запоминанием результатов по хешу доски."""
+
+from typing import Optional, Set
+
+from board.board import Board
+from board.cell import Cell
+from board.zobrist import zobrist_board_key
+from rules.match_finder import MatchFinder
+from .transposition_table import TranspositionTable, LruTranspositionTable
+
+
+class CachingMatchFinder(MatchFinder):
+    """Обёртка над поисковиком совпадений с таблицей транспозиций.
+    
+    Повторный поиск на доске того же размера с тем же хешем Zobrist возвращает
+    запомненные группы без просмотра доски.
+    """
+    
+    def __init__(self, inner: Optional[MatchFinder] = None,
+                 table: Optional[TranspositionTable] = None):
+        """Инициализировать поисковик.
+        
+        Args:
+            inner: Поисковик, выполняющий поиск при промахе
+            table: Таблица для результатов (по умолчанию LRU)
+        """
+        self._inner = inner if inner is not None else MatchFinder()
+        self._table = table if table is not None else LruTranspositionTable()
+    
+    def table(self) -> TranspositionTable:
+        """Получить таблицу результатов.
+        
+        Returns:
+            TranspositionTable: Используемая таблица
+        """
+        return self._table
+    
+    def find_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти все совпадения на доске.
+        
+        Args:
+            board: Доска для поиска совпадений
+        
+        Returns:
+            Set[Set[Cell]]: Множество групп ячеек с совпадениями
+        """
+        key = zobrist_board_key(board)
+        matches = self._table.get(key)
+        if matches is None:
+            matches = frozenset(self._inner.find_matches(board))
+            self._table.put(key, matches)
+        
+        # Вызывающий код может изменять множество, поэтому отдаём копию
+        return set(matches)
+    
+    def find_horizontal_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти горизонтальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+        
+        Returns:
+            Set[Set[Cell]]: Горизонтальные группы совпадений
+        """
+        return self._inner.find_horizontal_matches(board)
+    
+    def find_vertical_matches(self, board: Board) -> Set[Set[Cell]]:
+        """Найти вертикальные совпадения.
+        
+        Args:
+            board: Доска для поиска
+        
+        Returns:
+            Set[Set[Cell]]: Вертикальные группы совпадений
+        """
+        return self._inner.find_vertical_matches(board)
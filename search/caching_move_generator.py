@@ -0,0 +1,64 @@
+"""Генератор ходов с запоминанием результатов по хешу доски."""
+
+from typing import Iterator, Optional, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.zobrist import zobrist_board_key
+from rules.move_generator import MoveGenerator
+from .transposition_table import TranspositionTable, LruTranspositionTable
+
+
+class CachingMoveGenerator(MoveGenerator):
+    """Обёртка над генератором ходов с таблицей транспозиций.
+    
+    Список ходов позиции вычисляется один раз и используется всеми
+    методами генератора, пока запись не вытеснена из таблицы.
+    """
+    
+    def __init__(self, inner: Optional[MoveGenerator] = None,
+                 table: Optional[TranspositionTable] = None):
+        """Инициализировать генератор.
+        
+        Args:
+            inner: Генератор, выполняющий поиск при промахе
+            table: Таблица для результатов (по умолчанию LRU)
+        """
+        super().__init__()
+        self._inner = inner if inner is not None else MoveGenerator()
+        self._table = table if table is not None else LruTranspositionTable()
+    
+    def table(self) -> TranspositionTable:
+        """Получить таблицу результатов.
+        
+        Returns:
+            TranspositionTable: Используемая таблица
+        """
+        return self._table
+    
+    def _iter_moves(self, board: Board) -> Iterator[Tuple[Cell, Cell]]:
+        """Перебрать валидные ходы из таблицы или через вложенный генератор.
+        
+        Args:
+            board: Доска для анализа
+        
+        Returns:
+            Iterator[Tuple[Cell, Cell]]: Ходы в порядке обхода доски
+        """
+        return iter(self._cached_moves(board))
+    
+    def _cached_moves(self, board: Board) -> Tuple[Tuple[Cell, Cell], ...]:
+        """Получить ходы позиции, вычислив их при промахе.
+        
+        Args:
+            board: Доска для анализа
+        
+        Returns:
+            Tuple[Tuple[Cell, Cell], ...]: Неизменяемый список ходов
+        """
+        key = zobrist_board_key(board)
+        moves = self._table.get(key)
+        if moves is None:
+            moves = tuple(self._inner.generate_all_moves(board))
+            self._table.put(key, moves)
+        return moves
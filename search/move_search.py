@@ -0,0 +1,255 @@
+"""Поиск хода с просмотром вперёд методом expectimax."""
+
+import time
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple
+
+from board.board import Board
+from board.cell import Cell
+from board.zobrist import zobrist_board_key
+from random_generator.random_provider_default import RandomProviderDefault
+from scoring.combo_tracker import ComboTracker
+from control.game_controller import GameController
+from control.service_container import ServiceContainer
+from metrics.null_metrics import NullMetrics
+from .transposition_table import TranspositionTable, LruTranspositionTable
+
+
+Move = Tuple[Cell, Cell]
+
+
+@dataclass
+class SearchResult:
+    """Итог поиска хода."""
+    
+    best_move: Optional[Move]
+    expected_score: float
+    depth: int
+    ranked_moves: List[Tuple[Move, float]] = field(default_factory=list)
+    nodes: int = 0
+    timed_out: bool = False
+
+
+class _SearchTimeout(Exception):
+    """Сигнал исчерпания бюджета времени внутри поиска."""
+
+
+class MoveSearch:
+    """Поиск хода с максимальным ожидаемым счётом на несколько ходов вперёд.
+    
+    Ходы игрока - узлы максимума, заполнение доски после каскада - узлы
+    случая. Случай оценивается по нескольким выборкам заполнения, каждая
+    со своим поставщиком случайностей с детерминированным seed, поэтому
+    одна и та же позиция всегда получает одну и ту же оценку.
+    
+    Глубина увеличивается итеративно, пока не истечёт бюджет времени;
+    результат последней полностью просмотренной глубины возвращается
+    всегда, даже если следующая была прервана. Срок проверяется перед
+    каждым ходом при построении позиций, перед каждой выборкой заполнения
+    и после каждого шага её каскада, поэтому поиск превышает бюджет
+    не больше чем на один шаг каскада или одну генерацию ходов.
+    
+    Note:
+        Экземпляр хранит состояние текущего поиска и не должен
+        использоваться из нескольких потоков одновременно
+    """
+    
+    def __init__(self, services: ServiceContainer, samples: int = 4, max_depth: int = 3,
+                 branching: int = 6, seed: int = 0, table: Optional[TranspositionTable] = None):
+        """Инициализировать поиск.
+        
+        Args:
+            services: Контейнер с игровыми сервисами
+            samples: Количество выборок заполнения в узле случая
+            max_depth: Максимальная глубина в ходах игрока
+            branching: Сколько лучших по немедленным очкам ходов
+                рассматривается во внутренних узлах
+            seed: Начальное значение выборок заполнения
+            table: Таблица оценок позиций (по умолчанию LRU)
+            
+        Raises:
+            ValueError: Если samples, max_depth или branching не положительны
+        """
+        if samples <= 0 or max_depth <= 0 or branching <= 0:
+            raise ValueError("Параметры поиска должны быть положительными")
+        
+        self._move_generator = services.get_move_generator()
+        self._match_finder = services.get_match_finder()
+        self._score_manager = services.get_score_manager()
+        self._max_depth = max_depth
+        self._branching = branching
+        self._seed = seed
+        self._table = table if table is not None else LruTranspositionTable()
+        
+        # У каждой выборки свой поставщик, трекер комбо и пустые метрики,
+        # чтобы каскады поиска не затрагивали сервисы и замеры идущей игры
+        self._providers = []
+        self._controllers = []
+        for _ in range(samples):
+            provider = RandomProviderDefault(seed)
+            sample_services = services.copy()
+            sample_services.register_random_provider(provider)
+            sample_services.register_combo_tracker(ComboTracker())
+            sample_services.register_metrics(NullMetrics())
+            self._providers.append(provider)
+            self._controllers.append(GameController(sample_services))
+        
+        self._deadline = 0.0
+        self._nodes = 0
+    
+    def best_move(self, board: Board, time_budget: float) -> Optional[Move]:
+        """Найти лучший ход за отведённое время.
+        
+        Args:
+            board: Доска для анализа
+            time_budget: Бюджет времени в секундах
+            
+        Returns:
+            Optional[Move]: Лучший ход или None, если ходов нет
+        """
+        return self.search(board, time_budget).best_move
+    
+    def search(self, board: Board, time_budget: float,
+               max_depth: Optional[int] = None) -> SearchResult:
+        """Оценить все ходы с итеративным углублением.
+        
+        Args:
+            board: Доска для анализа
+            time_budget: Бюджет времени в секундах
+            max_depth: Ограничение глубины (по умолчанию из конструктора)
+            
+        Returns:
+            SearchResult: Лучший ход и оценки всех ходов последней
+            полностью просмотренной глубины; глубина 0 означает
+            упорядочивание только по немедленным очкам. Если бюджет
+            истёк уже при их подсчёте, оцениваются только успевшие ходы
+        """
+        self._deadline = time.perf_counter() + time_budget
+        self._nodes = 0
+        depth_limit = self._max_depth if max_depth is None else max_depth
+        
+        children = self._ordered_children(board, None, partial=True)
+        if not children:
+            return SearchResult(None, 0.0, 0)
+        
+        ranked = [(move, float(immediate)) for move, immediate, _ in children]
+        result = SearchResult(ranked[0][0], ranked[0][1], 0, ranked)
+        if time.perf_counter() > self._deadline:
+            result.timed_out = True
+            result.nodes = self._nodes
+            return result
+        
+        for depth in range(1, depth_limit + 1):
+            try:
+                ranked = [(move, self._chance_value(swapped, depth))
+                          for move, _, swapped in children]
+            except _SearchTimeout:
+                result.timed_out = True
+                break
+            
+            # Сортировка устойчива: при равенстве оценок выигрывает ход
+            # с большими немедленными очками
+            ranked.sort(key=lambda item: -item[1])
+            result = SearchResult(ranked[0][0], ranked[0][1], depth, ranked)
+        
+        result.nodes = self._nodes
+        return result
+    
+    def _ordered_children(self, board: Board, limit: Optional[int],
+                          partial: bool = False) -> List[Tuple[Move, int, Board]]:
+        """Построить позиции после каждого хода в порядке немедленных очков.
+        
+        Args:
+            board: Доска для анализа
+            limit: Сколько лучших ходов оставить (None для всех)
+            partial: При истечении бюджета вернуть уже построенные позиции
+                (хотя бы одну) вместо исключения
+            
+        Returns:
+            List[Tuple[Move, int, Board]]: Ход, очки первого удаления и доска после свопа
+            
+        Raises:
+            _SearchTimeout: Если истёк бюджет времени и partial не задан
+            
+        Note:
+            Ходы, приводящие к одинаковой позиции, доминируют друг над
+            другом, поэтому из них остаётся только первый
+        """
+        children = []
+        seen = set()
+        for move in self._move_generator.generate_all_moves(board):
+            if time.perf_counter() > self._deadline:
+                if not partial:
+                    raise _SearchTimeout()
+                if children:
+                    break
+            
+            swapped = board.clone()
+            swapped.swap(*move)
+            key = swapped.zobrist_hash()
+            if key in seen:
+                continue
+            seen.add(key)
+            
+            removed = sum(len(group) for group in self._match_finder.find_matches(swapped))
+            immediate = self._score_manager.score_for_removed(removed, 0)
+            children.append((move, immediate, swapped))
+        
+        children.sort(key=lambda child: -child[1])
+        return children if limit is None else children[:limit]
+    
+    def _chance_value(self, swapped: Board, depth: int) -> float:
+        """Оценить позицию после свопа как среднее по выборкам заполнения.
+        
+        Args:
+            swapped: Доска сразу после свопа
+            depth: Оставшаяся глубина, включая текущий ход
+            
+        Returns:
+            float: Ожидаемые очки каскада и последующих ходов
+            
+        Raises:
+            _SearchTimeout: Если истёк бюджет времени
+        """
+        if time.perf_counter() > self._deadline:
+            raise _SearchTimeout()
+        
+        key = zobrist_board_key(swapped)
+        cached = self._table.get(key, min_depth=depth)
+        if cached is not None and cached[0] == depth:
+            return cached[1]
+        
+        self._nodes += 1
+        total = 0.0
+        for index, controller in enumerate(self._controllers):
+            if time.perf_counter() > self._deadline:
+                raise _SearchTimeout()
+            self._providers[index].set_seed(hash((self._seed, key, index)))
+            after = swapped.clone()
+            for step in controller.iter_cascade(after):
+                if time.perf_counter() > self._deadline:
+                    raise _SearchTimeout()
+                total += step.points
+            total += self._max_value(after, depth - 1)
+        
+        value = total / len(self._controllers)
+        self._table.put(key, (depth, value), depth)
+        return value
+    
+    def _max_value(self, board: Board, depth: int) -> float:
+        """Оценить позицию хода игрока лучшим из ходов.
+        
+        Args:
+            board: Стабильная доска после каскада
+            depth: Оставшаяся глубина
+            
+        Returns:
+            float: Ожидаемые очки лучшего хода или 0 на границе поиска
+        """
+        if depth == 0:
+            return 0.0
+        
+        children = self._ordered_children(board, self._branching)
+        if not children:
+            return 0.0
+        return max(self._chance_value(swapped, depth) for _, _, swapped in children)
@@ -0,0 +1,222 @@
+"""Таблицы транспозиций для запоминания оценок позиций по хешу доски."""
+
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Any, List, Optional, Tuple
+
+
+class TranspositionTable(ABC):
+    """Абстрактная таблица транспозиций ограниченного размера.
+    
+    Ключом служит хеш доски с её размерами, к значению прилагается глубина,
+    на которой оно получено (0 для точных значений без поиска).
+    """
+    
+    def __init__(self, capacity: int):
+        """Инициализировать таблицу.
+        
+        Args:
+            capacity: Максимальное количество записей
+        
+        Raises:
+            ValueError: Если capacity не положительна
+        """
+        if capacity <= 0:
+            raise ValueError("Ёмкость таблицы должна быть положительной")
+        self._capacity = capacity
+        self._hits = 0
+        self._misses = 0
+    
+    def capacity(self) -> int:
+        """Получить ёмкость таблицы.
+        
+        Returns:
+            int: Максимальное количество записей
+        """
+        return self._capacity
+    
+    def hits(self) -> int:
+        """Получить количество успешных поисков.
+        
+        Returns:
+            int: Число попаданий
+        """
+        return self._hits
+    
+    def misses(self) -> int:
+        """Получить количество неудачных поисков.
+        
+        Returns:
+            int: Число промахов
+        """
+        return self._misses
+    
+    def get(self, key: int, min_depth: int = 0) -> Optional[Any]:
+        """Найти значение позиции.
+        
+        Args:
+            key: Хеш доски
+            min_depth: Минимальная глубина, на которой должно быть получено значение
+        
+        Returns:
+            Optional[Any]: Сохранённое значение или None
+        """
+        entry = self._lookup(key)
+        if entry is None or entry[0] < min_depth:
+            self._misses += 1
+            return None
+        self._hits += 1
+        return entry[1]
+    
+    @abstractmethod
+    def put(self, key: int, value: Any, depth: int = 0) -> None:
+        """Сохранить значение позиции.
+        
+        Args:
+            key: Хеш доски
+            value: Значение для сохранения
+            depth: Глубина, на которой получено значение
+        """
+        pass
+    
+    @abstractmethod
+    def size(self) -> int:
+        """Получить количество записей.
+        
+        Returns:
+            int: Текущее количество записей
+        """
+        pass
+    
+    @abstractmethod
+    def clear(self) -> None:
+        """Удалить все записи."""
+        pass
+    
+    @abstractmethod
+    def _lookup(self, key: int) -> Optional[Tuple[int, Any]]:
+        """Найти запись без учёта статистики.
+        
+        Args:
+            key: Хеш доски
+        
+        Returns:
+            Optional[Tuple[int, Any]]: Пара (глубина, значение) или None
+        """
+        pass
+
+
+class LruTranspositionTable(TranspositionTable):
+    """Таблица транспозиций с вытеснением давно не использованных записей."""
+    
+    def __init__(self, capacity: int = 65536):
+        """Инициализировать таблицу.
+        
+        Args:
+            capacity: Максимальное количество записей
+        """
+        super().__init__(capacity)
+        self._entries: OrderedDict = OrderedDict()
+    
+    def put(self, key: int, value: Any, depth: int = 0) -> None:
+        """Сохранить значение позиции, вытеснив самую старую запись при переполнении.
+        
+        Args:
+            key: Хеш доски
+            value: Значение для сохранения
+            depth: Глубина, на которой получено значение
+        """
+        self._entries[key] = (depth, value)
+        self._entries.move_to_end(key)
+        if len(self._entries) > self._capacity:
+            self._entries.popitem(last=False)
+    
+    def size(self) -> int:
+        """Получить количество записей.
+        
+        Returns:
+            int: Текущее количество записей
+        """
+        return len(self._entries)
+    
+    def clear(self) -> None:
+        """Удалить все записи."""
+        self._entries.clear()
+    
+    def _lookup(self, key: int) -> Optional[Tuple[int, Any]]:
+        """Найти запись и отметить её как недавно использованную.
+        
+        Args:
+            key: Хеш доски
+        
+        Returns:
+            Optional[Tuple[int, Any]]: Пара (глубина, значение) или None
+        """
+        entry = self._entries.get(key)
+        if entry is not None:
+            self._entries.move_to_end(key)
+        return entry
+
+
+class DepthPreferredTranspositionTable(TranspositionTable):
+    """Таблица транспозиций с прямой адресацией и приоритетом глубины.
+    
+    Каждый ключ попадает в слот key % capacity. Запись в занятом слоте
+    заменяется, только если новое значение получено на той же или большей
+    глубине, поэтому дорогие результаты глубокого поиска не вытесняются
+    дешёвыми.
+    """
+    
+    def __init__(self, capacity: int = 65536):
+        """Инициализировать таблицу.
+        
+        Args:
+            capacity: Количество слотов
+        """
+        super().__init__(capacity)
+        self._slots: List[Optional[Tuple[int, int, Any]]] = [None] * capacity
+        self._size = 0
+    
+    def put(self, key: int, value: Any, depth: int = 0) -> None:
+        """Сохранить значение, если слот свободен или новое значение не мельче.
+        
+        Args:
+            key: Хеш доски
+            value: Значение для сохранения
+            depth: Глубина, на которой получено значение
+        """
+        index = key % self._capacity
+        slot = self._slots[index]
+        if slot is None:
+            self._size += 1
+        elif slot[1] > depth:
+            # Более глубокое значение сохраняется и для того же ключа
+            return
+        self._slots[index] = (key, depth, value)
+    
+    def size(self) -> int:
+        """Получить количество занятых слотов.
+        
+        Returns:
+            int: Текущее количество записей
+        """
+        return self._size
+    
+    def clear(self) -> None:
+        """Удалить все записи."""
+        self._slots = [None] * self._capacity
+        self._size = 0
+    
+    def _lookup(self, key: int) -> Optional[Tuple[int, Any]]:
+        """Найти запись в слоте ключа.
+        
+        Args:
+            key: Хеш доски
+        
+        Returns:
+            Optional[Tuple[int, Any]]: Пара (глубина, значение) или None
+        """
+        slot = self._slots[key % self._capacity]
+        if slot is None or slot[0] != key:
+            return None
+        return slot[1], slot[2]
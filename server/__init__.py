@@ -0,0 +1,15 @@
+"""Пакет для сетевой игры множества игроков."""
+
+from .latency_stats import LatencyStats
+from .game_session import GameSession, create_server_services, format_board
+from .game_server import GameServer
+from .load_client import LoadClient
+
+__all__ = [
+    'LatencyStats',
+    'GameSession',
+    'create_server_services',
+    'format_board',
+    'GameServer',
+    'LoadClient'
+]
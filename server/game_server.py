@@ -0,0 +1,185 @@
+"""Асинхронный сервер множества игровых сессий."""
+
+import argparse
+import asyncio
+import json
+import time
+from typing import Callable, Dict, Optional, Tuple, Union
+
+from control.board_pool import BoardPool
+from control.service_container import ServiceContainer
+from metrics.metrics_http_server import MetricsHttpServer
+from metrics.metrics_registry import MetricsRegistry
+from .game_session import GameSession, create_server_services
+from .latency_stats import LatencyStats
+
+
+class GameServer:
+    """Сервер на asyncio: одно соединение - одна GameSession.
+    
+    Протокол строковый (UTF-8, одна команда на строку), команды
+    описаны в GameSession. Дополнительно сервер отвечает на STATS
+    сводкой задержек по командам в JSON. Задержка запроса измеряется
+    от получения строки до записи ответа в буфер сокета.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 0, unix_path: Optional[str] = None,
+                 services_factory: Callable[[Optional[int]], ServiceContainer] = create_server_services,
+                 pool_capacity: int = 0):
+        """Создать сервер.
+        
+        Args:
+            host: Адрес для TCP
+            port: Порт для TCP (0 - выбрать свободный)
+            unix_path: Путь Unix-сокета вместо TCP
+            services_factory: Фабрика сервисов партии по seed
+            pool_capacity: Размер пула готовых досок (0 - без пула)
+        """
+        self._host = host
+        self._port = port
+        self._unix_path = unix_path
+        self._services_factory = services_factory
+        self._board_pool = BoardPool(pool_capacity) if pool_capacity > 0 else None
+        self._server: Optional[asyncio.AbstractServer] = None
+        self._sessions = 0
+        self._stats: Dict[str, LatencyStats] = {}
+    
+    async def start(self) -> None:
+        """Начать принимать соединения."""
+        if self._board_pool is not None:
+            self._board_pool.start()
+        if self._unix_path is not None:
+            self._server = await asyncio.start_unix_server(self._handle_connection, self._unix_path,
+                                                           backlog=4096)
+        else:
+            self._server = await asyncio.start_server(self._handle_connection, self._host, self._port,
+                                                      backlog=4096)
+    
+    def address(self) -> Union[Tuple[str, int], str]:
+        """Получить адрес, на котором слушает сервер.
+        
+        Returns:
+            Union[Tuple[str, int], str]: (host, port) для TCP или путь Unix-сокета
+        """
+        if self._unix_path is not None:
+            return self._unix_path
+        host, port = self._server.sockets[0].getsockname()[:2]
+        return host, port
+    
+    async def serve_forever(self) -> None:
+        """Обслуживать соединения до отмены."""
+        await self._server.serve_forever()
+    
+    async def close(self) -> None:
+        """Перестать принимать соединения и остановить пул досок."""
+        if self._server is not None:
+            self._server.close()
+            await self._server.wait_closed()
+        if self._board_pool is not None:
+            self._board_pool.stop()
+    
+    def sessions(self) -> int:
+        """Получить количество открытых сессий.
+        
+        Returns:
+            int: Число активных соединений
+        """
+        return self._sessions
+    
+    def stats(self) -> Dict[str, LatencyStats]:
+        """Получить статистику задержек по командам.
+        
+        Returns:
+            Dict[str, LatencyStats]: Статистика по имени команды
+        """
+        return self._stats
+    
+    async def _handle_connection(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter) -> None:
+        """Обслужить соединение одного игрока.
+        
+        Args:
+            reader: Поток запросов
+            writer: Поток ответов
+        """
+        session = GameSession(self._services_factory, self._board_pool)
+        self._sessions += 1
+        try:
+            while not session.is_closed():
+                line = await reader.readline()
+                if not line:
+                    break
+                started = time.perf_counter_ns()
+                request = line.decode('utf-8', errors='replace').strip()
+                command = request.partition(' ')[0].upper()
+                if command == 'STATS':
+                    reply = 'OK ' + json.dumps({name: stats.summary() for name, stats in self._stats.items()})
+                else:
+                    reply = session.handle(request)
+                writer.write(reply.encode('utf-8') + b'\n')
+                self._record(command, (time.perf_counter_ns() - started) // 1000)
+                await writer.drain()
+        except ConnectionError:
+            pass
+        finally:
+            self._sessions -= 1
+            writer.close()
+    
+    def _record(self, command: str, micros: int) -> None:
+        """Учесть задержку запроса.
+        
+        Args:
+            command: Имя команды
+            micros: Задержка в микросекундах
+        """
+        stats = self._stats.get(command)
+        if stats is None:
+            stats = self._stats[command] = LatencyStats()
+        stats.record(micros)
+
+
+def main() -> None:
+    """Точка входа сервера."""
+    parser = argparse.ArgumentParser(description="Сервер игры 'Три-в-ряд'")
+    parser.add_argument('--host', default='127.0.0.1', help="Адрес TCP")
+    parser.add_argument('--port', type=int, default=7878, help="Порт TCP")
+    parser.add_argument('--unix', default=None, help="Путь Unix-сокета вместо TCP")
+    parser.add_argument('--pool', type=int, default=64, help="Размер пула готовых досок (0 - без пула)")
+    parser.add_argument('--metrics-port', type=int, default=None,
+                        help="Порт HTTP для /metrics (Prometheus) и /metrics.json; без него метрики выключены")
+    args = parser.parse_args()
+    
+    services_factory = create_server_services
+    metrics_server = None
+    if args.metrics_port is not None:
+        metrics = MetricsRegistry()
+        
+        def services_factory(seed: Optional[int]) -> ServiceContainer:
+            services = create_server_services(seed)
+            services.register_metrics(metrics)
+            return services
+        
+        metrics_server = MetricsHttpServer(metrics, port=args.metrics_port)
+        metrics_server.start()
+        metrics_host, metrics_port = metrics_server.address()
+        print(f"Метрики: http://{metrics_host}:{metrics_port}/metrics")
+    
+    async def serve() -> None:
+        server = GameServer(args.host, args.port, args.unix, services_factory, pool_capacity=args.pool)
+        await server.start()
+        print(f"Сервер слушает {server.address()}")
+        try:
+            await server.serve_forever()
+        finally:
+            await server.close()
+    
+    try:
+        asyncio.run(serve())
+    except KeyboardInterrupt:
+        pass
+    finally:
+        if metrics_server is not None:
+            metrics_server.close()
+
+
+if __name__ == "__main__":
+    main()
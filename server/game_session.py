@@ -0,0 +1,181 @@
+"""Игровая сессия сервера: состояние одной партии и разбор команд."""
+
+from typing import Callable, Optional
+
+from board.board import Board
+from board.cell import Cell
+from console_interface.console_io import parse_move
+from control.board_pool import BoardPool
+from control.game_controller import GameController
+from control.game_state import GameState
+from control.service_container import ServiceContainer
+from main import create_game_services, initialize_game
+from rules.pattern_move_generator import PatternMoveGenerator
+from rules.run_length_match_finder import RunLengthMatchFinder
+
+
+def create_server_services(seed: Optional[int] = None) -> ServiceContainer:
+    """Создать сервисы партии с быстрыми поиском совпадений и генерацией ходов.
+    
+    Args:
+        seed: Начальное значение поставщика случайностей
+    
+    Returns:
+        ServiceContainer: Контейнер сервисов партии
+    """
+    services = create_game_services(seed)
+    services.register_match_finder(RunLengthMatchFinder())
+    services.register_move_generator(PatternMoveGenerator())
+    return services
+
+
+def format_board(board: Board) -> str:
+    """Представить доску одной строкой.
+    
+    Args:
+        board: Доска
+    
+    Returns:
+        str: Строки доски через '/', пустая ячейка - '.'
+    """
+    rows = []
+    for row in range(board.height()):
+        symbols = []
+        for col in range(board.width()):
+            tile = board.tile_at(Cell.of(row, col))
+            symbols.append(tile.kind().value if tile is not None else '.')
+        rows.append(''.join(symbols))
+    return '/'.join(rows)
+
+
+class GameSession:
+    """Сессия одного игрока со своими GameState и GameController.
+    
+    Команды протокола (по одной на строку):
+        NEW [seed]               начать партию
+        MOVE row1 col1 row2 col2 сделать ход (формат ConsoleIO)
+        BOARD                    получить счёт и доску
+        HINT                     получить доступный ход
+        QUIT                     завершить сессию
+    
+    Ответ - одна строка: "OK ...", "OVER score board" после последнего
+    хода партии или "ERR сообщение".
+    """
+    
+    def __init__(self, services_factory: Callable[[Optional[int]], ServiceContainer] = create_server_services,
+                 board_pool: Optional[BoardPool] = None):
+        """Создать сессию без партии.
+        
+        Args:
+            services_factory: Фабрика сервисов партии по seed
+            board_pool: Пул готовых досок для партий без seed
+        """
+        self._services_factory = services_factory
+        self._board_pool = board_pool
+        self._services: Optional[ServiceContainer] = None
+        self._controller: Optional[GameController] = None
+        self._state: Optional[GameState] = None
+        self._closed = False
+    
+    def is_closed(self) -> bool:
+        """Проверить, завершена ли сессия командой QUIT.
+        
+        Returns:
+            bool: True если сессия завершена
+        """
+        return self._closed
+    
+    def state(self) -> Optional[GameState]:
+        """Получить состояние текущей партии.
+        
+        Returns:
+            Optional[GameState]: Состояние или None до команды NEW
+        """
+        return self._state
+    
+    def handle(self, line: str) -> str:
+        """Выполнить команду и сформировать ответ.
+        
+        Args:
+            line: Строка запроса без перевода строки
+        
+        Returns:
+            str: Строка ответа без перевода строки
+        """
+        command, _, arguments = line.strip().partition(' ')
+        command = command.upper()
+        try:
+            if command == 'NEW':
+                return self._new_game(arguments)
+            if command == 'QUIT':
+                self._closed = True
+                return 'OK'
+            if self._state is None:
+                return 'ERR Партия не начата, отправьте NEW'
+            if command == 'MOVE':
+                return self._move(arguments)
+            if command == 'BOARD':
+                return self._board_reply('OK')
+            if command == 'HINT':
+                return self._hint()
+            return f'ERR Неизвестная команда: {command}'
+        except ValueError as e:
+            return f'ERR {e}'
+    
+    def _new_game(self, arguments: str) -> str:
+        """Начать новую партию.
+        
+        Args:
+            arguments: Необязательный seed
+        
+        Returns:
+            str: Ответ с начальной доской
+        """
+        seed = int(arguments) if arguments.strip() else None
+        self._services = self._services_factory(seed)
+        # Доски из пула не воспроизводимы, поэтому партии с seed строятся заново
+        if seed is None and self._board_pool is not None:
+            self._services.register_board_pool(self._board_pool)
+        self._controller = GameController(self._services)
+        self._state = initialize_game(self._services)
+        return self._board_reply('OK')
+    
+    def _move(self, arguments: str) -> str:
+        """Выполнить ход.
+        
+        Args:
+            arguments: Координаты в формате ConsoleIO
+        
+        Returns:
+            str: Ответ с новой доской или ошибка для невалидного хода
+        """
+        if self._controller.is_game_over(self._state):
+            return self._board_reply('OVER')
+        a, b = parse_move(arguments, self._state.board.width(), self._state.board.height())
+        if not self._controller.perform_move(self._state, a, b):
+            return 'ERR Неверный ход'
+        self._controller.update_moves_available(self._state)
+        return self._board_reply('OVER' if self._controller.is_game_over(self._state) else 'OK')
+    
+    def _hint(self) -> str:
+        """Подсказать доступный ход.
+        
+        Returns:
+            str: Ход в формате MOVE или ошибка, если ходов нет
+        """
+        move = self._services.get_move_generator().find_first_move(self._state.board)
+        if move is None:
+            return 'ERR Нет доступных ходов'
+        a, b = move
+        return f'OK {a.row()} {a.col()} {b.row()} {b.col()}'
+    
+    def _board_reply(self, status: str) -> str:
+        """Сформировать ответ со счётом и доской.
+        
+        Args:
+            status: Статус ответа
+        
+        Returns:
+            str: "status score board"
+        """
+        return f'{status} {self._state.get_score()} {format_board(self._state.board)}'
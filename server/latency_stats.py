@@ -0,0 +1,28 @@
+"""Гистограмма задержек запросов сервера."""
+
+from typing import Dict
+
+from metrics.histogram import Histogram
+
+
+class LatencyStats(Histogram):
+    """Статистика задержек запросов в микросекундах.
+    
+    Корзины как у Histogram: до 32 мкс точно, дальше по 16 корзин на
+    октаву. Сводка подписывает значения единицами.
+    """
+    
+    def summary(self) -> Dict[str, float]:
+        """Получить сводку для вывода.
+        
+        Returns:
+            Dict[str, float]: Количество, среднее, p50, p90, p99 и максимум в микросекундах
+        """
+        return {
+            'count': self._count,
+            'mean_us': round(self.mean(), 1),
+            'p50_us': self.percentile(50),
+            'p90_us': self.percentile(90),
+            'p99_us': self.percentile(99),
+            'max_us': self._max,
+        }
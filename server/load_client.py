@@ -0,0 +1,141 @@
+"""Генератор нагрузки для локальной проверки игрового сервера."""
+
+import argparse
+import asyncio
+import time
+from typing import Optional
+
+from .latency_stats import LatencyStats
+
+
+class LoadClient:
+    """Множество одновременных игроков, делающих ходы по подсказкам сервера.
+    
+    Каждый игрок открывает своё соединение, начинает партию с seed
+    seed + номер игрока и до moves раз запрашивает HINT и отправляет MOVE.
+    Задержка каждого запроса измеряется на стороне клиента.
+    """
+    
+    def __init__(self, host: str = '127.0.0.1', port: int = 7878, unix_path: Optional[str] = None):
+        """Создать клиент.
+        
+        Args:
+            host: Адрес сервера
+            port: Порт сервера
+            unix_path: Путь Unix-сокета вместо TCP
+        """
+        self._host = host
+        self._port = port
+        self._unix_path = unix_path
+        self._stats = LatencyStats()
+        self._errors = 0
+    
+    def stats(self) -> LatencyStats:
+        """Получить задержки запросов.
+        
+        Returns:
+            LatencyStats: Статистика по всем запросам
+        """
+        return self._stats
+    
+    def errors(self) -> int:
+        """Получить количество игроков, завершившихся ошибкой соединения.
+        
+        Returns:
+            int: Число неудачных игроков
+        """
+        return self._errors
+    
+    async def run(self, players: int = 100, moves: int = 20, seed: int = 0) -> LatencyStats:
+        """Запустить игроков и дождаться их завершения.
+        
+        Args:
+            players: Количество одновременных игроков
+            moves: Максимум ходов каждого игрока
+            seed: Seed партии первого игрока
+        
+        Returns:
+            LatencyStats: Статистика по всем запросам
+        """
+        await asyncio.gather(*(self._play(seed + number, moves) for number in range(players)))
+        return self._stats
+    
+    async def _play(self, seed: int, moves: int) -> None:
+        """Сыграть одну партию.
+        
+        Args:
+            seed: Seed партии
+            moves: Максимум ходов
+        """
+        try:
+            if self._unix_path is not None:
+                reader, writer = await asyncio.open_unix_connection(self._unix_path)
+            else:
+                reader, writer = await asyncio.open_connection(self._host, self._port)
+        except OSError:
+            self._errors += 1
+            return
+        
+        try:
+            await self._request(reader, writer, f'NEW {seed}')
+            for _ in range(moves):
+                hint = await self._request(reader, writer, 'HINT')
+                if not hint.startswith('OK'):
+                    break
+                reply = await self._request(reader, writer, 'MOVE' + hint[2:])
+                if not reply.startswith('OK'):
+                    break
+            await self._request(reader, writer, 'QUIT')
+        except ConnectionError:
+            self._errors += 1
+        finally:
+            writer.close()
+    
+    async def _request(self, reader: asyncio.StreamReader, writer: asyncio.StreamWriter, line: str) -> str:
+        """Отправить команду и дождаться ответа.
+        
+        Args:
+            reader: Поток ответов
+            writer: Поток запросов
+            line: Команда
+        
+        Returns:
+            str: Строка ответа
+        
+        Raises:
+            ConnectionError: Если сервер закрыл соединение
+        """
+        started = time.perf_counter_ns()
+        writer.write(line.encode('utf-8') + b'\n')
+        await writer.drain()
+        reply = await reader.readline()
+        if not reply:
+            raise ConnectionError("Сервер закрыл соединение")
+        self._stats.record((time.perf_counter_ns() - started) // 1000)
+        return reply.decode('utf-8').strip()
+
+
+def main() -> None:
+    """Точка входа генератора нагрузки."""
+    parser = argparse.ArgumentParser(description="Нагрузка на сервер игры 'Три-в-ряд'")
+    parser.add_argument('--host', default='127.0.0.1', help="Адрес сервера")
+    parser.add_argument('--port', type=int, default=7878, help="Порт сервера")
+    parser.add_argument('--unix', default=None, help="Путь Unix-сокета вместо TCP")
+    parser.add_argument('--players', type=int, default=100, help="Количество одновременных игроков")
+    parser.add_argument('--moves', type=int, default=20, help="Максимум ходов каждого игрока")
+    parser.add_argument('--seed', type=int, default=0, help="Seed партии первого игрока")
+    args = parser.parse_args()
+    
+    client = LoadClient(args.host, args.port, args.unix)
+    started = time.perf_counter()
+    stats = asyncio.run(client.run(args.players, args.moves, args.seed))
+    elapsed = time.perf_counter() - started
+    
+    for name, value in stats.summary().items():
+        print(f"{name:>16}: {value}")
+    print(f"{'errors':>16}: {client.errors()}")
+    print(f"{'requests_per_sec':>16}: {stats.count() / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
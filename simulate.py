@@ -0,0 +1,33 @@
+"""Автоматическая игра множества партий для балансировки и нагрузки."""
+
+import argparse
+import time
+
+from simulation.policies import POLICIES
+from simulation.self_play import SelfPlayRunner, SimulationStats
+
+
+def main() -> None:
+    """Точка входа моделирования."""
+    parser = argparse.ArgumentParser(description="Автоматическая игра в 'Три-в-ряд'")
+    parser.add_argument('--games', type=int, default=100, help="Количество партий")
+    parser.add_argument('--workers', type=int, default=None, help="Число процессов (по умолчанию по числу ядер)")
+    parser.add_argument('--policy', choices=sorted(POLICIES), default='greedy', help="Политика выбора хода")
+    parser.add_argument('--seed', type=int, default=0, help="Seed первой партии")
+    parser.add_argument('--max-moves', type=int, default=200, help="Максимум ходов в партии")
+    args = parser.parse_args()
+    
+    runner = SelfPlayRunner(args.policy, args.workers, args.max_moves)
+    stats = SimulationStats()
+    started = time.perf_counter()
+    for result in runner.run(args.games, args.seed):
+        stats.add(result)
+    elapsed = time.perf_counter() - started
+    
+    for name, value in stats.summary().items():
+        print(f"{name:>16}: {value:.2f}" if isinstance(value, float) else f"{name:>16}: {value}")
+    print(f"{'games_per_sec':>16}: {stats.games() / elapsed:.2f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,8 @@
+"""Пакет для массового моделирования игр."""
+
+from .batch_engine import BatchEngine, BatchMoveResult
+
+__all__ = [
+    'BatchEngine',
+    'BatchMoveResult'
+]
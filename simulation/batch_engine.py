@@ -0,0 +1,276 @@
+"""Пакетный движок, обрабатывающий много досок одновременно средствами NumPy."""
+
+from dataclasses import dataclass
+from typing import Optional, Sequence
+
+from board.board import Board
+from board.compact_board import CompactBoard
+from board.tile_kind import EMPTY_CODE
+from rules.run_length_match_finder import RunLengthMatchFinder
+from scoring.score_manager import ScoreManager
+
+try:
+    import numpy as np
+except ImportError:  # Пакетный движок недоступен без NumPy
+    np = None
+
+
+@dataclass
+class BatchMoveResult:
+    """Результат пакетного хода по всем доскам."""
+    
+    valid: 'np.ndarray'
+    points: 'np.ndarray'
+    cascades: 'np.ndarray'
+
+
+class BatchEngine:
+    """Пакетный движок для N досок в массиве (N, height, width) типа int8.
+    
+    Поиск совпадений, удаление, гравитация, заполнение и подсчёт очков
+    выполняются для всех досок сразу. Коды фишек совпадают с CompactBoard,
+    очки считает ScoreManager, а каждая доска берёт фишки у своего
+    RandomProvider в том же порядке, что и GameController, поэтому
+    результаты совпадают с ним для одних и тех же seed.
+    """
+    
+    def __init__(self, boards: Sequence[Board], random_providers: Sequence,
+                 score_manager: Optional[ScoreManager] = None):
+        """Инициализировать движок.
+        
+        Args:
+            boards: Начальные доски одного размера
+            random_providers: Поставщик случайных фишек для каждой доски
+            score_manager: Менеджер счёта (по умолчанию с параметрами по умолчанию)
+            
+        Raises:
+            ImportError: Если не установлен NumPy
+            ValueError: Если число досок и поставщиков не совпадает
+        """
+        if np is None:
+            raise ImportError("Для BatchEngine требуется пакет numpy")
+        
+        if len(boards) != len(random_providers):
+            raise ValueError("Для каждой доски нужен свой поставщик случайностей")
+        
+        self._height = boards[0].height()
+        self._width = boards[0].width()
+        self._codes = np.stack([
+            np.frombuffer(bytes(CompactBoard.codes_of(board)), dtype=np.int8)
+            .reshape(self._height, self._width)
+            for board in boards
+        ])
+        self._random_providers = list(random_providers)
+        self._score_manager = score_manager if score_manager is not None else ScoreManager()
+        self._match_finder = RunLengthMatchFinder()
+        self._scores = np.zeros(len(boards), dtype=np.int64)
+    
+    def size(self) -> int:
+        """Получить количество досок.
+        
+        Returns:
+            int: Количество досок в пакете
+        """
+        return self._codes.shape[0]
+    
+    def codes(self) -> 'np.ndarray':
+        """Получить коды фишек всех досок.
+        
+        Returns:
+            np.ndarray: Массив (N, height, width) типа int8
+        """
+        return self._codes
+    
+    def scores(self) -> 'np.ndarray':
+        """Получить накопленный счёт каждой доски.
+        
+        Returns:
+            np.ndarray: Массив N счетов
+        """
+        return self._scores
+    
+    def board_at(self, index: int) -> CompactBoard:
+        """Получить копию доски из пакета.
+        
+        Args:
+            index: Номер доски
+            
+        Returns:
+            CompactBoard: Независимая копия доски
+        """
+        board = CompactBoard(self._width, self._height)
+        board.codes()[:] = self._codes[index].astype(np.uint8).tobytes()
+        return board
+    
+    def perform_moves(self, moves) -> BatchMoveResult:
+        """Выполнить по одному ходу на каждой доске.
+        
+        Args:
+            moves: Массив (N, 4) строк (row1, col1, row2, col2)
+            
+        Returns:
+            BatchMoveResult: Валидность хода, очки и число каскадов для каждой доски
+            
+        Note:
+            Невалидный ход, как и в GameController, не меняет доску
+        """
+        moves = np.asarray(moves, dtype=np.int64).reshape(self.size(), 4)
+        valid = self._swap_valid_moves(moves)
+        points = np.zeros(self.size(), dtype=np.int64)
+        cascades = np.zeros(self.size(), dtype=np.int64)
+        
+        active = valid.copy()
+        cascade_index = 0
+        while active.any():
+            removal = self._removal_mask(active)
+            removed = removal.sum(axis=(1, 2))
+            active &= removed > 0
+            if not active.any():
+                break
+            
+            points[active] += self._points_for(removed[active], cascade_index)
+            self._codes[removal] = EMPTY_CODE
+            self._apply_gravity(active)
+            self._refill(active)
+            
+            cascades[active] += 1
+            cascade_index += 1
+        
+        self._scores += points
+        return BatchMoveResult(valid=valid, points=points, cascades=cascades)
+    
+    def _swap_valid_moves(self, moves: 'np.ndarray') -> 'np.ndarray':
+        """Выполнить свопы и откатить те, что не создают совпадений.
+        
+        Args:
+            moves: Массив (N, 4) координат свопов
+            
+        Returns:
+            np.ndarray: Маска досок с валидным ходом
+        """
+        row_a, col_a, row_b, col_b = moves.T
+        inside = ((row_a >= 0) & (row_a < self._height) & (col_a >= 0) & (col_a < self._width) &
+                  (row_b >= 0) & (row_b < self._height) & (col_b >= 0) & (col_b < self._width))
+        adjacent = np.abs(row_a - row_b) + np.abs(col_a - col_b) == 1
+        valid = inside & adjacent
+        
+        indices = np.flatnonzero(valid)
+        self._swap(indices, row_a[indices], col_a[indices], row_b[indices], col_b[indices])
+        
+        horizontal, vertical = self._run_masks()
+        valid &= (horizontal | vertical).any(axis=(1, 2))
+        
+        rejected = indices[~valid[indices]]
+        self._swap(rejected, row_a[rejected], col_a[rejected], row_b[rejected], col_b[rejected])
+        return valid
+    
+    def _swap(self, indices, row_a, col_a, row_b, col_b) -> None:
+        """Обменять фишки на выбранных досках.
+        
+        Args:
+            indices: Номера досок
+            row_a: Строки первых ячеек
+            col_a: Столбцы первых ячеек
+            row_b: Строки вторых ячеек
+            col_b: Столбцы вторых ячеек
+        """
+        first = self._codes[indices, row_a, col_a].copy()
+        self._codes[indices, row_a, col_a] = self._codes[indices, row_b, col_b]
+        self._codes[indices, row_b, col_b] = first
+    
+    def _run_masks(self):
+        """Найти ячейки в горизонтальных и вертикальных сериях ≥3.
+        
+        Returns:
+            tuple: Маски (N, height, width) горизонтальных и вертикальных серий
+        """
+        codes = self._codes
+        horizontal = np.zeros(codes.shape, dtype=bool)
+        vertical = np.zeros(codes.shape, dtype=bool)
+        
+        starts = ((codes[:, :, :-2] != EMPTY_CODE) &
+                  (codes[:, :, :-2] == codes[:, :, 1:-1]) &
+                  (codes[:, :, 1:-1] == codes[:, :, 2:]))
+        for shift in range(3):
+            horizontal[:, :, shift:self._width - 2 + shift] |= starts
+        
+        starts = ((codes[:, :-2, :] != EMPTY_CODE) &
+                  (codes[:, :-2, :] == codes[:, 1:-1, :]) &
+                  (codes[:, 1:-1, :] == codes[:, 2:, :]))
+        for shift in range(3):
+            vertical[:, shift:self._height - 2 + shift, :] |= starts
+        
+        return horizontal, vertical
+    
+    def _removal_mask(self, active: 'np.ndarray') -> 'np.ndarray':
+        """Построить маску удаляемых ячеек для активных досок.
+        
+        Args:
+            active: Маска досок, для которых продолжается каскад
+            
+        Returns:
+            np.ndarray: Маска (N, height, width) ячеек для удаления
+            
+        Note:
+            Если горизонтальная и вертикальная серии пересекаются, доска
+            разрешается поисковиком совпадений, чтобы выбрать те же группы
+        """
+        horizontal, vertical = self._run_masks()
+        removal = (horizontal | vertical) & active[:, None, None]
+        
+        crossing = np.flatnonzero((horizontal & vertical).any(axis=(1, 2)) & active)
+        for index in crossing:
+            removal[index] = False
+            for group in self._match_finder.find_matches(self.board_at(index)):
+                for cell in group:
+                    removal[index, cell.row(), cell.col()] = True
+        return removal
+    
+    def _points_for(self, removed: 'np.ndarray', cascade_index: int) -> 'np.ndarray':
+        """Рассчитать очки по правилам ScoreManager.
+        
+        Args:
+            removed: Количество удалённых фишек для активных досок
+            cascade_index: Индекс каскада
+            
+        Returns:
+            np.ndarray: Очки для активных досок
+        """
+        counts, inverse = np.unique(removed, return_inverse=True)
+        points = np.array([self._score_manager.score_for_removed(int(count), cascade_index)
+                           for count in counts], dtype=np.int64)
+        return points[inverse]
+    
+    def _apply_gravity(self, active: 'np.ndarray') -> None:
+        """Применить гравитацию ко всем столбцам активных досок.
+        
+        Args:
+            active: Маска досок для обработки
+        """
+        indices = np.flatnonzero(active)
+        boards = self._codes[indices]
+        order = np.argsort(boards != EMPTY_CODE, axis=1, kind='stable')
+        self._codes[indices] = np.take_along_axis(boards, order, axis=1)
+    
+    def _refill(self, active: 'np.ndarray') -> None:
+        """Заполнить пустые ячейки фишками от поставщика каждой доски.
+        
+        Args:
+            active: Маска досок для обработки
+            
+        Note:
+            Пустые ячейки заполняются по столбцам сверху вниз, как в GravityEngine
+        """
+        by_columns = self._codes.transpose(0, 2, 1)
+        empty = (by_columns == EMPTY_CODE) & active[:, None, None]
+        counts = empty.sum(axis=(1, 2))
+        
+        drawn = bytearray(int(counts.sum()))
+        view = memoryview(drawn)
+        start = 0
+        for index in np.flatnonzero(active):
+            count = int(counts[index])
+            self._random_providers[index].fill_codes(view[start:start + count])
+            start += count
+        
+        by_columns[empty] = np.frombuffer(drawn, dtype=np.int8)
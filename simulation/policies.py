@@ -0,0 +1,175 @@
+"""Политики выбора хода для автоматической игры."""
+
+import random as random_module
+from abc import ABC, abstractmethod
+from typing import Optional, Tuple
+
+from board.cell import Cell
+from control.game_state import GameState
+from control.service_container import ServiceContainer
+from search.transposition_table import TranspositionTable, LruTranspositionTable
+from search.move_search import MoveSearch
+
+
+# Размер таблицы лучших ходов жадной политики по умолчанию
+_GREEDY_TABLE_CAPACITY = 4096
+
+
+class MovePolicy(ABC):
+    """Абстрактная политика выбора хода."""
+    
+    @abstractmethod
+    def choose_move(self, state: GameState, services: ServiceContainer) -> Optional[Tuple[Cell, Cell]]:
+        """Выбрать ход для текущего состояния.
+        
+        Args:
+            state: Текущее состояние игры
+            services: Контейнер с игровыми сервисами
+            
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Ход или None, если ходов нет
+        """
+        pass
+
+
+class FirstLegalPolicy(MovePolicy):
+    """Политика, выбирающая первый найденный ход."""
+    
+    def __init__(self, seed: Optional[int] = None):
+        """Инициализировать политику.
+        
+        Args:
+            seed: Не используется, принимается для единообразия политик
+        """
+    
+    def choose_move(self, state: GameState, services: ServiceContainer) -> Optional[Tuple[Cell, Cell]]:
+        """Выбрать первый ход в порядке обхода доски.
+        
+        Args:
+            state: Текущее состояние игры
+            services: Контейнер с игровыми сервисами
+            
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Ход или None, если ходов нет
+        """
+        return services.get_move_generator().find_first_move(state.board)
+
+
+class RandomPolicy(MovePolicy):
+    """Политика, выбирающая случайный ход."""
+    
+    def __init__(self, seed: Optional[int] = None):
+        """Инициализировать политику.
+        
+        Args:
+            seed: Начальное значение генератора (None для системного)
+        """
+        self._random = random_module.Random(seed)
+    
+    def choose_move(self, state: GameState, services: ServiceContainer) -> Optional[Tuple[Cell, Cell]]:
+        """Выбрать случайный ход из всех доступных.
+        
+        Args:
+            state: Текущее состояние игры
+            services: Контейнер с игровыми сервисами
+            
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Ход или None, если ходов нет
+        """
+        moves = services.get_move_generator().generate_all_moves(state.board)
+        if not moves:
+            return None
+        return self._random.choice(moves)
+
+
+class GreedyPolicy(MovePolicy):
+    """Политика, выбирающая ход с наибольшими очками за первое удаление."""
+    
+    def __init__(self, seed: Optional[int] = None, table: Optional[TranspositionTable] = None):
+        """Инициализировать политику.
+        
+        Args:
+            seed: Не используется, принимается для единообразия политик
+            table: Таблица лучших ходов по хешу доски (по умолчанию LRU)
+        """
+        self._table = table if table is not None else LruTranspositionTable(_GREEDY_TABLE_CAPACITY)
+    
+    def choose_move(self, state: GameState, services: ServiceContainer) -> Optional[Tuple[Cell, Cell]]:
+        """Выбрать ход с наибольшими немедленными очками.
+        
+        Args:
+            state: Текущее состояние игры
+            services: Контейнер с игровыми сервисами
+            
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Ход или None, если ходов нет
+            
+        Note:
+            Каскады после заполнения не учитываются; при равенстве
+            очков выбирается первый ход. Лучший ход запоминается
+            по хешу доски и не пересчитывается для той же позиции
+        """
+        key = state.board.zobrist_hash()
+        cached = self._table.get(key)
+        if cached is not None:
+            return cached[0]
+        
+        match_finder = services.get_match_finder()
+        score_manager = services.get_score_manager()
+        
+        best_move = None
+        best_points = -1
+        for move in services.get_move_generator().generate_all_moves(state.board):
+            board = state.board.clone()
+            board.swap(*move)
+            removed = sum(len(group) for group in match_finder.find_matches(board))
+            points = score_manager.score_for_removed(removed, 0)
+            if points > best_points:
+                best_move, best_points = move, points
+        
+        self._table.put(key, (best_move,))
+        return best_move
+
+
+class SearchPolicy(MovePolicy):
+    """Политика, выбирающая ход поиском expectimax с бюджетом времени."""
+    
+    def __init__(self, seed: Optional[int] = None, time_budget: float = 0.05):
+        """Инициализировать политику.
+        
+        Args:
+            seed: Начальное значение выборок заполнения (None для 0)
+            time_budget: Бюджет времени на выбор хода в секундах
+            
+        Note:
+            Достигнутая глубина зависит от скорости машины, поэтому
+            партии с этой политикой воспроизводимы только при
+            одинаковой нагрузке
+        """
+        self._seed = 0 if seed is None else seed
+        self._time_budget = time_budget
+        self._services: Optional[ServiceContainer] = None
+        self._search: Optional[MoveSearch] = None
+    
+    def choose_move(self, state: GameState, services: ServiceContainer) -> Optional[Tuple[Cell, Cell]]:
+        """Выбрать ход с наибольшим ожидаемым счётом.
+        
+        Args:
+            state: Текущее состояние игры
+            services: Контейнер с игровыми сервисами
+            
+        Returns:
+            Optional[Tuple[Cell, Cell]]: Ход или None, если ходов нет
+        """
+        if self._services is not services:
+            self._services = services
+            self._search = MoveSearch(services, seed=self._seed)
+        return self._search.best_move(state.board, self._time_budget)
+
+
+POLICIES = {
+    'first': FirstLegalPolicy,
+    'random': RandomPolicy,
+    'greedy': GreedyPolicy,
+    'search': SearchPolicy,
+}
@@ -0,0 +1,184 @@
+"""Параллельная автоматическая игра для балансировки и нагрузочных прогонов."""
+
+import os
+import time
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass
+from typing import Callable, Dict, Iterable, Iterator, Optional, Union
+
+from control.game_controller import GameController
+from rules.run_length_match_finder import RunLengthMatchFinder
+from rules.pattern_move_generator import PatternMoveGenerator
+from .policies import MovePolicy, POLICIES
+
+
+PolicyFactory = Callable[[Optional[int]], MovePolicy]
+
+
+@dataclass
+class GameResult:
+    """Итог одной сыгранной партии."""
+    
+    seed: int
+    score: int
+    moves: int
+    cascades: int
+    wall_time: float
+
+
+class SimulationStats:
+    """Накопитель сводной статистики по партиям."""
+    
+    def __init__(self):
+        """Инициализировать пустую статистику."""
+        self._games = 0
+        self._total_score = 0
+        self._min_score: Optional[int] = None
+        self._max_score: Optional[int] = None
+        self._total_moves = 0
+        self._total_cascades = 0
+        self._total_wall_time = 0.0
+    
+    def add(self, result: GameResult) -> None:
+        """Учесть результат партии.
+        
+        Args:
+            result: Результат партии
+        """
+        self._games += 1
+        self._total_score += result.score
+        self._min_score = result.score if self._min_score is None else min(self._min_score, result.score)
+        self._max_score = result.score if self._max_score is None else max(self._max_score, result.score)
+        self._total_moves += result.moves
+        self._total_cascades += result.cascades
+        self._total_wall_time += result.wall_time
+    
+    def games(self) -> int:
+        """Получить количество учтённых партий.
+        
+        Returns:
+            int: Количество партий
+        """
+        return self._games
+    
+    def summary(self) -> Dict[str, float]:
+        """Получить сводку по всем партиям.
+        
+        Returns:
+            Dict[str, float]: Средние, минимальные и максимальные значения
+        """
+        games = max(self._games, 1)
+        return {
+            'games': self._games,
+            'mean_score': self._total_score / games,
+            'min_score': self._min_score or 0,
+            'max_score': self._max_score or 0,
+            'mean_moves': self._total_moves / games,
+            'mean_cascades': self._total_cascades / games,
+            'mean_game_time': self._total_wall_time / games,
+        }
+
+
+def play_single_game(seed: int, policy: Union[str, PolicyFactory], max_moves: int) -> GameResult:
+    """Сыграть одну партию без консольного ввода.
+    
+    Args:
+        seed: Начальное значение для доски, заполнения и политики
+        policy: Имя политики из POLICIES или фабрика политики
+        max_moves: Максимальное число ходов в партии
+        
+    Returns:
+        GameResult: Итог партии
+    """
+    # Импорт здесь, чтобы рабочие процессы не зависели от порядка загрузки main
+    from main import create_game_services, initialize_game
+    
+    started = time.perf_counter()
+    services = create_game_services(seed)
+    services.register_match_finder(RunLengthMatchFinder())
+    services.register_move_generator(PatternMoveGenerator())
+    
+    state = initialize_game(services)
+    controller = GameController(services)
+    combo_tracker = services.get_combo_tracker()
+    move_policy = (POLICIES[policy] if isinstance(policy, str) else policy)(seed)
+    
+    moves = 0
+    cascades = 0
+    controller.update_moves_available(state)
+    while not controller.is_game_over(state) and moves < max_moves:
+        move = move_policy.choose_move(state, services)
+        if move is None:
+            break
+        if controller.perform_move(state, *move):
+            moves += 1
+            cascades += combo_tracker.current_index()
+        controller.update_moves_available(state)
+    
+    return GameResult(seed=seed, score=state.get_score(), moves=moves,
+                      cascades=cascades, wall_time=time.perf_counter() - started)
+
+
+class SelfPlayRunner:
+    """Запуск множества партий в пуле процессов."""
+    
+    def __init__(self, policy: Union[str, PolicyFactory] = 'greedy',
+                 workers: Optional[int] = None, max_moves: int = 200):
+        """Инициализировать запуск.
+        
+        Args:
+            policy: Имя политики из POLICIES или фабрика политики уровня модуля
+            workers: Число процессов (None - по числу ядер, 1 - без пула)
+            max_moves: Максимальное число ходов в партии
+            
+        Raises:
+            ValueError: Если политика неизвестна
+        """
+        if isinstance(policy, str) and policy not in POLICIES:
+            raise ValueError(f"Неизвестная политика: {policy}")
+        
+        self._policy = policy
+        self._workers = workers if workers is not None else os.cpu_count() or 1
+        self._max_moves = max_moves
+    
+    def run(self, games: int, base_seed: int = 0) -> Iterator[GameResult]:
+        """Сыграть партии, выдавая результаты по мере готовности.
+        
+        Args:
+            games: Количество партий
+            base_seed: Seed первой партии; партия i использует base_seed + i
+            
+        Returns:
+            Iterator[GameResult]: Результаты в порядке номеров партий
+        """
+        seeds = range(base_seed, base_seed + games)
+        if self._workers == 1:
+            for seed in seeds:
+                yield play_single_game(seed, self._policy, self._max_moves)
+            return
+        
+        chunksize = max(1, games // (self._workers * 8))
+        with ProcessPoolExecutor(max_workers=self._workers) as executor:
+            yield from executor.map(play_single_game, seeds,
+                                    _repeat(self._policy, games), _repeat(self._max_moves, games),
+                                    chunksize=chunksize)
+    
+    def run_with_stats(self, games: int, base_seed: int = 0) -> SimulationStats:
+        """Сыграть партии и собрать сводную статистику.
+        
+        Args:
+            games: Количество партий
+            base_seed: Seed первой партии
+            
+        Returns:
+            SimulationStats: Сводная статистика
+        """
+        stats = SimulationStats()
+        for result in self.run(games, base_seed):
+            stats.add(result)
+        return stats
+
+
+def _repeat(value, times: int) -> Iterable:
+    """Повторить значение для аргументов executor.map."""
+    return (value for _ in range(times))
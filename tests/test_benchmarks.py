@@ -0,0 +1,65 @@
+"""Тесты для сравнения замеров с базой."""
+
+import json
+import os
+import tempfile
+import unittest
+from unittest import mock
+
+from benchmarks import run_benchmarks
+from benchmarks.run_benchmarks import compare
+
+
+def result(median_us: float) -> dict:
+    """Создать результат замера с заданной медианой.
+    
+    Args:
+        median_us: Медиана времени вызова в микросекундах
+    
+    Returns:
+        dict: Результат в формате run_cases
+    """
+    return {'median_us': median_us, 'min_us': median_us, 'iterations': 100}
+
+
+class TestCompare(unittest.TestCase):
+    """Тесты для поиска регрессий относительно базы."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.baseline = {'clone': result(10.0), 'find': result(100.0), 'removed': result(5.0)}
+    
+    def test_regression_above_threshold(self):
+        """Тест: замедление сверх порога считается регрессией."""
+        regressions = compare({'clone': result(13.0), 'find': result(100.0)}, self.baseline, 0.2)
+        
+        self.assertEqual(regressions, ["clone: 10.0 мкс -> 13.0 мкс (+30%)"])
+    
+    def test_within_threshold_and_speedup(self):
+        """Тест: замедление в пределах порога и ускорение не считаются регрессией."""
+        results = {'clone': result(12.0), 'find': result(50.0)}
+        
+        self.assertEqual(compare(results, self.baseline, 0.2), [])
+        self.assertEqual(len(compare(results, self.baseline, 0.1)), 1)
+    
+    def test_cases_missing_from_baseline_are_skipped(self):
+        """Тест: новые замеры без базы и удалённые из прогона не сравниваются."""
+        self.assertEqual(compare({'new_case': result(1000.0)}, self.baseline, 0.2), [])
+    
+    def test_main_fails_on_regression(self):
+        """Тест кода выхода запуска с базой из файла."""
+        with tempfile.TemporaryDirectory() as directory:
+            path = os.path.join(directory, 'baseline.json')
+            with open(path, 'w', encoding='utf-8') as file:
+                json.dump({'results': self.baseline}, file)
+            
+            with mock.patch.object(run_benchmarks, 'run_cases', return_value={'find': result(200.0)}), \
+                    mock.patch('builtins.print'):
+                self.assertEqual(run_benchmarks.main(['--baseline', path]), 1)
+            with mock.patch.object(run_benchmarks, 'run_cases', return_value={'find': result(110.0)}), \
+                    mock.patch('builtins.print'):
+                self.assertEqual(run_benchmarks.main(['--baseline', path]), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,12 +1,18 @@
 """Тесты для игровой доски."""
 
+import pickle
 import unittest
 from board.tile_kind import TileKind
 from board.tile import Tile
 from board.cell import Cell
 from board.mutable_board import MutableBoard
+from board.compact_board import CompactBoard
+from board.bit_board import BitBoard
 from board.board_factory import BoardFactory
+from random_generator.random_provider import RandomProvider
 from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
 
 
 class TestTileKind(unittest.TestCase):
@@ -40,6 +46,15 @@ class TestTile(unittest.TestCase):
         self.assertEqual(tile1, tile2)
         self.assertNotEqual(tile1, tile3)
     
+    def test_shared_tile(self):
+        """Тест общих экземпляров фишек."""
+        self.assertIs(Tile.of(TileKind.A), Tile.of(TileKind.A))
+        self.assertEqual(Tile.of(TileKind.A), Tile(TileKind.A))
+        self.assertEqual(hash(Tile.of(TileKind.A)), hash(Tile(TileKind.A)))
+        
+        with self.assertRaises(AttributeError):
+            Tile.of(TileKind.A)._kind = TileKind.B
+    
     def test_tile_string_representation(self):
         """Тест строкового представления фишки."""
         tile = Tile(TileKind.A)
@@ -64,6 +79,8 @@ class TestCell(unittest.TestCase):
         self.assertTrue(valid_cell.is_valid())
         self.assertFalse(invalid_cell1.is_valid())
         self.assertFalse(invalid_cell2.is_valid())
+        self.assertTrue(invalid_cell2.is_valid(width=16, height=4))
+        self.assertFalse(Cell(4, 0).is_valid(width=16, height=4))
     
     def test_cell_adjacency(self):
         """Тест соседства ячеек."""
@@ -85,6 +102,17 @@ class TestCell(unittest.TestCase):
         
         for non_adj_cell in non_adjacent_cells:
             self.assertFalse(cell.is_adjacent(non_adj_cell))
+    
+    def test_interned_cell(self):
+        """Тест разделяемых ячеек."""
+        self.assertIs(Cell.of(3, 4), Cell.of(3, 4))
+        self.assertEqual(Cell.of(3, 4), Cell(3, 4))
+        self.assertEqual(hash(Cell.of(3, 4)), hash(Cell(3, 4)))
+        self.assertEqual(Cell.of(20, 4), Cell(20, 4))
+        self.assertIs(pickle.loads(pickle.dumps(Cell(3, 4))), Cell.of(3, 4))
+        
+        with self.assertRaises(AttributeError):
+            Cell.of(3, 4)._row = 5
 
 
 class TestMutableBoard(unittest.TestCase):
@@ -137,6 +165,247 @@ class TestMutableBoard(unittest.TestCase):
             tile = self.board.tile_at(cell)
             self.assertIsNotNone(tile)
             self.assertIn(tile.kind(), TileKind.all())
+    
+    def test_zobrist_hash_is_incremental(self):
+        """Тест инкрементального хеша Zobrist."""
+        self.assertEqual(self.board.zobrist_hash(), 0)
+        
+        self.board.fill_empty(RandomProviderDefault(3))
+        initial = self.board.zobrist_hash()
+        self.assertEqual(initial, CompactBoard.from_board(self.board).zobrist_hash())
+        
+        self.board.swap(Cell(0, 0), Cell(0, 1))
+        self.assertEqual(self.board.zobrist_hash(), BitBoard.from_board(self.board).zobrist_hash())
+        
+        self.board.swap(Cell(0, 0), Cell(0, 1))
+        self.assertEqual(self.board.zobrist_hash(), initial)
+        self.assertEqual(self.board.clone().zobrist_hash(), initial)
+    
+    def test_clone_copies_rows_on_write(self):
+        """Тест копирования строк при записи после клонирования."""
+        self.board.fill_empty(RandomProviderDefault(3))
+        clone = self.board.clone()
+        
+        self.assertEqual(clone.shared_rows(self.board), 8)
+        
+        clone.swap(Cell(2, 0), Cell(2, 1))
+        self.assertEqual(clone.shared_rows(self.board), 7)
+        self.assertEqual(clone.tile_at(Cell(2, 0)), self.board.tile_at(Cell(2, 1)))
+        
+        self.board.set_tile(Cell(5, 5), None)
+        self.assertEqual(clone.shared_rows(self.board), 6)
+        self.assertIsNotNone(clone.tile_at(Cell(5, 5)))
+    
+    def test_custom_dimensions(self):
+        """Тест доски произвольного размера."""
+        board = MutableBoard(width=12, height=3)
+        self.assertEqual((board.width(), board.height()), (12, 3))
+        self.assertEqual(len(list(board.enumerate_cells())), 36)
+        self.assertIsNone(board.tile_at(Cell(3, 0)))
+        with self.assertRaises(ValueError):
+            board.set_tile(Cell(0, 12), Tile(TileKind.A))
+        with self.assertRaises(ValueError):
+            MutableBoard(width=0, height=8)
+        
+        board.set_tile(Cell(2, 11), Tile(TileKind.E))
+        clone = board.clone()
+        self.assertEqual((clone.width(), clone.height()), (12, 3))
+        self.assertEqual(clone.tile_at(Cell(2, 11)), Tile(TileKind.E))
+    
+    def test_zobrist_hash_on_large_board(self):
+        """Тест хеша доски, ключи которой не хранятся таблицей."""
+        board = BoardFactory.create_initial_board(RandomProviderDefault(3), 80, 80)
+        self.assertEqual(board.zobrist_hash(), CompactBoard.from_board(board).zobrist_hash())
+        
+        initial = board.zobrist_hash()
+        board.swap(Cell(79, 78), Cell(79, 79))
+        board.swap(Cell(79, 78), Cell(79, 79))
+        self.assertEqual(board.zobrist_hash(), initial)
+
+
+class TestCompactBoard(unittest.TestCase):
+    """Тесты для CompactBoard."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.board = CompactBoard()
+    
+    def test_tile_kind_codes(self):
+        """Тест кодирования типов фишек."""
+        for kind in TileKind.all():
+            self.assertEqual(TileKind.from_code(kind.code()), kind)
+        
+        with self.assertRaises(ValueError):
+            TileKind.from_code(0)
+    
+    def test_set_tile_and_codes(self):
+        """Тест установки фишки и чтения сырых кодов."""
+        self.board.set_tile(Cell(3, 4), Tile(TileKind.C))
+        
+        index = self.board.index_of(3, 4)
+        self.assertEqual(self.board.tile_at(Cell(3, 4)), Tile(TileKind.C))
+        self.assertEqual(self.board.code_at(index), TileKind.C.code())
+        
+        self.board.set_code(index, 0)
+        self.assertIsNone(self.board.tile_at(Cell(3, 4)))
+    
+    def test_swap_tiles(self):
+        """Тест обмена фишек."""
+        self.board.set_tile(Cell(3, 4), Tile(TileKind.A))
+        self.board.set_tile(Cell(3, 5), Tile(TileKind.B))
+        
+        self.board.swap(Cell(3, 4), Cell(3, 5))
+        
+        self.assertEqual(self.board.tile_at(Cell(3, 4)), Tile(TileKind.B))
+        self.assertEqual(self.board.tile_at(Cell(3, 5)), Tile(TileKind.A))
+        
+        with self.assertRaises(ValueError):
+            self.board.swap(Cell(3, 4), Cell(5, 5))
+    
+    def test_clone_is_independent(self):
+        """Тест независимости копии доски."""
+        self.board.fill_empty(RandomProviderDefault(42))
+        clone = self.board.clone()
+        
+        self.assertEqual(clone.codes(), self.board.codes())
+        
+        clone.set_tile(Cell(0, 0), None)
+        self.assertIsNotNone(self.board.tile_at(Cell(0, 0)))
+    
+    def test_matches_mutable_board(self):
+        """Тест совпадения содержимого с MutableBoard при том же seed."""
+        mutable = MutableBoard()
+        mutable.fill_empty(RandomProviderDefault(7))
+        self.board.fill_empty(RandomProviderDefault(7))
+        
+        for cell in mutable.enumerate_cells():
+            self.assertEqual(self.board.tile_at(cell), mutable.tile_at(cell))
+        
+        self.assertEqual(CompactBoard.from_board(mutable).codes(), self.board.codes())
+
+
+class TestBitBoard(unittest.TestCase):
+    """Тесты для BitBoard."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.board = BitBoard()
+    
+    def test_set_tile_and_masks(self):
+        """Тест установки фишек и масок типов."""
+        self.board.set_tile(Cell(3, 4), Tile(TileKind.C))
+        self.board.set_tile(Cell(3, 4), Tile(TileKind.A))
+        
+        self.assertEqual(self.board.tile_at(Cell(3, 4)), Tile(TileKind.A))
+        self.assertEqual(self.board.mask_of(TileKind.A.code()), 1 << 28)
+        self.assertEqual(self.board.mask_of(TileKind.C.code()), 0)
+        
+        self.board.set_tile(Cell(3, 4), None)
+        self.assertIsNone(self.board.tile_at(Cell(3, 4)))
+        self.assertEqual(self.board.empty_mask(), self.board.full_mask())
+    
+    def test_swap_and_clear_cells(self):
+        """Тест обмена фишек и удаления по маске."""
+        self.board.set_tile(Cell(0, 0), Tile(TileKind.A))
+        self.board.set_tile(Cell(0, 1), Tile(TileKind.B))
+        
+        self.board.swap(Cell(0, 0), Cell(0, 1))
+        
+        self.assertEqual(self.board.tile_at(Cell(0, 0)), Tile(TileKind.B))
+        self.assertEqual(self.board.clear_cells(0b111), 2)
+        self.assertEqual(self.board.occupied_mask(), 0)
+    
+    def test_shifted_does_not_wrap_rows(self):
+        """Тест сдвига маски без переноса между строками."""
+        last_column = 1 << 7
+        
+        self.assertEqual(self.board.shifted(1 << 8, 0, 1), 0)
+        self.assertEqual(self.board.shifted(last_column, 0, -1), 0)
+        self.assertEqual(self.board.shifted(1 << 9, 0, 1), 1 << 8)
+        self.assertEqual(self.board.shifted(1 << 8, 1, 0), 1)
+        self.assertEqual(self.board.shifted(1 << 60, -1, 0), 0)
+    
+    def test_shifted_on_single_column_board(self):
+        """Тест сдвига маски доски шириной в один столбец."""
+        board = BitBoard(1, 4)
+        column = 0b1111
+        
+        for dc in (1, 2, -1, -2):
+            self.assertEqual(board.shifted(column, 0, dc), 0)
+        self.assertEqual(board.shifted(column, 1, 0), 0b0111)
+        self.assertEqual(board.shifted(column, -2, 0), 0b1100)
+    
+    def test_matches_mutable_board(self):
+        """Тест совпадения содержимого с MutableBoard при том же seed."""
+        mutable = MutableBoard()
+        mutable.fill_empty(RandomProviderDefault(7))
+        self.board.fill_empty(RandomProviderDefault(7))
+        
+        for cell in mutable.enumerate_cells():
+            self.assertEqual(self.board.tile_at(cell), mutable.tile_at(cell))
+        
+        self.assertEqual(BitBoard.masks_of(mutable), BitBoard.masks_of(self.board))
+        
+        clone = self.board.clone()
+        clone.set_tile(Cell(0, 0), None)
+        self.assertIsNotNone(self.board.tile_at(Cell(0, 0)))
+
+
+class TestRandomProviderDefault(unittest.TestCase):
+    """Тесты для пакетной выдачи фишек RandomProviderDefault."""
+    
+    def test_default_stream_unchanged(self):
+        """Тест совпадения next_tile_kinds и fill_codes с поштучной выдачей."""
+        single = RandomProviderDefault(5)
+        expected = [single.next_tile_kind() for _ in range(200)]
+        
+        self.assertEqual(RandomProviderDefault(5).next_tile_kinds(200), expected)
+        
+        buffer = bytearray(200)
+        RandomProviderDefault(5).fill_codes(buffer)
+        self.assertEqual(bytes(buffer), bytes(kind.code() for kind in expected))
+    
+    def test_batched_stream_independent_of_chunks(self):
+        """Тест одинаковой последовательности пакетного потока при любой нарезке запросов."""
+        single = RandomProviderDefault(8, batched=True)
+        expected = [single.next_tile_kind() for _ in range(500)]
+        
+        provider = RandomProviderDefault(8, batched=True)
+        drawn = []
+        for size in (0, 1, 7, 64, 3, 200, 225):
+            if size % 2:
+                drawn.extend(provider.next_tile_kinds(size))
+            else:
+                buffer = bytearray(size)
+                provider.fill_codes(memoryview(buffer))
+                drawn.extend(TileKind.from_code(code) for code in buffer)
+        
+        self.assertTrue(provider.is_batched())
+        self.assertEqual(drawn, expected)
+        self.assertEqual(set(expected), set(TileKind.all()))
+    
+    def test_batched_state_round_trip(self):
+        """Тест продолжения пакетного потока после восстановления состояния."""
+        provider = RandomProviderDefault(8, batched=True)
+        provider.next_tile_kinds(10)
+        state = provider.get_state()
+        expected = provider.next_tile_kinds(50)
+        
+        restored = RandomProviderDefault(batched=True)
+        restored.set_state(state)
+        self.assertEqual(restored.next_tile_kinds(50), expected)
+    
+    def test_batched_boards_match(self):
+        """Тест одинакового заполнения досок разных представлений пакетным потоком."""
+        mutable = MutableBoard()
+        compact = CompactBoard()
+        bits = BitBoard()
+        mutable.fill_empty(RandomProviderDefault(7, batched=True))
+        compact.fill_empty(RandomProviderDefault(7, batched=True))
+        bits.fill_empty(RandomProviderDefault(7, batched=True))
+        
+        self.assertEqual(CompactBoard.codes_of(mutable), compact.codes())
+        self.assertEqual(BitBoard.masks_of(mutable), BitBoard.masks_of(bits))
 
 
 class TestBoardFactory(unittest.TestCase):
@@ -160,6 +429,62 @@ class TestBoardFactory(unittest.TestCase):
             tile = board.tile_at(cell)
             self.assertIsNotNone(tile)
             self.assertIn(tile.kind(), TileKind.all())
+    
+    def test_create_board_constructive_has_no_matches(self):
+        """Тест отсутствия совпадений на построенной доске."""
+        match_finder = MatchFinder()
+        for seed in range(20):
+            board = BoardFactory.create_board_constructive(RandomProviderDefault(seed))
+            
+            self.assertEqual(len(match_finder.find_matches(board)), 0)
+            for cell in board.enumerate_cells():
+                self.assertIsNotNone(board.tile_at(cell))
+    
+    def test_create_board_constructive_is_reproducible(self):
+        """Тест воспроизводимости доски при одинаковом seed."""
+        first = BoardFactory.create_board_constructive(RandomProviderDefault(7))
+        second = BoardFactory.create_board_constructive(RandomProviderDefault(7))
+        
+        for cell in first.enumerate_cells():
+            self.assertEqual(first.tile_at(cell), second.tile_at(cell))
+    
+    def test_create_board_constructive_with_move(self):
+        """Тест гарантии хотя бы одного хода."""
+        move_generator = MoveGenerator()
+        for seed in range(5):
+            board = BoardFactory.create_board_constructive(RandomProviderDefault(seed), move_generator)
+            
+            self.assertTrue(move_generator.has_available_moves(board))
+    
+    def test_create_board_constructive_without_possible_move(self):
+        """Тест отказа, если на доске такого размера ход невозможен."""
+        move_generator = MoveGenerator()
+        
+        with self.assertRaises(ValueError):
+            BoardFactory.create_board_constructive(RandomProviderDefault(1), move_generator, 2, 2)
+        
+        board = BoardFactory.create_board_constructive(RandomProviderDefault(1), move_generator, 1, 4)
+        self.assertTrue(move_generator.has_available_moves(board))
+    
+    def test_create_board_with_dimensions(self):
+        """Тест создания досок заданного размера."""
+        empty = BoardFactory.create_empty_board(10, 6)
+        self.assertEqual((empty.width(), empty.height()), (10, 6))
+        
+        board = BoardFactory.create_board_constructive(RandomProviderDefault(2), MoveGenerator(), 20, 30)
+        self.assertEqual((board.width(), board.height()), (20, 30))
+        self.assertEqual(len(MatchFinder().find_matches(board)), 0)
+        self.assertTrue(all(board.tile_at(cell) is not None for cell in board.enumerate_cells()))
+    
+    def test_create_board_without_matches_fallback(self):
+        """Тест доски без совпадений при вырожденном источнике случайности."""
+        class ConstantProvider(RandomProvider):
+            def next_tile_kind(self):
+                return TileKind.A
+        
+        board = BoardFactory.create_board_without_matches(ConstantProvider(), MatchFinder())
+        
+        self.assertEqual(len(MatchFinder().find_matches(board)), 0)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,415 @@
+"""Тесты для управления игрой."""
+
+import itertools
+import unittest
+from unittest import mock
+
+from board.cell import Cell
+from board.mutable_board import MutableBoard
+from control.board_pool import BoardPool
+from control.game_controller import GameController
+from control.game_state_builder import GameStateBuilder
+from control.move_journal import MoveJournal
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
+from main import create_game_services, initialize_game, replay_game
+
+
+class TestBoardPool(unittest.TestCase):
+    """Тесты для BoardPool."""
+    
+    def test_invalid_capacity(self):
+        """Тест отказа при неположительной ёмкости."""
+        with self.assertRaises(ValueError):
+            BoardPool(capacity=0)
+    
+    def test_fill_and_acquire(self):
+        """Тест выдачи готовых досок без совпадений и с ходами."""
+        pool = BoardPool(capacity=3, seed=1)
+        pool.fill()
+        
+        self.assertEqual(pool.size(), 3)
+        
+        for _ in range(3):
+            board = pool.acquire()
+            self.assertEqual(len(MatchFinder().find_matches(board)), 0)
+            self.assertTrue(MoveGenerator().has_available_moves(board))
+        
+        self.assertEqual(pool.size(), 0)
+    
+    def test_acquire_from_empty_pool(self):
+        """Тест синхронной генерации при пустом пуле."""
+        pool = BoardPool(capacity=2, seed=3)
+        
+        board = pool.acquire()
+        
+        self.assertEqual(len(MatchFinder().find_matches(board)), 0)
+    
+    def test_reproducible_sequence(self):
+        """Тест воспроизводимости последовательности досок по seed."""
+        first = BoardPool(capacity=2, seed=5)
+        second = BoardPool(capacity=2, seed=5)
+        
+        for _ in range(3):
+            board_a = first.acquire()
+            board_b = second.acquire()
+            for cell in board_a.enumerate_cells():
+                self.assertEqual(board_a.tile_at(cell), board_b.tile_at(cell))
+    
+    def test_background_refill(self):
+        """Тест фонового пополнения пула."""
+        pool = BoardPool(capacity=2, seed=7)
+        pool.start()
+        try:
+            self.assertTrue(pool.is_running())
+            board = pool.acquire()
+            self.assertEqual(len(MatchFinder().find_matches(board)), 0)
+        finally:
+            pool.stop(timeout=5)
+        
+        self.assertFalse(pool.is_running())
+        self.assertLessEqual(pool.size(), pool.capacity())
+    
+    def test_initialize_game_uses_pool(self):
+        """Тест старта игры с доской из пула."""
+        services = create_game_services(seed=11)
+        pool = BoardPool(capacity=1, seed=11)
+        pool.fill()
+        services.register_board_pool(pool)
+        
+        game_state = initialize_game(services)
+        
+        self.assertTrue(services.has_board_pool())
+        self.assertEqual(pool.size(), 0)
+        self.assertEqual(len(MatchFinder().find_matches(game_state.board)), 0)
+
+
+class TestServiceContainer(unittest.TestCase):
+    """Тесты для ServiceContainer."""
+    
+    def test_board_size_from_services(self):
+        """Тест размера доски новой партии из контейнера сервисов."""
+        services = create_game_services(seed=11, width=12, height=5)
+        self.assertEqual(services.get_board_size(), (12, 5))
+        
+        game_state = initialize_game(services)
+        self.assertEqual((game_state.board.width(), game_state.board.height()), (12, 5))
+        self.assertEqual(create_game_services(seed=11).get_board_size(), (8, 8))
+        
+        with self.assertRaises(ValueError):
+            services.register_board_size(0, 5)
+    
+    def test_board_size_without_possible_move(self):
+        """Тест отказа от размеров, на которых невозможен ни один ход."""
+        services = create_game_services(seed=1)
+        
+        for width, height in ((2, 2), (1, 2), (1, 3), (3, 1)):
+            with self.assertRaises(ValueError):
+                services.register_board_size(width, height)
+        
+        services.register_board_size(1, 4)
+        services.register_board_size(2, 3)
+        self.assertEqual(services.get_board_size(), (2, 3))
+    
+    def test_board_pool_of_other_size(self):
+        """Тест отказа от пула с досками другого размера."""
+        services = create_game_services(seed=11, width=10, height=10)
+        
+        with self.assertRaises(ValueError):
+            services.register_board_pool(BoardPool(capacity=1, seed=11))
+        self.assertFalse(services.has_board_pool())
+        
+        services.register_board_pool(BoardPool(capacity=1, seed=11, width=10, height=10))
+        with self.assertRaises(ValueError):
+            services.register_board_size(8, 8)
+        self.assertEqual(initialize_game(services).board.width(), 10)
+
+class TestGameStateHistory(unittest.TestCase):
+    """Тесты для истории досок GameState."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.services = create_game_services(seed=2)
+        self.controller = GameController(self.services)
+        self.generator = MoveGenerator()
+    
+    def test_history_disabled_by_default(self):
+        """Тест отсутствия истории без явного включения."""
+        state = initialize_game(self.services)
+        self.controller.perform_move(state, *self.generator.find_first_move(state.board))
+        
+        self.assertFalse(state.can_undo())
+        self.assertFalse(self.controller.undo(state))
+    
+    def test_undo_restores_board_and_score(self):
+        """Тест отмены ходов по снимкам."""
+        board = initialize_game(self.services).board
+        state = GameStateBuilder().with_board(board).with_history(2).build()
+        initial_hash = board.zobrist_hash()
+        
+        for _ in range(3):
+            self.controller.perform_move(state, *self.generator.find_first_move(state.board))
+            self.controller.update_moves_available(state)
+        
+        self.assertEqual(len(state.snapshots()), 2)
+        score_before_last = state.history[-1][1]
+        state.set_moves_available(False)
+        
+        self.assertTrue(self.controller.undo(state))
+        self.assertEqual(state.score, score_before_last)
+        self.assertTrue(state.moves_available)
+        self.assertTrue(self.controller.undo(state))
+        self.assertFalse(self.controller.undo(state))
+        self.assertNotEqual(state.board.zobrist_hash(), initial_hash)
+    
+    def test_snapshot_keeps_replaced_board(self):
+        """Тест: снимок хранит саму заменённую доску без копирования."""
+        board = initialize_game(self.services).board
+        state = GameStateBuilder().with_board(board).with_history(1).build()
+        expected = board.zobrist_hash()
+        
+        self.controller.perform_move(state, *self.generator.find_first_move(state.board))
+        
+        self.assertIs(state.snapshots()[0], board)
+        self.assertEqual(board.zobrist_hash(), expected)
+    
+    def test_history_follows_journal(self):
+        """Тест согласованности истории снимков с отменой и повтором по журналу."""
+        board = initialize_game(self.services).board
+        state = GameStateBuilder().with_board(board).with_history(4).with_journal(2).build()
+        for _ in range(3):
+            self.controller.perform_move(state, *self.generator.find_first_move(state.board))
+        
+        self.assertTrue(self.controller.undo(state))
+        self.assertEqual(len(state.snapshots()), 2)
+        self.assertTrue(self.controller.redo(state))
+        self.assertEqual(len(state.snapshots()), 3)
+        
+        for _ in range(3):
+            self.assertTrue(self.controller.undo(state))
+        self.assertFalse(state.can_undo())
+        self.assertEqual(state.board.zobrist_hash(), board.zobrist_hash())
+
+
+class TestMoveJournal(unittest.TestCase):
+    """Тесты для журнала ходов."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.seed = 21
+        self.services = create_game_services(self.seed)
+        self.controller = GameController(self.services)
+        self.state = initialize_game(self.services)
+        self.state.journal = MoveJournal(self.seed)
+        self.generator = MoveGenerator()
+    
+    def play(self, count):
+        """Сыграть несколько первых доступных ходов.
+        
+        Args:
+            count: Количество ходов
+        
+        Returns:
+            list: Хеши досок после каждого хода, начиная с исходной
+        """
+        hashes = [self.state.board.zobrist_hash()]
+        for _ in range(count):
+            move = self.generator.find_first_move(self.state.board)
+            self.assertTrue(self.controller.perform_move(self.state, *move))
+            hashes.append(self.state.board.zobrist_hash())
+        return hashes
+    
+    def test_undo_and_redo(self):
+        """Тест отмены и повтора ходов по журналу."""
+        hashes = self.play(5)
+        final_score = self.state.score
+        
+        for expected in reversed(hashes[:-1]):
+            self.assertTrue(self.controller.undo(self.state))
+            self.assertEqual(self.state.board.zobrist_hash(), expected)
+        self.assertEqual(self.state.score, 0)
+        self.assertFalse(self.controller.undo(self.state))
+        
+        for expected in hashes[1:]:
+            self.assertTrue(self.controller.redo(self.state))
+            self.assertEqual(self.state.board.zobrist_hash(), expected)
+        self.assertEqual(self.state.score, final_score)
+        self.assertFalse(self.controller.redo(self.state))
+    
+    def test_new_move_discards_redo(self):
+        """Тест отбрасывания отменённых ходов новым ходом."""
+        self.play(2)
+        self.controller.undo(self.state)
+        self.assertTrue(self.state.journal.can_redo())
+        
+        self.play(1)
+        
+        self.assertFalse(self.state.journal.can_redo())
+        self.assertEqual(len(self.state.journal.moves()), 2)
+    
+    def test_replay_from_seed(self):
+        """Тест воспроизведения партии по seed и ходам."""
+        self.play(4)
+        
+        replayed = replay_game(self.seed, self.state.journal.moves())
+        
+        self.assertEqual(replayed.board.zobrist_hash(), self.state.board.zobrist_hash())
+        self.assertEqual(replayed.score, self.state.score)
+        self.assertEqual(replayed.journal.moves(), self.state.journal.moves())
+    
+    def test_undo_and_redo_write_only_changed_cells(self):
+        """Тест: отмена и повтор не перезаписывают ячейки той же фишкой."""
+        self.play(4)
+        redundant = []
+        set_tile = MutableBoard.set_tile
+        
+        def counting_set_tile(board, cell, tile):
+            if board.tile_at(cell) == tile:
+                redundant.append(cell)
+            set_tile(board, cell, tile)
+        
+        with mock.patch.object(MutableBoard, 'set_tile', counting_set_tile):
+            for _ in range(4):
+                self.assertTrue(self.controller.undo(self.state))
+            for _ in range(4):
+                self.assertTrue(self.controller.redo(self.state))
+        
+        self.assertEqual(redundant, [])
+    
+    def test_replay_after_undo_and_new_move(self):
+        """Тест воспроизведения партии, в которой ходы отменялись и повторялись."""
+        # Интервал 2: отмена проходит через точку сохранения состояния поставщика
+        for seed, interval in itertools.product((11, self.seed), (2, 32)):
+            self.services = create_game_services(seed)
+            self.controller = GameController(self.services)
+            self.state = initialize_game(self.services)
+            self.state.journal = MoveJournal(seed, random_checkpoint_interval=interval)
+            
+            self.play(5)
+            for _ in range(4):
+                self.controller.undo(self.state)
+            self.controller.redo(self.state)
+            last_move = self.generator.generate_all_moves(self.state.board)[-1]
+            self.assertTrue(self.controller.perform_move(self.state, *last_move))
+            self.play(2)
+            
+            replayed = replay_game(seed, self.state.journal.moves())
+            
+            self.assertEqual(replayed.board.zobrist_hash(), self.state.board.zobrist_hash())
+            self.assertEqual(replayed.score, self.state.score)
+
+
+class TestCascadeSteps(unittest.TestCase):
+    """Тесты для пошагового выполнения каскада."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.seed = 8
+        self.generator = MoveGenerator()
+    
+    def new_game(self):
+        """Начать партию с фиксированным seed.
+        
+        Returns:
+            tuple: Контроллер и состояние партии
+        """
+        services = create_game_services(self.seed)
+        return GameController(services), initialize_game(services)
+    
+    def test_stream_matches_perform_move(self):
+        """Тест совпадения потокового хода с perform_move."""
+        controller, state = self.new_game()
+        reference_controller, reference = self.new_game()
+        
+        for _ in range(10):
+            move = self.generator.find_first_move(state.board)
+            score_before = state.score
+            steps = list(controller.stream_move(state, *move))
+            reference_controller.perform_move(reference, *move)
+            
+            self.assertEqual([step.cascade_index for step in steps], list(range(len(steps))))
+            self.assertEqual(state.score - score_before, sum(step.points for step in steps))
+            self.assertEqual(state.score, reference.score)
+            self.assertEqual(state.board.zobrist_hash(), reference.board.zobrist_hash())
+    
+    def test_step_changes(self):
+        """Тест перемещений и заполнений шага на полной доске."""
+        controller, state = self.new_game()
+        move = self.generator.find_first_move(state.board)
+        board = state.board.clone()
+        board.swap(*move)
+        
+        for step in controller.iter_cascade(board):
+            removed = set().union(*step.matches)
+            self.assertEqual(len(removed), step.removed_count)
+            self.assertEqual(len(step.filled), step.removed_count)
+            for source, target in step.moved:
+                self.assertEqual(source.col(), target.col())
+                self.assertGreater(target.row(), source.row())
+    
+    def test_early_stop_keeps_state(self):
+        """Тест неизменности состояния при прерванном переборе шагов."""
+        controller, state = self.new_game()
+        initial_hash = state.board.zobrist_hash()
+        move = self.generator.find_first_move(state.board)
+        
+        steps = controller.stream_move(state, *move)
+        self.assertEqual(next(steps).cascade_index, 0)
+        steps.close()
+        
+        self.assertEqual(state.board.zobrist_hash(), initial_hash)
+        self.assertEqual(state.score, 0)
+    
+    def test_early_stop_rolls_back_random_and_combo(self):
+        """Тест повторения прерванного хода с тем же результатом."""
+        for seed in range(5):
+            self.seed = seed
+            controller, state = self.new_game()
+            reference_controller, reference = self.new_game()
+            move = self.generator.find_first_move(state.board)
+            
+            steps = controller.stream_move(state, *move)
+            next(steps)
+            steps.close()
+            self.assertEqual(controller._combo_tracker.current_index(), 0)
+            
+            controller.perform_move(state, *move)
+            reference_controller.perform_move(reference, *move)
+            self.assertEqual(state.score, reference.score)
+            self.assertEqual(state.board.zobrist_hash(), reference.board.zobrist_hash())
+    
+    def test_early_stop_without_random_state_finishes_move(self):
+        """Тест завершения хода при закрытии потока, если поставщик не сохраняет состояние."""
+        class StatelessProvider(RandomProviderDefault):
+            def get_state(self):
+                return None
+        
+        services = create_game_services(self.seed)
+        services.register_random_provider(StatelessProvider(self.seed))
+        controller = GameController(services)
+        state = initialize_game(services)
+        reference_controller, reference = self.new_game()
+        move = self.generator.find_first_move(state.board)
+        
+        steps = controller.stream_move(state, *move)
+        next(steps)
+        steps.close()
+        reference_controller.perform_move(reference, *move)
+        
+        self.assertEqual(state.score, reference.score)
+        self.assertEqual(state.board.zobrist_hash(), reference.board.zobrist_hash())
+    
+    def test_invalid_move(self):
+        """Тест невалидного хода."""
+        controller, state = self.new_game()
+        
+        valid = set(self.generator.generate_all_moves(state.board))
+        a, b = next((Cell(row, col), Cell(row, col + 1)) for row in range(8) for col in range(7)
+                    if (Cell(row, col), Cell(row, col + 1)) not in valid)
+        
+        self.assertIsNone(controller.stream_move(state, a, b))
+
+
+if __name__ == '__main__':
+    unittest.main()
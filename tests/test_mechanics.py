@@ -1,5 +1,6 @@
 """Тесты для игровой механики."""
 
+import random
 import unittest
 from board.tile_kind import TileKind
 from board.tile import Tile
@@ -7,6 +8,8 @@ from board.cell import Cell
 from board.mutable_board import MutableBoard
 from mechanics.match_resolver import MatchResolver
 from mechanics.gravity_engine import GravityEngine
+from mechanics.column_gravity_engine import ColumnGravityEngine
+from board.compact_board import CompactBoard
 from random_generator.random_provider_default import RandomProviderDefault
 
 
@@ -101,5 +104,65 @@ class TestGravityEngine(unittest.TestCase):
         self.assertIn(tile2.kind(), TileKind.all())
 
 
+
+class TestColumnGravityEngine(unittest.TestCase):
+    """Тесты для ColumnGravityEngine."""
+    
+    def _random_board_with_holes(self, rng: random.Random) -> MutableBoard:
+        """Создать заполненную доску со случайными пустыми ячейками."""
+        board = MutableBoard()
+        board.fill_empty(RandomProviderDefault(rng.randrange(1000)))
+        for cell in board.enumerate_cells():
+            if rng.random() < 0.2:
+                board.set_tile(cell, None)
+        return board
+    
+    def _assert_same_as_reference(self, engine: ColumnGravityEngine) -> None:
+        """Сравнить гравитацию и заполнение с GravityEngine на одних seed."""
+        reference = GravityEngine()
+        rng = random.Random(31)
+        for iteration in range(200):
+            board = self._random_board_with_holes(rng)
+            compact = CompactBoard.from_board(board)
+            
+            reference.apply_gravity(board)
+            engine.apply_gravity(compact)
+            self.assertEqual(compact.codes(), CompactBoard.codes_of(board))
+            
+            reference.refill(board, RandomProviderDefault(iteration))
+            engine.refill(compact, RandomProviderDefault(iteration))
+            self.assertEqual(compact.codes(), CompactBoard.codes_of(board))
+    
+    def test_matches_gravity_engine(self):
+        """Тест совпадения с GravityEngine."""
+        self._assert_same_as_reference(ColumnGravityEngine())
+    
+    @unittest.skipUnless(ColumnGravityEngine.numpy_available(), "numpy не установлен")
+    def test_numpy_matches_gravity_engine(self):
+        """Тест совпадения векторного режима с GravityEngine."""
+        self._assert_same_as_reference(ColumnGravityEngine(use_numpy=True))
+    
+    def test_refill_without_gravity(self):
+        """Тест заполнения доски, изменённой после гравитации."""
+        engine = ColumnGravityEngine()
+        board = CompactBoard()
+        board.fill_empty(RandomProviderDefault(1))
+        engine.apply_gravity(board)
+        board.set_tile(Cell(5, 5), None)
+        
+        engine.refill(board, RandomProviderDefault(2))
+        
+        self.assertIsNotNone(board.tile_at(Cell(5, 5)))
+    
+    def test_mutable_board_fallback(self):
+        """Тест обработки MutableBoard базовой реализацией."""
+        self.board = MutableBoard()
+        self.board.set_tile(Cell(0, 3), Tile(TileKind.A))
+        
+        ColumnGravityEngine().apply_gravity(self.board)
+        
+        self.assertEqual(self.board.tile_at(Cell(7, 3)), Tile(TileKind.A))
+
+
 if __name__ == '__main__':
     unittest.main()
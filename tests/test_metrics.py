@@ -0,0 +1,206 @@
+"""Тесты для метрик горячих путей."""
+
+import json
+import random
+import unittest
+import urllib.request
+
+from control.game_controller import GameController
+from metrics.exporters import to_json, to_prometheus
+from metrics.histogram import Histogram
+from metrics.metrics_http_server import MetricsHttpServer
+from metrics.metrics_registry import MetricsRegistry
+from metrics.null_metrics import NullMetrics
+from main import create_game_services, initialize_game
+from rules.move_generator import MoveGenerator
+from search.move_search import MoveSearch
+
+
+class TestHistogram(unittest.TestCase):
+    """Тесты для Histogram."""
+    
+    def test_buckets_cover_values(self):
+        """Тест границ корзин: каждое значение не больше верхней границы своей корзины."""
+        histogram = Histogram()
+        values = [0, 1, 31, 32, 33, 1000, 123456789]
+        for value in values:
+            histogram.record(value)
+        
+        buckets = list(histogram.buckets())
+        self.assertEqual(sum(count for _, count in buckets), len(values))
+        self.assertEqual([upper for upper, _ in buckets], sorted(upper for upper, _ in buckets))
+        for value in values:
+            upper = next(upper for upper, _ in buckets if upper >= value)
+            self.assertLessEqual(upper, value + value / 16)
+    
+    def test_clear(self):
+        """Тест очистки."""
+        histogram = Histogram()
+        histogram.record(5)
+        histogram.clear()
+        
+        self.assertEqual(histogram.count(), 0)
+        self.assertEqual(list(histogram.buckets()), [])
+
+
+class TestMetricsRegistry(unittest.TestCase):
+    """Тесты для MetricsRegistry и NullMetrics."""
+    
+    def test_timed_and_instrument(self):
+        """Тест замеров функций и методов сервиса."""
+        metrics = MetricsRegistry()
+        generator = MoveGenerator()
+        board = initialize_game(create_game_services(seed=1)).board
+        
+        square = metrics.timed('square', lambda value: value * value)
+        wrapped = metrics.instrument(generator, {'generate_all_moves': 'moves'})
+        
+        self.assertEqual(square(7), 49)
+        self.assertEqual(wrapped.generate_all_moves(board), generator.generate_all_moves(board))
+        self.assertEqual(wrapped.find_first_move(board), generator.find_first_move(board))
+        self.assertEqual(metrics.timer('square').count(), 1)
+        self.assertEqual(metrics.timer('moves').count(), 1)
+        self.assertNotIn('find_first_move', metrics.timers())
+    
+    def test_reset_keeps_wrappers(self):
+        """Тест записи обёрток после сброса."""
+        metrics = MetricsRegistry()
+        identity = metrics.timed('identity', lambda value: value)
+        identity(1)
+        metrics.increment('calls', 3)
+        
+        metrics.reset()
+        identity(2)
+        
+        self.assertEqual(metrics.counter('calls'), 0)
+        self.assertEqual(metrics.timer('identity').count(), 1)
+    
+    def test_null_metrics_do_not_wrap(self):
+        """Тест отсутствия обёрток у выключенных метрик."""
+        metrics = NullMetrics()
+        generator = MoveGenerator()
+        func = len
+        
+        self.assertIs(metrics.timed('len', func), func)
+        self.assertIs(metrics.instrument(generator, {'generate_all_moves': 'moves'}), generator)
+        self.assertEqual(metrics.snapshot(), {'counters': {}, 'timers': {}, 'histograms': {}})
+    
+    def test_controller_stages(self):
+        """Тест замеров этапов каскада и распределений в GameController."""
+        metrics = MetricsRegistry()
+        services = create_game_services(seed=4)
+        services.register_metrics(metrics)
+        controller = GameController(services)
+        state = initialize_game(services)
+        generator = MoveGenerator()
+        
+        for _ in range(5):
+            controller.perform_move(state, *generator.find_first_move(state.board))
+            controller.update_moves_available(state)
+        
+        timers = metrics.timers()
+        self.assertEqual(timers['move.perform'].count(), 5)
+        self.assertEqual(timers['board.clone'].count(), 5)
+        self.assertEqual(timers['move_generator.has_available_moves'].count(), 5)
+        self.assertGreaterEqual(timers['swap_validator.is_valid_swap'].count(), 5)
+        depth = metrics.histograms()['cascade.depth']
+        self.assertEqual(depth.count(), 5)
+        # Каждый шаг каскада ищет совпадения, и ещё один поиск завершает каскад
+        self.assertEqual(timers['cascade.find'].count(), depth.total() + 5)
+        for stage in ('remove', 'gravity', 'refill', 'score'):
+            self.assertEqual(timers[f'cascade.{stage}'].count(), depth.total())
+        self.assertEqual(metrics.histograms()['cascade.removed_tiles'].count(), depth.total())
+    
+    def test_search_keeps_out_of_game_stages(self):
+        """Тест: каскады поиска не попадают в замеры этапов идущей игры."""
+        metrics = MetricsRegistry()
+        services = create_game_services(seed=4)
+        services.register_metrics(metrics)
+        GameController(services)
+        state = initialize_game(services)
+        
+        MoveSearch(services, samples=2).search(state.board, time_budget=30, max_depth=1)
+        
+        timers = metrics.timers()
+        self.assertEqual(timers['move.perform'].count(), 0)
+        self.assertEqual(timers['cascade.find'].count(), 0)
+        self.assertEqual(timers['board.clone'].count(), 0)
+    
+    def test_registries_of_games_are_independent(self):
+        """Тест: контроллер пишет замеры только в реестр своих сервисов."""
+        first, second = MetricsRegistry(), MetricsRegistry()
+        services = create_game_services(seed=4)
+        services.register_metrics(first)
+        controller = GameController(services)
+        other_services = create_game_services(seed=5)
+        other_services.register_metrics(second)
+        GameController(other_services)
+        state = initialize_game(services)
+        
+        controller.perform_move(state, *MoveGenerator().find_first_move(state.board))
+        
+        self.assertEqual(first.timers()['board.clone'].count(), 1)
+        self.assertEqual(second.timers()['board.clone'].count(), 0)
+    
+    def test_controller_without_metrics(self):
+        """Тест контроллера без зарегистрированных метрик."""
+        services = create_game_services(seed=4)
+        controller = GameController(services)
+        
+        self.assertIs(controller._match_finder, services.get_match_finder())
+        self.assertFalse(services.get_metrics().enabled())
+
+
+class TestExporters(unittest.TestCase):
+    """Тесты для выгрузки в JSON и Prometheus."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.metrics = MetricsRegistry()
+        rng = random.Random(6)
+        self.values = [rng.randrange(0, 5000) for _ in range(200)]
+        for value in self.values:
+            self.metrics.observe('removed', value)
+        self.metrics.timer('clone').record(1500)
+        self.metrics.increment('moves', 2)
+    
+    def test_json(self):
+        """Тест выгрузки в JSON."""
+        snapshot = json.loads(to_json(self.metrics))
+        
+        self.assertEqual(snapshot['counters'], {'moves': 2})
+        self.assertEqual(snapshot['timers']['clone']['count'], 1)
+        self.assertEqual(snapshot['histograms']['removed']['max'], max(self.values))
+    
+    def test_prometheus_cumulative_buckets(self):
+        """Тест точных накопленных количеств на границах октав."""
+        lines = to_prometheus(self.metrics, prefix='test').splitlines()
+        
+        self.assertIn('test_moves_total 2', lines)
+        self.assertIn('test_clone_seconds_count 1', lines)
+        for line in lines:
+            if line.startswith('test_removed_bucket{le="') and '+Inf' not in line:
+                bound = int(line.split('"')[1])
+                expected = sum(1 for value in self.values if value <= bound)
+                self.assertEqual(int(line.rsplit(' ', 1)[1]), expected)
+        self.assertIn(f'test_removed_bucket{{le="+Inf"}} {len(self.values)}', lines)
+    
+    def test_http_server(self):
+        """Тест HTTP-точки для сбора метрик."""
+        server = MetricsHttpServer(self.metrics)
+        server.start()
+        try:
+            host, port = server.address()
+            with urllib.request.urlopen(f'http://{host}:{port}/metrics') as response:
+                body = response.read().decode('utf-8')
+            with urllib.request.urlopen(f'http://{host}:{port}/metrics.json') as response:
+                snapshot = json.loads(response.read())
+        finally:
+            server.close()
+        
+        self.assertEqual(body, to_prometheus(self.metrics))
+        self.assertEqual(snapshot['counters'], {'moves': 2})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,247 @@
+"""Тесты для сохранения игровых данных."""
+
+import json
+import os
+import tempfile
+import unittest
+
+from board.board_factory import BoardFactory
+from board.cell import Cell
+from board.compact_board import CompactBoard
+from board.tile import Tile
+from board.tile_kind import TileKind
+from control.game_state import GameState
+from persistence.game_state_serializer import GameStateSerializer
+from random_generator.random_provider_default import RandomProviderDefault
+from persistence.game_archive import ArchiveLayout, GameArchive, GameArchiveWriter, GameRecord
+from control.game_controller import GameController
+from main import create_game_services, initialize_game, record_game
+
+
+class TestGameStateSerializer(unittest.TestCase):
+    """Тесты для GameStateSerializer."""
+    
+    def setUp(self):
+        """Подготовка состояния с несколькими пустыми ячейками."""
+        self.serializer = GameStateSerializer()
+        services = create_game_services(seed=7)
+        self.state = initialize_game(services)
+        self.state.board.set_tile(Cell(0, 0), None)
+        self.state.board.set_tile(Cell(7, 7), None)
+        self.state.score = 12345
+    
+    def test_record_size(self):
+        """Тест фиксированного размера записи: 3 бита на ячейку."""
+        data = self.serializer.encode(self.state)
+        self.assertEqual(len(data), GameStateSerializer.record_size(8, 8))
+        self.assertEqual(len(data), 18 + 24)
+    
+    def test_binary_round_trip(self):
+        """Тест восстановления доски, счёта и флага ходов."""
+        for compact in (False, True):
+            restored = self.serializer.decode(self.serializer.encode(self.state), compact=compact)
+            self.assertEqual(CompactBoard.codes_of(restored.board), CompactBoard.codes_of(self.state.board))
+            self.assertEqual(restored.score, 12345)
+            self.assertTrue(restored.moves_available)
+        self.assertIsInstance(self.serializer.decode(self.serializer.encode(self.state), compact=True).board,
+                              CompactBoard)
+    
+    def test_decode_from_memoryview_offset(self):
+        """Тест чтения нескольких записей из общего буфера."""
+        size = GameStateSerializer.record_size()
+        buffer = bytearray(size * 2)
+        self.serializer.encode_into(GameState(board=self.state.board, score=1, moves_available=False), buffer)
+        self.serializer.encode_into(self.state, memoryview(buffer), offset=size)
+        
+        restored = self.serializer.decode(memoryview(buffer), offset=size)
+        self.assertEqual(restored.score, 12345)
+        self.assertEqual(self.serializer.decode(buffer).score, 1)
+    
+    def test_rejects_corrupted_records(self):
+        """Тест ошибок при неверной сигнатуре, коде фишки и обрезанной записи."""
+        data = bytearray(self.serializer.encode(self.state))
+        with self.assertRaises(ValueError):
+            self.serializer.decode(data[:-1])
+        with self.assertRaises(ValueError):
+            self.serializer.decode(b'XXXX' + data[4:])
+        
+        data[18] |= 0x7
+        with self.assertRaises(ValueError):
+            self.serializer.decode(data)
+        with self.assertRaises(ValueError):
+            self.serializer.encode_into(self.state, bytearray(10))
+    
+    def test_json_round_trip(self):
+        """Тест читаемого JSON-представления."""
+        self.state.board.set_tile(Cell(0, 1), Tile(TileKind.C))
+        text = self.serializer.to_json(self.state)
+        self.assertTrue(json.loads(text)['board'][0].startswith('.C'))
+        
+        restored, provider = self.serializer.from_json(text)
+        self.assertIsNone(provider)
+        self.assertEqual(CompactBoard.codes_of(restored.board), CompactBoard.codes_of(self.state.board))
+        self.assertEqual(restored.score, 12345)
+    
+    def test_random_state_round_trip(self):
+        """Тест продолжения последовательности фишек после восстановления генератора."""
+        provider = RandomProviderDefault(seed=3)
+        provider.next_tile_kind()
+        data = self.serializer.encode_random(provider)
+        self.assertEqual(len(data), GameStateSerializer.random_size())
+        
+        restored = self.serializer.decode_random(data)
+        _, from_json = self.serializer.from_json(self.serializer.to_json(self.state, provider))
+        expected = [provider.next_tile_kind() for _ in range(20)]
+        self.assertEqual([restored.next_tile_kind() for _ in range(20)], expected)
+        self.assertEqual([from_json.next_tile_kind() for _ in range(20)], expected)
+    
+    def test_batched_random_state_round_trip(self):
+        """Тест сохранения пакетного режима поставщика."""
+        provider = RandomProviderDefault(seed=3, batched=True)
+        provider.next_tile_kinds(5)
+        data = self.serializer.encode_random(provider)
+        
+        restored = self.serializer.decode_random(data)
+        _, from_json = self.serializer.from_json(self.serializer.to_json(self.state, provider))
+        expected = provider.next_tile_kinds(40)
+        self.assertTrue(restored.is_batched())
+        self.assertTrue(from_json.is_batched())
+        self.assertEqual(restored.next_tile_kinds(40), expected)
+        self.assertEqual(from_json.next_tile_kinds(40), expected)
+        
+        with self.assertRaises(ValueError):
+            self.serializer.decode_random(data, provider=RandomProviderDefault())
+
+
+class TestGameArchive(unittest.TestCase):
+    """Тесты для архива партий."""
+    
+    def setUp(self):
+        """Подготовка временного файла и двух сыгранных партий."""
+        handle, self.path = tempfile.mkstemp(suffix='.m3ga')
+        os.close(handle)
+        os.remove(self.path)
+        self.layout = ArchiveLayout(max_moves=32, snapshot_interval=4)
+        self.records = [record_game(seed, self._play(seed, 6), snapshot_interval=4) for seed in (1, 2)]
+    
+    def tearDown(self):
+        """Удаление временного файла."""
+        if os.path.exists(self.path):
+            os.remove(self.path)
+    
+    def _play(self, seed, count):
+        """Сыграть первыми доступными ходами и вернуть ходы."""
+        services = create_game_services(seed)
+        state = initialize_game(services)
+        controller = GameController(services)
+        moves = []
+        for _ in range(count):
+            move = services.get_move_generator().find_first_move(state.board)
+            if move is None:
+                break
+            controller.perform_move(state, *move)
+            moves.append(move)
+        return moves
+    
+    def test_random_access_and_iteration(self):
+        """Тест чтения партий по индексу и последовательно."""
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            for record in self.records:
+                writer.append(record)
+        
+        with GameArchive(self.path) as archive:
+            self.assertEqual(len(archive), 2)
+            self.assertEqual(os.path.getsize(self.path), 18 + 2 * self.layout.record_size())
+            last = archive[-1]
+            self.assertEqual((last.seed, last.moves, last.final_score),
+                             (2, self.records[1].moves, self.records[1].final_score))
+            self.assertEqual(len(last.snapshots), len(self.records[1].snapshots))
+            self.assertEqual(CompactBoard.codes_of(last.snapshots[0].board),
+                             CompactBoard.codes_of(self.records[1].snapshots[0].board))
+            self.assertEqual([record.seed for record in archive], [1, 2])
+            self.assertEqual(list(archive.iter_scores()),
+                             [(record.seed, record.final_score) for record in self.records])
+    
+    def test_replay_from_archive(self):
+        """Тест воспроизведения партии по seed и ходам из архива."""
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            writer.append(self.records[0])
+        
+        with GameArchive(self.path) as archive:
+            stored = archive.record(0, snapshots=False)
+        replayed = record_game(stored.seed, stored.moves, snapshot_interval=4)
+        self.assertEqual(replayed.final_score, self.records[0].final_score)
+    
+    def test_append_to_existing_archive(self):
+        """Тест дозаписи и проверки параметров существующего архива."""
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            writer.append(self.records[0])
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            writer.append(self.records[1])
+        with self.assertRaises(ValueError):
+            GameArchiveWriter(self.path, ArchiveLayout(max_moves=64))
+        
+        with open(self.path, 'ab') as handle:
+            handle.write(b'partial')
+        with GameArchive(self.path) as archive:
+            self.assertEqual(len(archive), 2)
+    
+    def test_append_after_partial_record(self):
+        """Тест дозаписи после недописанной при сбое записи."""
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            writer.append(self.records[0])
+        with open(self.path, 'ab') as handle:
+            handle.write(b'partial')
+        
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            writer.append(self.records[1])
+        
+        with GameArchive(self.path) as archive:
+            self.assertEqual([record.seed for record in archive], [1, 2])
+            self.assertEqual(archive[1].moves, self.records[1].moves)
+            self.assertEqual(archive[1].final_score, self.records[1].final_score)
+    
+    def test_layout_limits(self):
+        """Тест отказа от параметров, не помещающихся в формат записи."""
+        ArchiveLayout(width=128, height=256)
+        for layout in ({'width': 256, 'height': 256}, {'width': 0}, {'max_moves': 70000},
+                       {'snapshot_interval': 0}):
+            with self.assertRaises(ValueError):
+                ArchiveLayout(**layout)
+    
+    def test_rejects_snapshot_of_other_size(self):
+        """Тест отказа от снимка доски другого размера и хода вне доски."""
+        board = BoardFactory.create_initial_board(RandomProviderDefault(1), 10, 6)
+        record = GameRecord(seed=0, moves=(), final_score=0,
+                            snapshots=(GameState(board=board, score=0, moves_available=True),))
+        
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(record)
+            with self.assertRaises(ValueError):
+                writer.append(GameRecord(seed=0, moves=((Cell(7, 7), Cell(7, 8)),), final_score=0))
+    
+    def test_rejects_seed_and_score_outside_uint64(self):
+        """Тест отказа от отрицательного seed и счёта, не помещающихся в запись."""
+        with GameArchiveWriter(self.path, self.layout) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(record_game(-3, []))
+            with self.assertRaises(ValueError):
+                writer.append(GameRecord(seed=1 << 64, moves=(), final_score=0))
+            with self.assertRaises(ValueError):
+                writer.append(GameRecord(seed=0, moves=(), final_score=-1))
+        
+        with GameArchive(self.path) as archive:
+            self.assertEqual(len(archive), 0)
+    
+    def test_rejects_oversized_records(self):
+        """Тест ошибок при слишком длинной партии и несоседних ячейках."""
+        with GameArchiveWriter(self.path, ArchiveLayout(max_moves=2, snapshot_interval=1)) as writer:
+            with self.assertRaises(ValueError):
+                writer.append(GameRecord(seed=0, moves=((Cell(0, 0), Cell(0, 1)),) * 3, final_score=0))
+            with self.assertRaises(ValueError):
+                writer.append(GameRecord(seed=0, moves=((Cell(0, 0), Cell(2, 2)),), final_score=0))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -1,13 +1,75 @@
 """Тесты для игровых правил."""
 
+import random
 import unittest
 from board.tile_kind import TileKind
 from board.tile import Tile
 from board.cell import Cell
 from board.mutable_board import MutableBoard
+from board.compact_board import CompactBoard
+from board.bit_board import BitBoard
+from board.board_factory import BoardFactory
 from rules.swap_validator import SwapValidator
 from rules.match_finder import MatchFinder
+from rules.run_length_match_finder import RunLengthMatchFinder
 from rules.move_generator import MoveGenerator
+from rules.pattern_move_generator import PatternMoveGenerator
+from rules.bitboard_match_finder import BitboardMatchFinder
+from rules.bitboard_move_generator import BitboardMoveGenerator
+from rules.stripe_executor import StripeExecutor
+from rules.tiled_match_finder import TiledMatchFinder
+from rules.tiled_move_generator import TiledMoveGenerator
+from random_generator.random_provider_default import RandomProviderDefault
+from control.service_container import ServiceContainer
+from control.game_controller import GameController
+from control.game_state_builder import GameStateBuilder
+from mechanics.match_resolver import MatchResolver
+from mechanics.gravity_engine import GravityEngine
+from scoring.score_manager import ScoreManager
+from scoring.combo_tracker import ComboTracker
+
+
+def make_random_board(rng: random.Random, kinds_count: int = 5,
+                      empty_share: float = 0.0, width: int = 8, height: int = 8) -> MutableBoard:
+    """Создать доску со случайными фишками для дифференциальных тестов.
+    
+    Args:
+        rng: Генератор случайных чисел
+        kinds_count: Число используемых типов фишек
+        empty_share: Доля пустых ячеек
+        width: Ширина доски
+        height: Высота доски
+        
+    Returns:
+        MutableBoard: Случайная доска
+    """
+    kinds = TileKind.all()[:kinds_count]
+    board = MutableBoard(width, height)
+    for cell in board.enumerate_cells():
+        if rng.random() >= empty_share:
+            board.set_tile(cell, Tile.of(rng.choice(kinds)))
+    return board
+
+
+def create_services(match_finder) -> ServiceContainer:
+    """Создать контейнер сервисов с указанным поисковиком совпадений.
+    
+    Args:
+        match_finder: Поисковик совпадений
+        
+    Returns:
+        ServiceContainer: Контейнер с зарегистрированными сервисами
+    """
+    container = ServiceContainer()
+    container.register_swap_validator(SwapValidator())
+    container.register_match_finder(match_finder)
+    container.register_match_resolver(MatchResolver())
+    container.register_gravity_engine(GravityEngine())
+    container.register_score_manager(ScoreManager())
+    container.register_combo_tracker(ComboTracker())
+    container.register_random_provider(RandomProviderDefault(3))
+    container.register_move_generator(MoveGenerator())
+    return container
 
 
 class TestSwapValidator(unittest.TestCase):
@@ -53,6 +115,56 @@ class TestSwapValidator(unittest.TestCase):
         
         # Своп не должен быть валидным
         self.assertFalse(self.validator.is_valid_swap(self.board, cell1, cell2))
+    
+    def test_local_match_check(self):
+        """Тест локальной проверки свопа без копирования доски."""
+        self.board.set_tile(Cell(3, 3), Tile(TileKind.A))
+        self.board.set_tile(Cell(3, 4), Tile(TileKind.A))
+        self.board.set_tile(Cell(3, 5), Tile(TileKind.B))
+        self.board.set_tile(Cell(4, 5), Tile(TileKind.A))
+        
+        self.assertTrue(self.validator.is_swap_creating_local_match(self.board, Cell(3, 5), Cell(4, 5)))
+        self.assertFalse(self.validator.is_swap_creating_local_match(self.board, Cell(3, 4), Cell(3, 5)))
+    
+    def test_incremental_mode_matches_full_check(self):
+        """Тест эквивалентности инкрементального режима на досках без совпадений."""
+        incremental = SwapValidator(incremental=True)
+        rng = random.Random(77)
+        checked = 0
+        while checked < 40:
+            board = make_random_board(rng, kinds_count=rng.choice([4, 5]))
+            if MatchFinder().find_matches(board):
+                continue
+            checked += 1
+            compact = CompactBoard.from_board(board)
+            for cell in board.enumerate_cells():
+                for neighbor in (Cell(cell.row(), cell.col() + 1), Cell(cell.row() + 1, cell.col())):
+                    expected = self.validator.is_valid_swap(board, cell, neighbor)
+                    self.assertEqual(incremental.is_valid_swap(board, cell, neighbor), expected)
+                    self.assertEqual(incremental.is_valid_swap(compact, cell, neighbor), expected)
+    
+    def test_prepare_reads_board_lazily(self):
+        """Тест: подготовленная проверка читает только строки рядом с проверяемыми свопами."""
+        read_rows = set()
+        
+        class CountingBoard(MutableBoard):
+            def tile_at(self, cell):
+                read_rows.add(cell.row())
+                return super().tile_at(cell)
+        
+        board = CountingBoard(8, 8)
+        for cell in board.enumerate_cells():
+            board.set_tile(cell, Tile(TileKind.all()[(cell.row() + cell.col()) % 5]))
+        # Своп переносит D в (0, 2) к двум D слева
+        board.set_tile(Cell(0, 0), Tile(TileKind.D))
+        board.set_tile(Cell(0, 1), Tile(TileKind.D))
+        
+        for validator in (SwapValidator(), SwapValidator(incremental=True)):
+            read_rows.clear()
+            check = validator.prepare(board)
+            
+            self.assertTrue(check(Cell(0, 2), Cell(1, 2)))
+            self.assertEqual(read_rows, {0, 1, 2, 3})
 
 
 class TestMatchFinder(unittest.TestCase):
@@ -99,6 +211,125 @@ class TestMatchFinder(unittest.TestCase):
         self.assertEqual(len(matches), 0)
 
 
+class TestRunLengthMatchFinder(unittest.TestCase):
+    """Тесты для RunLengthMatchFinder."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.finder = RunLengthMatchFinder()
+        self.reference = MatchFinder()
+    
+    def test_line_matches(self):
+        """Тест горизонтальных и вертикальных серий."""
+        board = MutableBoard()
+        for col in range(2, 6):
+            board.set_tile(Cell(1, col), Tile(TileKind.A))
+        for row in range(4, 7):
+            board.set_tile(Cell(row, 0), Tile(TileKind.B))
+        
+        matches = self.finder.find_matches(board)
+        
+        self.assertEqual(matches, {
+            frozenset(Cell(1, col) for col in range(2, 6)),
+            frozenset(Cell(row, 0) for row in range(4, 7)),
+        })
+    
+    def test_l_shape_matches_reference(self):
+        """Тест разрешения L-образного пересечения как в MatchFinder."""
+        board = MutableBoard()
+        for col in range(3, 7):
+            board.set_tile(Cell(5, col), Tile(TileKind.C))
+        for row in range(3, 5):
+            board.set_tile(Cell(row, 3), Tile(TileKind.C))
+        
+        self.assertEqual(self.finder.find_matches(board), self.reference.find_matches(board))
+        self.assertEqual(self.finder.find_matches(board),
+                         {frozenset(Cell(5, col) for col in range(3, 7))})
+    
+    def test_differential_random_boards(self):
+        """Дифференциальный тест против MatchFinder на случайных досках."""
+        rng = random.Random(2024)
+        for iteration in range(3000):
+            board = make_random_board(rng, kinds_count=rng.choice([2, 3, 5]),
+                                      empty_share=rng.choice([0.0, 0.0, 0.1]))
+            expected = self.reference.find_matches(board)
+            
+            self.assertEqual(self.finder.find_matches(board), expected)
+            self.assertEqual(self.finder.find_matches(CompactBoard.from_board(board)), expected)
+            self.assertEqual(self.finder.find_horizontal_matches(board),
+                             self.reference.find_horizontal_matches(board))
+            self.assertEqual(self.finder.find_vertical_matches(board),
+                             self.reference.find_vertical_matches(board))
+    
+    def test_swappable_through_container(self):
+        """Тест подмены поисковика через ServiceContainer."""
+        results = []
+        for finder in (MatchFinder(), RunLengthMatchFinder()):
+            services = create_services(finder)
+            board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+            state = GameStateBuilder().with_board(board).build()
+            controller = GameController(services)
+            
+            move = MoveGenerator().generate_all_moves(state.board)[0]
+            controller.perform_move(state, *move)
+            results.append((state.get_score(), CompactBoard.codes_of(state.board)))
+        
+        self.assertEqual(results[0], results[1])
+
+
+class TestBitboardMatchFinder(unittest.TestCase):
+    """Тесты для BitboardMatchFinder."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.finder = BitboardMatchFinder()
+        self.reference = MatchFinder()
+    
+    def test_line_matches_and_mask(self):
+        """Тест серий в строке у правого края и в столбце."""
+        board = BitBoard()
+        for col in range(5, 8):
+            board.set_tile(Cell(1, col), Tile(TileKind.A))
+        board.set_tile(Cell(2, 0), Tile(TileKind.A))
+        for row in range(4, 8):
+            board.set_tile(Cell(row, 0), Tile(TileKind.B))
+        
+        self.assertEqual(self.finder.find_matches(board), {
+            frozenset(Cell(1, col) for col in range(5, 8)),
+            frozenset(Cell(row, 0) for row in range(4, 8)),
+        })
+        self.assertEqual(bin(self.finder.find_match_mask(board)).count('1'), 7)
+    
+    def test_differential_random_boards(self):
+        """Дифференциальный тест против MatchFinder на случайных досках."""
+        rng = random.Random(2025)
+        for iteration in range(2000):
+            board = make_random_board(rng, kinds_count=rng.choice([2, 3, 5]),
+                                      empty_share=rng.choice([0.0, 0.0, 0.1]))
+            bit_board = BitBoard.from_board(board)
+            
+            self.assertEqual(self.finder.find_matches(bit_board), self.reference.find_matches(board))
+            self.assertEqual(self.finder.find_horizontal_matches(board),
+                             self.reference.find_horizontal_matches(board))
+            self.assertEqual(self.finder.find_vertical_matches(bit_board),
+                             self.reference.find_vertical_matches(board))
+    
+    def test_bit_board_through_controller(self):
+        """Тест хода на битовой доске с теми же очками, что и на обычной."""
+        results = []
+        for finder, convert in ((MatchFinder(), lambda board: board),
+                                (BitboardMatchFinder(), BitBoard.from_board)):
+            services = create_services(finder)
+            board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+            state = GameStateBuilder().with_board(convert(board)).build()
+            
+            move = MoveGenerator().generate_all_moves(state.board)[0]
+            GameController(services).perform_move(state, *move)
+            results.append((state.get_score(), CompactBoard.codes_of(state.board)))
+        
+        self.assertEqual(results[0], results[1])
+
+
 class TestMoveGenerator(unittest.TestCase):
     """Тесты для MoveGenerator."""
     
@@ -130,6 +361,175 @@ class TestMoveGenerator(unittest.TestCase):
         # В реальной игре это может быть True или False в зависимости от конфигурации
         # Здесь мы просто проверяем, что метод работает без ошибок
         self.assertIsInstance(has_moves, bool)
+    
+    def test_find_first_move(self):
+        """Тест поиска первого хода с ранним выходом."""
+        board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+        
+        self.assertEqual(self.generator.find_first_move(board),
+                         self.generator.generate_all_moves(board)[0])
+        self.assertIsNone(self.generator.find_first_move(self.board))
+    
+    def test_availability_cached_per_version(self):
+        """Тест кеширования наличия ходов для неизменённой доски."""
+        calls = []
+        generator = MoveGenerator()
+        original = generator.find_first_move
+        generator.find_first_move = lambda board: calls.append(board) or original(board)
+        board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+        
+        self.assertTrue(generator.has_available_moves(board))
+        self.assertTrue(generator.has_available_moves(board))
+        self.assertEqual(len(calls), 1)
+        
+        for cell in board.enumerate_cells():
+            board.set_tile(cell, None)
+        self.assertFalse(generator.has_available_moves(board))
+        self.assertEqual(len(calls), 2)
+    
+    def test_matches_swap_validator_on_any_board(self):
+        """Тест совпадения с полной проверкой свопов на досках с сериями и пустотами."""
+        validator = SwapValidator()
+        random_provider = RandomProviderDefault(9)
+        for width, height in ((7, 3), (2, 9), (6, 6)):
+            board = MutableBoard(width, height)
+            board.fill_empty(random_provider)
+            board.set_tile(Cell(1, 1), None)
+            
+            expected = []
+            for cell in board.enumerate_cells():
+                for neighbor in (Cell(cell.row(), cell.col() + 1), Cell(cell.row() + 1, cell.col())):
+                    if board.is_inside(neighbor) and validator.is_valid_swap(board, cell, neighbor):
+                        expected.append((cell, neighbor))
+            
+            self.assertEqual(self.generator.generate_all_moves(board), expected)
+
+
+
+class TestPatternMoveGenerator(unittest.TestCase):
+    """Тесты для PatternMoveGenerator."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.generator = PatternMoveGenerator()
+        self.reference = MoveGenerator()
+    
+    def test_patterns(self):
+        """Тест шаблонов XX_X и L-образного."""
+        board = MutableBoard()
+        board.set_tile(Cell(2, 0), Tile(TileKind.A))
+        board.set_tile(Cell(2, 1), Tile(TileKind.A))
+        board.set_tile(Cell(2, 3), Tile(TileKind.A))
+        board.set_tile(Cell(6, 6), Tile(TileKind.B))
+        board.set_tile(Cell(7, 4), Tile(TileKind.B))
+        board.set_tile(Cell(7, 5), Tile(TileKind.B))
+        
+        moves = self.generator.generate_all_moves(board)
+        
+        self.assertEqual(moves, [(Cell(2, 2), Cell(2, 3)), (Cell(6, 6), Cell(7, 6))])
+    
+    def test_differential_random_boards(self):
+        """Дифференциальный тест против MoveGenerator, включая доски с сериями."""
+        rng = random.Random(99)
+        for iteration in range(25):
+            board = make_random_board(rng, kinds_count=rng.choice([3, 4, 5]),
+                                      empty_share=rng.choice([0.0, 0.1]))
+            expected = self.reference.generate_all_moves(board)
+            
+            self.assertEqual(self.generator.generate_all_moves(board), expected)
+            self.assertEqual(self.generator.generate_all_moves(CompactBoard.from_board(board)), expected)
+    
+    def test_has_available_moves(self):
+        """Тест проверки наличия ходов."""
+        board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+        
+        self.assertEqual(self.generator.has_available_moves(board),
+                         self.reference.has_available_moves(board))
+
+
+class TestBitboardMoveGenerator(unittest.TestCase):
+    """Тесты для BitboardMoveGenerator."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.generator = BitboardMoveGenerator()
+        self.reference = MoveGenerator()
+    
+    def test_patterns(self):
+        """Тест шаблонов XX_X и L-образного."""
+        board = BitBoard()
+        board.set_tile(Cell(2, 0), Tile(TileKind.A))
+        board.set_tile(Cell(2, 1), Tile(TileKind.A))
+        board.set_tile(Cell(2, 3), Tile(TileKind.A))
+        board.set_tile(Cell(6, 6), Tile(TileKind.B))
+        board.set_tile(Cell(7, 4), Tile(TileKind.B))
+        board.set_tile(Cell(7, 5), Tile(TileKind.B))
+        
+        moves = self.generator.generate_all_moves(board)
+        
+        self.assertEqual(moves, [(Cell(2, 2), Cell(2, 3)), (Cell(6, 6), Cell(7, 6))])
+    
+    def test_differential_random_boards(self):
+        """Дифференциальный тест против MoveGenerator, включая доски с сериями."""
+        rng = random.Random(77)
+        for iteration in range(25):
+            board = make_random_board(rng, kinds_count=rng.choice([3, 4, 5]),
+                                      empty_share=rng.choice([0.0, 0.1]))
+            expected = self.reference.generate_all_moves(board)
+            
+            self.assertEqual(self.generator.generate_all_moves(BitBoard.from_board(board)), expected)
+            self.assertEqual(self.generator.generate_all_moves(board), expected)
+
+
+class TestTiledEngines(unittest.TestCase):
+    """Тесты для TiledMatchFinder и TiledMoveGenerator."""
+    
+    def assert_matches_serial(self, executor: StripeExecutor, seed: int, iterations: int):
+        """Сверить движки по полосам с MatchFinder и MoveGenerator.
+        
+        Args:
+            executor: Исполнитель задач по полосам
+            seed: Seed генератора досок
+            iterations: Количество досок
+        """
+        finder = TiledMatchFinder(executor)
+        generator = TiledMoveGenerator(executor)
+        rng = random.Random(seed)
+        for iteration in range(iterations):
+            board = make_random_board(rng, kinds_count=rng.choice([3, 4, 5]),
+                                      empty_share=rng.choice([0.0, 0.1]),
+                                      width=rng.randint(3, 17), height=rng.randint(3, 17))
+            
+            self.assertEqual(finder.find_matches(board), MatchFinder().find_matches(board))
+            self.assertEqual(generator.generate_all_moves(board), MoveGenerator().generate_all_moves(board))
+    
+    def test_stripes(self):
+        """Тест разбиения на полосы."""
+        executor = StripeExecutor(workers=1, stripe_size=4)
+        
+        self.assertEqual(executor.stripes(10), [(0, 4), (4, 8), (8, 10)])
+        self.assertEqual(executor.stripes(4), [(0, 4)])
+        with self.assertRaises(ValueError):
+            StripeExecutor(stripe_size=0)
+    
+    def test_boundary_move(self):
+        """Тест хода, шаблон которого пересекает границу полос."""
+        board = MutableBoard(5, 9)
+        board.set_tile(Cell(1, 2), Tile(TileKind.A))
+        board.set_tile(Cell(3, 2), Tile(TileKind.A))
+        board.set_tile(Cell(4, 2), Tile(TileKind.A))
+        generator = TiledMoveGenerator(StripeExecutor(workers=1, stripe_size=2))
+        
+        self.assertEqual(generator.generate_all_moves(board), [(Cell(1, 2), Cell(2, 2))])
+    
+    def test_differential_serial(self):
+        """Дифференциальный тест без пула процессов."""
+        self.assert_matches_serial(StripeExecutor(workers=1, stripe_size=3), seed=22, iterations=30)
+    
+    def test_differential_process_pool(self):
+        """Дифференциальный тест в пуле из двух процессов."""
+        with StripeExecutor(workers=2, stripe_size=4) as executor:
+            self.assert_matches_serial(executor, seed=23, iterations=10)
 
 
 if __name__ == '__main__':
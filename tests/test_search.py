@@ -0,0 +1,186 @@
+"""Тесты для поиска ходов и таблиц транспозиций."""
+
+import itertools
+import unittest
+from unittest import mock
+
+from board.cell import Cell
+from board.board_factory import BoardFactory
+from board.mutable_board import MutableBoard
+from board.tile import Tile
+from board.tile_kind import TileKind
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
+from rules.run_length_match_finder import RunLengthMatchFinder
+from rules.pattern_move_generator import PatternMoveGenerator
+from search.transposition_table import LruTranspositionTable, DepthPreferredTranspositionTable
+from search.caching_match_finder import CachingMatchFinder
+from search.caching_move_generator import CachingMoveGenerator
+from search.move_search import MoveSearch
+from main import create_game_services
+
+
+class TestTranspositionTable(unittest.TestCase):
+    """Тесты для таблиц транспозиций."""
+    
+    def test_lru_eviction(self):
+        """Тест вытеснения давно не использованной записи."""
+        table = LruTranspositionTable(capacity=2)
+        table.put(1, 'a')
+        table.put(2, 'b')
+        table.get(1)
+        table.put(3, 'c')
+        
+        self.assertEqual(table.get(1), 'a')
+        self.assertIsNone(table.get(2))
+        self.assertEqual(table.get(3), 'c')
+        self.assertEqual(table.size(), 2)
+        self.assertEqual((table.hits(), table.misses()), (3, 1))
+    
+    def test_depth_preferred_replacement(self):
+        """Тест сохранения более глубокой записи при коллизии слота."""
+        table = DepthPreferredTranspositionTable(capacity=4)
+        table.put(1, 'deep', depth=3)
+        table.put(5, 'shallow', depth=1)
+        
+        self.assertEqual(table.get(1), 'deep')
+        self.assertIsNone(table.get(5))
+        
+        table.put(5, 'deeper', depth=4)
+        self.assertEqual(table.get(5), 'deeper')
+        self.assertIsNone(table.get(5, min_depth=5))
+        self.assertEqual(table.size(), 1)
+        
+        table.put(5, 'same key, shallower', depth=2)
+        self.assertEqual(table.get(5), 'deeper')
+    
+    def test_invalid_capacity(self):
+        """Тест отказа при неположительной ёмкости."""
+        with self.assertRaises(ValueError):
+            LruTranspositionTable(capacity=0)
+
+
+class TestCachingServices(unittest.TestCase):
+    """Тесты для поисковика и генератора с запоминанием."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+    
+    def test_caching_move_generator(self):
+        """Тест повторного использования списка ходов той же позиции."""
+        generator = CachingMoveGenerator()
+        expected = MoveGenerator().generate_all_moves(self.board)
+        
+        self.assertEqual(generator.generate_all_moves(self.board), expected)
+        self.assertEqual(generator.generate_all_moves(self.board.clone()), expected)
+        self.assertEqual(generator.find_first_move(self.board), expected[0])
+        self.assertEqual(generator.table().misses(), 1)
+    
+    def test_caching_match_finder(self):
+        """Тест запоминания совпадений и пересчёта после изменения доски."""
+        finder = CachingMatchFinder()
+        move = MoveGenerator().find_first_move(self.board)
+        
+        self.assertEqual(len(finder.find_matches(self.board)), 0)
+        self.board.swap(*move)
+        expected = MatchFinder().find_matches(self.board)
+        
+        self.assertEqual(finder.find_matches(self.board), expected)
+        self.assertEqual(finder.find_matches(self.board), expected)
+        self.assertEqual(finder.table().hits(), 1)
+        
+        self.board.set_tile(Cell(0, 0), None)
+        self.assertEqual(finder.table().size(), 2)
+        finder.find_matches(self.board)
+        self.assertEqual(finder.table().size(), 3)
+    
+    def test_cache_separates_board_sizes(self):
+        """Тест: доски разных размеров с одинаковыми фишками по индексам не смешиваются."""
+        row = MutableBoard(3, 1)
+        column = MutableBoard(1, 3)
+        for index in range(3):
+            row.set_tile(Cell(0, index), Tile.of(TileKind.A))
+            column.set_tile(Cell(index, 0), Tile.of(TileKind.A))
+        finder = CachingMatchFinder()
+        
+        self.assertEqual(row.zobrist_hash(), column.zobrist_hash())
+        self.assertEqual(finder.find_matches(row), MatchFinder().find_matches(row))
+        self.assertEqual(finder.find_matches(column), MatchFinder().find_matches(column))
+
+
+class TestMoveSearch(unittest.TestCase):
+    """Тесты для MoveSearch."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.services = create_game_services(seed=4)
+        self.services.register_match_finder(RunLengthMatchFinder())
+        self.services.register_move_generator(PatternMoveGenerator())
+        self.board = BoardFactory.create_board_without_matches(RandomProviderDefault(5), MatchFinder())
+    
+    def test_ranks_all_moves(self):
+        """Тест оценки всех ходов на глубине 1."""
+        result = MoveSearch(self.services, samples=2).search(self.board, time_budget=30, max_depth=1)
+        moves = MoveGenerator().generate_all_moves(self.board)
+        
+        self.assertEqual(result.depth, 1)
+        self.assertFalse(result.timed_out)
+        self.assertEqual(sorted(map(str, (move for move, _ in result.ranked_moves))),
+                         sorted(map(str, moves)))
+        self.assertEqual(result.best_move, result.ranked_moves[0][0])
+        self.assertEqual(result.expected_score, max(value for _, value in result.ranked_moves))
+    
+    def test_zero_budget_orders_by_immediate_score(self):
+        """Тест ответа по немедленным очкам при исчерпанном бюджете."""
+        result = MoveSearch(self.services).search(self.board, time_budget=0)
+        
+        self.assertEqual(result.depth, 0)
+        self.assertTrue(result.timed_out)
+        self.assertIsNotNone(result.best_move)
+        values = [value for _, value in result.ranked_moves]
+        self.assertEqual(values, sorted(values, reverse=True))
+    
+    def test_budget_checked_while_ordering_moves(self):
+        """Тест остановки при истечении бюджета во время построения позиций."""
+        # Часы: старт поиска и две проверки в срок, дальше бюджет исчерпан
+        ticks = itertools.chain([0.0, 0.0, 0.0], itertools.repeat(10.0))
+        with mock.patch('search.move_search.time.perf_counter', side_effect=lambda: next(ticks)):
+            result = MoveSearch(self.services).search(self.board, time_budget=1)
+        
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.depth, 0)
+        self.assertEqual(len(result.ranked_moves), 2)
+        self.assertEqual(result.best_move, result.ranked_moves[0][0])
+    
+    def test_budget_checked_in_samples(self):
+        """Тест остановки глубины, бюджет которой истёк внутри выборок."""
+        # Бюджета хватает на упорядочивание ходов и начало первой выборки
+        moves = len(PatternMoveGenerator().generate_all_moves(self.board))
+        ticks = itertools.chain(itertools.repeat(0.0, moves + 4), itertools.repeat(10.0))
+        with mock.patch('search.move_search.time.perf_counter', side_effect=lambda: next(ticks)):
+            result = MoveSearch(self.services).search(self.board, time_budget=1)
+        
+        self.assertTrue(result.timed_out)
+        self.assertEqual(result.depth, 0)
+        self.assertEqual(result.nodes, 1)
+    
+    def test_reproducible_and_isolated(self):
+        """Тест воспроизводимости оценок и неизменности доски и сервисов."""
+        before = self.board.zobrist_hash()
+        first = MoveSearch(self.services, samples=2, seed=9).search(self.board, 30, max_depth=1)
+        second = MoveSearch(self.services, samples=2, seed=9).search(self.board, 30, max_depth=1)
+        
+        self.assertEqual(first.ranked_moves, second.ranked_moves)
+        self.assertEqual(self.board.zobrist_hash(), before)
+        self.assertEqual(self.services.get_random_provider().next_tile_kind(),
+                         RandomProviderDefault(4).next_tile_kind())
+    
+    def test_no_moves(self):
+        """Тест пустой доски без ходов."""
+        self.assertIsNone(MoveSearch(self.services).best_move(MutableBoard(), time_budget=1))
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,105 @@
+"""Тесты для игрового сервера."""
+
+import asyncio
+import json
+import unittest
+
+from board.cell import Cell
+from console_interface.console_io import parse_move
+from server.game_server import GameServer
+from server.game_session import GameSession
+from server.latency_stats import LatencyStats
+from server.load_client import LoadClient
+
+
+class TestLatencyStats(unittest.TestCase):
+    """Тесты для LatencyStats."""
+    
+    def test_percentiles_within_bucket_precision(self):
+        """Тест перцентилей с погрешностью не больше корзины."""
+        stats = LatencyStats()
+        for micros in range(1, 10001):
+            stats.record(micros)
+        
+        self.assertEqual(stats.count(), 10000)
+        self.assertEqual(stats.max(), 10000)
+        self.assertAlmostEqual(stats.mean(), 5000.5)
+        for percent in (50, 90, 99):
+            expected = 100 * percent
+            self.assertLessEqual(stats.percentile(percent), expected)
+            self.assertGreater(stats.percentile(percent), expected * 15 / 16)
+    
+    def test_merge(self):
+        """Тест объединения статистик."""
+        first, second = LatencyStats(), LatencyStats()
+        first.record(10)
+        second.record(100000)
+        first.merge(second)
+        self.assertEqual(first.count(), 2)
+        self.assertEqual(first.max(), 100000)
+        self.assertEqual(first.percentile(50), 10)
+
+
+class TestGameSession(unittest.TestCase):
+    """Тесты для протокола GameSession."""
+    
+    def test_parse_move(self):
+        """Тест общего с ConsoleIO разбора хода."""
+        self.assertEqual(parse_move("0 1 0 2"), (Cell(0, 1), Cell(0, 2)))
+        with self.assertRaises(ValueError):
+            parse_move("0 1 2 2")
+        with self.assertRaises(ValueError):
+            parse_move("0 8 0 9")
+        self.assertEqual(parse_move("0 8 0 9", width=10, height=2), (Cell(0, 8), Cell(0, 9)))
+    
+    def test_game_flow(self):
+        """Тест начала партии, подсказки и хода."""
+        session = GameSession()
+        self.assertTrue(session.handle("BOARD").startswith("ERR"))
+        
+        status, score, board = session.handle("NEW 5").split()
+        self.assertEqual((status, score), ("OK", "0"))
+        self.assertEqual(len(board.split('/')), 8)
+        
+        hint = session.handle("HINT")
+        self.assertTrue(hint.startswith("OK"))
+        reply = session.handle("MOVE" + hint[2:])
+        self.assertRegex(reply, r'^(OK|OVER) \d+ ')
+        self.assertGreater(session.state().get_score(), 0)
+        
+        self.assertTrue(session.handle("MOVE 0 0 5 5").startswith("ERR"))
+        self.assertTrue(session.handle("JUMP").startswith("ERR"))
+        self.assertEqual(session.handle("QUIT"), "OK")
+        self.assertTrue(session.is_closed())
+
+
+class TestGameServer(unittest.TestCase):
+    """Тесты для GameServer."""
+    
+    def test_concurrent_sessions(self):
+        """Тест одновременных игроков через TCP и сбора задержек."""
+        async def scenario():
+            server = GameServer(port=0)
+            await server.start()
+            try:
+                client = LoadClient(*server.address())
+                stats = await client.run(players=20, moves=3, seed=0)
+                
+                reader, writer = await asyncio.open_connection(*server.address())
+                writer.write(b"STATS\n")
+                reply = (await reader.readline()).decode('utf-8')
+                writer.close()
+                return client, stats, server, reply
+            finally:
+                await server.close()
+        
+        client, stats, server, reply = asyncio.run(scenario())
+        self.assertEqual(client.errors(), 0)
+        self.assertEqual(stats.count(), 20 * (2 + 2 * 3))
+        self.assertEqual(server.stats()['NEW'].count(), 20)
+        self.assertEqual(server.stats()['MOVE'].count(), 60)
+        self.assertEqual(json.loads(reply[3:])['HINT']['count'], 60)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,132 @@
+"""Тесты для массового моделирования игр."""
+
+import unittest
+
+from board.cell import Cell
+from board.board_factory import BoardFactory
+from board.compact_board import CompactBoard
+from random_generator.random_provider_default import RandomProviderDefault
+from rules.swap_validator import SwapValidator
+from rules.match_finder import MatchFinder
+from rules.move_generator import MoveGenerator
+from rules.pattern_move_generator import PatternMoveGenerator
+from mechanics.match_resolver import MatchResolver
+from mechanics.gravity_engine import GravityEngine
+from scoring.score_manager import ScoreManager
+from scoring.combo_tracker import ComboTracker
+from control.service_container import ServiceContainer
+from control.game_controller import GameController
+from control.game_state_builder import GameStateBuilder
+from simulation.batch_engine import BatchEngine, np
+from simulation.policies import POLICIES
+from simulation.self_play import SelfPlayRunner, SimulationStats, play_single_game
+
+
+def create_services(seed: int) -> ServiceContainer:
+    """Создать контейнер сервисов с заданным seed поставщика.
+    
+    Args:
+        seed: Начальное значение поставщика случайностей
+        
+    Returns:
+        ServiceContainer: Контейнер с зарегистрированными сервисами
+    """
+    container = ServiceContainer()
+    container.register_swap_validator(SwapValidator())
+    container.register_match_finder(MatchFinder())
+    container.register_match_resolver(MatchResolver())
+    container.register_gravity_engine(GravityEngine())
+    container.register_score_manager(ScoreManager())
+    container.register_combo_tracker(ComboTracker())
+    container.register_random_provider(RandomProviderDefault(seed))
+    container.register_move_generator(MoveGenerator())
+    return container
+
+
+@unittest.skipUnless(np is not None, "numpy не установлен")
+class TestBatchEngine(unittest.TestCase):
+    """Тесты для BatchEngine."""
+    
+    def setUp(self):
+        """Настройка тестов."""
+        self.games = 24
+        self.boards = [
+            BoardFactory.create_board_without_matches(RandomProviderDefault(seed), MatchFinder())
+            for seed in range(self.games)
+        ]
+    
+    def test_matches_game_controller(self):
+        """Тест совпадения с GameController для одних и тех же seed."""
+        engine = BatchEngine([board.clone() for board in self.boards],
+                             [RandomProviderDefault(1000 + seed) for seed in range(self.games)])
+        states = [GameStateBuilder().with_board(board.clone()).build() for board in self.boards]
+        services = [create_services(1000 + seed) for seed in range(self.games)]
+        controllers = [GameController(container) for container in services]
+        generator = PatternMoveGenerator()
+        
+        for turn in range(6):
+            moves = []
+            for state in states:
+                move = generator.find_first_move(state.board)
+                if move is None or turn == 3:
+                    # Заведомо невалидный ход тоже должен совпадать
+                    moves.append((0, 0, 0, 1))
+                else:
+                    moves.append((move[0].row(), move[0].col(), move[1].row(), move[1].col()))
+            
+            result = engine.perform_moves(moves)
+            
+            for index, state in enumerate(states):
+                a, b = Cell(*moves[index][:2]), Cell(*moves[index][2:])
+                score_before = state.get_score()
+                success = controllers[index].perform_move(state, a, b)
+                cascades = services[index].get_combo_tracker().current_index() if success else 0
+                
+                self.assertEqual(bool(result.valid[index]), success)
+                self.assertEqual(int(result.points[index]), state.get_score() - score_before)
+                self.assertEqual(int(result.cascades[index]), cascades)
+                self.assertEqual(engine.board_at(index).codes(), CompactBoard.codes_of(state.board))
+        
+        self.assertEqual(list(engine.scores()), [state.get_score() for state in states])
+
+
+
+class TestSelfPlay(unittest.TestCase):
+    """Тесты для автоматической игры."""
+    
+    def test_policies_choose_legal_moves(self):
+        """Тест выбора валидных ходов всеми политиками."""
+        services = create_services(4)
+        board = BoardFactory.create_board_without_matches(RandomProviderDefault(4), MatchFinder())
+        state = GameStateBuilder().with_board(board).build()
+        legal = services.get_move_generator().generate_all_moves(board)
+        
+        for name, policy in POLICIES.items():
+            self.assertIn(policy(1).choose_move(state, services), legal, name)
+    
+    def test_game_is_deterministic(self):
+        """Тест воспроизводимости партии по seed."""
+        first = play_single_game(7, 'random', 10)
+        second = play_single_game(7, 'random', 10)
+        
+        self.assertEqual((first.score, first.moves, first.cascades),
+                         (second.score, second.moves, second.cascades))
+        self.assertEqual(first.moves, 10)
+    
+    def test_results_do_not_depend_on_workers(self):
+        """Тест совпадения результатов в одном процессе и в пуле."""
+        serial = list(SelfPlayRunner('first', workers=1, max_moves=5).run(3, base_seed=10))
+        parallel = list(SelfPlayRunner('first', workers=2, max_moves=5).run(3, base_seed=10))
+        
+        self.assertEqual([(r.seed, r.score, r.moves) for r in serial],
+                         [(r.seed, r.score, r.moves) for r in parallel])
+        
+        stats = SimulationStats()
+        for result in serial:
+            stats.add(result)
+        self.assertEqual(stats.summary()['games'], 3)
+        self.assertEqual(stats.summary()['mean_moves'], 5)
+
+
+if __name__ == '__main__':
+    unittest.main()